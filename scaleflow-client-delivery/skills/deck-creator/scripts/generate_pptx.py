@@ -7,6 +7,35 @@ Follows the same pattern as shared/generate_branded_docx.py but targets PowerPoi
 
 Usage:
     python3 generate_pptx.py --input data.json --output output.pptx
+    python3 generate_pptx.py --input data.json --output output.pptx --image-dpi 220 --jpeg-quality 90
+    python3 generate_pptx.py --input data.json --output output.pptx --image-dpi 0   # embed originals
+    python3 generate_pptx.py --batch manifest.json [--processes 4]
+
+Images are resampled to the pixel size of the frame they fill at --image-dpi
+(default 150) and re-encoded (JPEG, or PNG when they carry transparency)
+before embedding; EXIF-rotated photos are turned upright and ICC profiles
+are kept. Derived files are cached by content hash under
+$XDG_CACHE_HOME/scaleflow/pptx-images, so rebuilding a deck reuses them;
+after each run the least recently used copies are deleted once the cache
+passes --image-cache-max-mb (default 1024, 0 keeps everything).
+Before any slide is built, every referenced image is probed and resampled in
+a thread pool (--jobs, default: one per CPU), so slide construction only
+picks up ready results.
+
+--batch builds many decks in one process, reusing the loaded template bytes
+and probed/resampled images across decks, and prints per-deck timings. The
+manifest lists deck inputs and outputs (relative to the manifest; output
+defaults to the input name with .pptx):
+    {"decks": [{"input": "acme.json", "output": "out/acme.pptx"},
+               {"input": "globex.json"}]}
+--processes N spreads decks over N worker processes.
+
+Backgrounds, accent bars, footers and the logo are identical on every slide
+of a layout, so each brand is compiled once into a template whose slide
+layouts carry them; slides then only add their own content. Compiled
+templates are cached by brand config hash under
+$XDG_CACHE_HOME/scaleflow/pptx-templates (--template-cache).
+--no-brand-template draws the decorations on every slide instead.
 
 Supported slide layouts:
     - title           Big title + subtitle, brand colors, logo, dark background
@@ -24,13 +53,41 @@ import json
 import sys
 import os
 import argparse
-
+import hashlib
+import io
+import math
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pptx
 from pptx import Presentation
 from pptx.util import Inches, Pt, Emu
 from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.enum.shapes import MSO_SHAPE
-from PIL import Image
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.oxml.ns import qn
+from PIL import Image, ImageOps
+
+# Image parts are shared between pictures through python-pptx internals
+# (tested with 1.0.x, pinned in requirements.txt). If a later release moves
+# them, pictures go through the public shapes.add_picture() instead.
+try:
+    from pptx.parts.image import Image as PptxImage, ImagePart
+    from pptx.shapes.shapetree import SlideShapes
+    SHARED_IMAGE_PARTS = all(
+        hasattr(SlideShapes, name)
+        for name in ("_add_pic_from_image_part", "_recalculate_extents", "_shape_factory")
+    ) and hasattr(ImagePart, "new") and hasattr(PptxImage, "from_blob")
+except ImportError:
+    SHARED_IMAGE_PARTS = False
+
+try:
+    from PIL import ImageCms
+except ImportError:  # Pillow built without LittleCMS: CMYK/grey profiles are dropped
+    ImageCms = None
 
 
 # ============================================================
@@ -111,6 +168,193 @@ SLIDE_WIDTH = Inches(13.333)
 SLIDE_HEIGHT = Inches(7.5)
 
 
+# ============================================================
+# IMAGE EMBEDDING — resample to frame size, cache by content hash
+# ============================================================
+
+DEFAULT_IMAGE_DPI = 150
+DEFAULT_JPEG_QUALITY = 85
+IMAGE_CACHE_VERSION = 2
+DEFAULT_IMAGE_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "scaleflow", "pptx-images",
+)
+# Least recently used copies are deleted once the image cache grows past this
+DEFAULT_IMAGE_CACHE_MAX_MB = 1024
+
+# EXIF orientations that turn the stored image a quarter turn
+EXIF_ORIENTATION = 0x0112
+QUARTER_TURNS = {5, 6, 7, 8}
+
+# Resampled image bytes an AssetCache keeps before evicting the least recently used
+DEFAULT_ASSET_CACHE_BYTES = 256 * 1024 * 1024
+
+# Formats PowerPoint renders natively; anything else is always re-encoded
+EMBEDDABLE_FORMATS = {"JPEG", "PNG", "GIF", "BMP"}
+EMU_PER_INCH = 914400
+
+# Boxes images are fitted into: the logo per layout, and the image slide frame
+LOGO_BOXES = {
+    "title": (Inches(1.8), Inches(0.9)),
+    "closing": (Inches(2.2), Inches(1.0)),
+}
+IMAGE_BOX = (Inches(11.0), Inches(5.5))
+
+
+# ============================================================
+# TEMPLATE
+# ============================================================
+
+DEFAULT_TEMPLATE_PATH = os.path.join(os.path.dirname(pptx.__file__), "templates", "default.pptx")
+
+TEMPLATE_CACHE_VERSION = 1
+DEFAULT_TEMPLATE_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "scaleflow", "pptx-templates",
+)
+
+# Deck layouts that get their own slide layout in a compiled brand template
+BRAND_LAYOUTS = ("title", "section_header", "content", "image", "comparison", "two_column", "closing")
+BRAND_LAYOUT_PREFIX = "ScaleFlow "
+
+# Attributes that point at a relationship of the containing part
+REL_ATTRS = (qn("r:embed"), qn("r:link"), qn("r:id"))
+
+_template_blobs = {}
+
+
+def template_blob(path=DEFAULT_TEMPLATE_PATH):
+    """Bytes of a .pptx template, read from disk once per process."""
+    if path not in _template_blobs:
+        with open(path, "rb") as f:
+            _template_blobs[path] = f.read()
+    return _template_blobs[path]
+
+
+def brand_template_key(brand_config, logo_path, image_dpi, jpeg_quality):
+    """Cache key for a compiled brand template: brand config, logo file and image settings."""
+    payload = json.dumps(
+        [TEMPLATE_CACHE_VERSION, pptx.__version__, brand_config, image_dpi, jpeg_quality],
+        sort_keys=True, default=str,
+    )
+    digest = hashlib.sha256(payload.encode("utf-8"))
+    if logo_path:
+        st = os.stat(logo_path)
+        digest.update(f"{os.path.abspath(logo_path)}:{st.st_size}:{st.st_mtime_ns}".encode("utf-8"))
+    return digest.hexdigest()[:32]
+
+
+def fit_within(aspect, max_width, max_height):
+    """Largest (width, height) with the given aspect ratio inside the max bounds."""
+    width = max_width
+    height = int(width / aspect)
+    if height > max_height:
+        height = max_height
+        width = int(height * aspect)
+    return width, height
+
+
+_srgb_profile = None
+
+
+def convert_color(img, mode, icc_profile):
+    """Convert an image to "RGB"/"RGBA"; returns (image, ICC profile to embed or None).
+
+    RGB sources keep their profile, so wide-gamut images do not shift. CMYK
+    and greyscale sources with a profile are color-managed into sRGB, which
+    needs no embedded profile; without LittleCMS they are converted as is.
+    """
+    global _srgb_profile
+    if not icc_profile or img.mode in ("RGB", "RGBA", "RGBX", "P"):
+        return img.convert(mode), icc_profile
+    if ImageCms is not None:
+        try:
+            if _srgb_profile is None:
+                _srgb_profile = ImageCms.createProfile("sRGB")
+            source = ImageCms.ImageCmsProfile(io.BytesIO(icc_profile))
+            return ImageCms.profileToProfile(img, source, _srgb_profile, outputMode=mode), None
+        except (ImageCms.PyCMSError, OSError, ValueError):
+            pass
+    return img.convert(mode), None
+
+
+def prune_image_cache(cache_dir=DEFAULT_IMAGE_CACHE_DIR, max_mb=DEFAULT_IMAGE_CACHE_MAX_MB):
+    """Delete the least recently used resampled copies until cache_dir fits in max_mb.
+
+    Cache hits refresh a copy's modification time, so recently used images
+    survive. Returns the number of files removed.
+    """
+    entries = []
+    total = 0
+    try:
+        shards = os.scandir(cache_dir)
+    except OSError:
+        return 0
+    with shards:
+        for shard in shards:
+            if not shard.is_dir(follow_symlinks=False):
+                continue
+            with os.scandir(shard.path) as files:
+                for entry in files:
+                    try:
+                        st = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    entries.append((st.st_mtime, st.st_size, entry.path))
+                    total += st.st_size
+    limit = max_mb * 1024 * 1024
+    removed = 0
+    for _, size, path in sorted(entries):
+        if total <= limit:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+        removed += 1
+    return removed
+
+
+class AssetCache:
+    """Probe results and resampled images shared between builders, bounded in size.
+
+    Acts as the ``asset_cache`` mapping BrandedDeckBuilder accepts. Once the
+    resampled blobs held exceed ``max_bytes``, the least recently used images
+    are dropped and will be probed and resampled again if a later deck needs
+    them. Safe to share between the builder's prefetch threads.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_ASSET_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._entries = OrderedDict()  # path -> (asset, bytes charged for it)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __getitem__(self, key):
+        with self._lock:
+            self._entries.move_to_end(key)
+            return self._entries[key][0]
+
+    def __setitem__(self, key, asset):
+        size = sum(len(blob) for blob in asset["blobs"].values()) if asset else 0
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.nbytes -= old[1]
+            self._entries[key] = (asset, size)
+            self.nbytes += size
+            while self.nbytes > self.max_bytes and self._entries:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.nbytes -= evicted
+
+
 # ============================================================
 # PRESENTATION BUILDER
 # ============================================================
@@ -118,9 +362,12 @@ SLIDE_HEIGHT = Inches(7.5)
 class BrandedDeckBuilder:
     """Builds a branded .pptx presentation from structured JSON data."""
 
-    def __init__(self, brand_config):
+    def __init__(self, brand_config, image_dpi=DEFAULT_IMAGE_DPI,
+                 jpeg_quality=DEFAULT_JPEG_QUALITY, image_cache_dir=DEFAULT_IMAGE_CACHE_DIR,
+                 image_jobs=None, asset_cache=None, brand_template=True,
+                 template_cache_dir=DEFAULT_TEMPLATE_CACHE_DIR):
         self.brand = brand_config
-        self.prs = Presentation()
+        self.prs = Presentation(io.BytesIO(template_blob()))
 
         # Set 16:9 widescreen dimensions
         self.prs.slide_width = SLIDE_WIDTH
@@ -169,6 +416,27 @@ class BrandedDeckBuilder:
         self.client_name = brand_config.get("client_name", "")
         self.agency_name = brand_config.get("agency_name", "ScaleFlow")
 
+        # Image registry: path -> probed size and embedded image parts
+        self._assets = {}
+        self._parts_by_sha1 = {}
+        self.image_dpi = image_dpi
+        self.jpeg_quality = jpeg_quality
+        self.image_cache_dir = image_cache_dir
+        self.image_jobs = image_jobs
+        # Optional mapping shared between builders (an AssetCache, or a dict
+        # when the caller bounds it): probe results and resampled bytes carry
+        # over to the next deck; image parts never do
+        self.asset_cache = asset_cache
+
+        # Deck layout -> slide layout with the brand decorations baked in
+        self._layouts = {}
+        self.template_cache_dir = template_cache_dir
+
+        # Problems found while building, reported by the caller
+        self.warnings = []
+        if brand_template:
+            self._load_brand_template()
+
     # ----------------------------------------------------------
     # LOW-LEVEL HELPERS
     # ----------------------------------------------------------
@@ -178,6 +446,14 @@ class BrandedDeckBuilder:
         layout = self.prs.slide_layouts[6]
         return self.prs.slides.add_slide(layout)
 
+    def _add_layout_slide(self, layout):
+        """Add a slide for a deck layout, with its background and brand decorations."""
+        if self._layouts:
+            return self.prs.slides.add_slide(self._layouts[layout])
+        slide = self._add_blank_slide()
+        self._add_decorations(slide, layout)
+        return slide
+
     def _set_slide_bg(self, slide, color):
         """Set the background color of a slide."""
         background = slide.background
@@ -249,22 +525,438 @@ class BrandedDeckBuilder:
         """Add the brand logo to the slide if available. Returns the shape or None."""
         if not self.logo_path:
             return None
+        asset = self._probe_image(self.logo_path)
+        if asset is None:
+            return None
+        try:
+            width, height = fit_within(asset["aspect"], max_width, max_height)
+            return self._add_picture(slide, asset, left, top, width, height)
+        except Exception:
+            return None
+
+    # ----------------------------------------------------------
+    # BRAND DECORATIONS
+    # ----------------------------------------------------------
+
+    def _add_decorations(self, slide, layout):
+        """Draw the background and every brand element a layout shows regardless of content."""
+        page_bg = self.dark_bg if self.is_dark_bg else self.white
+
+        if layout == "title":
+            self._set_slide_bg(slide, self.dark_bg)
+            self._add_accent_bar(slide, Inches(0), height=Inches(0.08))
+            self._add_accent_bar(slide, Inches(7.0), height=Inches(0.06))
+            # Logo in bottom-right
+            self._add_logo(
+                slide,
+                left=Inches(10.8), top=Inches(5.8),
+                max_width=LOGO_BOXES["title"][0], max_height=LOGO_BOXES["title"][1],
+            )
+            # Agency / client footer
+            ft = self._add_textbox(
+                slide,
+                left=Inches(1.2), top=Inches(6.5),
+                width=Inches(6), height=Inches(0.5),
+            )
+            self._set_text(
+                ft, f"{self.agency_name}  |  {self.client_name}",
+                font_size=Pt(11), color=self.subtle_color,
+            )
+
+        elif layout == "section_header":
+            self._set_slide_bg(slide, self.dark_bg)
+            # Accent bar at left edge (vertical stripe)
+            shape = slide.shapes.add_shape(
+                MSO_SHAPE.RECTANGLE,
+                Inches(0), Inches(0), Inches(0.15), SLIDE_HEIGHT,
+            )
+            shape.fill.solid()
+            shape.fill.fore_color.rgb = self.accent
+            shape.line.fill.background()
+            # Horizontal accent bar below title
+            self._add_accent_bar(slide, Inches(5.2), height=Inches(0.05))
+
+        elif layout == "content":
+            self._set_slide_bg(slide, page_bg)
+            self._add_accent_bar(slide, Inches(0), height=Inches(0.05))
+            # Thin accent underline below title
+            self._add_underline(slide, Inches(1.55))
+
+        elif layout == "image":
+            self._set_slide_bg(slide, self.dark_bg)
+            self._add_accent_bar(slide, Inches(0), height=Inches(0.05))
+
+        elif layout == "comparison":
+            self._set_slide_bg(slide, page_bg)
+            self._add_accent_bar(slide, Inches(0), height=Inches(0.05))
+
+        elif layout == "two_column":
+            self._set_slide_bg(slide, page_bg)
+            self._add_accent_bar(slide, Inches(0), height=Inches(0.05))
+            self._add_underline(slide, Inches(1.4))
+            # Vertical divider between the columns
+            divider = slide.shapes.add_shape(
+                MSO_SHAPE.RECTANGLE,
+                Inches(6.55), Inches(1.9), Inches(0.03), Inches(4.5),
+            )
+            divider.fill.solid()
+            divider.fill.fore_color.rgb = self.accent
+            divider.line.fill.background()
+
+        elif layout == "closing":
+            self._set_slide_bg(slide, self.dark_bg)
+            self._add_accent_bar(slide, Inches(0), height=Inches(0.08))
+            self._add_accent_bar(slide, Inches(4.8), height=Inches(0.05))
+            # Logo centered at bottom
+            self._add_logo(
+                slide,
+                left=Inches(5.5), top=Inches(5.5),
+                max_width=LOGO_BOXES["closing"][0], max_height=LOGO_BOXES["closing"][1],
+            )
+            # Agency footer
+            ft = self._add_textbox(
+                slide,
+                left=Inches(1.0), top=Inches(6.6),
+                width=Inches(11), height=Inches(0.5),
+            )
+            ft.paragraphs[0].alignment = PP_ALIGN.CENTER
+            self._set_text(
+                ft, f"Prepared by {self.agency_name}",
+                font_size=Pt(11), color=self.subtle_color,
+                alignment=PP_ALIGN.CENTER,
+            )
+            self._add_accent_bar(slide, Inches(7.2), height=Inches(0.08))
+
+    def _add_underline(self, slide, top):
+        """Short accent underline below a slide title."""
+        underline = slide.shapes.add_shape(
+            MSO_SHAPE.RECTANGLE,
+            Inches(1.0), top, Inches(2.5), Inches(0.04),
+        )
+        underline.fill.solid()
+        underline.fill.fore_color.rgb = self.accent
+        underline.line.fill.background()
+        return underline
+
+    # ----------------------------------------------------------
+    # BRAND TEMPLATE
+    # ----------------------------------------------------------
+
+    def _load_brand_template(self):
+        """Switch to this brand's compiled template, compiling and caching it if needed."""
+        key = brand_template_key(self.brand, self.logo_path, self.image_dpi, self.jpeg_quality)
+        blob = _template_blobs.get(key)
+        cache_path = None
+        if blob is None and self.template_cache_dir:
+            cache_path = os.path.join(self.template_cache_dir, f"brand-{key}.pptx")
+            try:
+                with open(cache_path, "rb") as f:
+                    blob = f.read()
+            except OSError:
+                pass
+        if blob is None:
+            blob = self._compile_brand_template()
+            if cache_path:
+                try:
+                    os.makedirs(self.template_cache_dir, exist_ok=True)
+                    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+                    with open(tmp_path, "wb") as f:
+                        f.write(blob)
+                    os.replace(tmp_path, cache_path)
+                except OSError:
+                    pass
+        _template_blobs[key] = blob
+
+        # Image parts made while compiling belong to the discarded package
+        for asset in self._assets.values():
+            if asset is not None:
+                asset["parts"] = {}
+        self._parts_by_sha1 = {}
+
+        self.prs = Presentation(io.BytesIO(blob))
+        for slide_layout in self.prs.slide_layouts:
+            if slide_layout.name.startswith(BRAND_LAYOUT_PREFIX):
+                self._layouts[slide_layout.name[len(BRAND_LAYOUT_PREFIX):]] = slide_layout
+
+    def _compile_brand_template(self):
+        """Return .pptx bytes whose slide layouts carry this brand's decorations.
+
+        The default template's layouts are reused in order: each is emptied
+        and receives the shapes and background drawn on a scratch slide.
+        Layouts left over are removed.
+        """
+        slide_layouts = self.prs.slide_master.slide_layouts
+        stock_layouts = list(slide_layouts)
+        for layout, slide_layout in zip(BRAND_LAYOUTS, stock_layouts):
+            slide = self._add_blank_slide()
+            self._add_decorations(slide, layout)
+            self._bake_into_layout(slide, slide_layout, layout)
+            self._drop_last_slide()
+        for slide_layout in stock_layouts[len(BRAND_LAYOUTS):]:
+            slide_layouts.remove(slide_layout)
+
+        buf = io.BytesIO()
+        self.prs.save(buf)
+        return buf.getvalue()
+
+    def _bake_into_layout(self, slide, slide_layout, layout):
+        """Move a slide's shapes and background onto a slide layout, replacing its placeholders."""
+        layout_el = slide_layout._element
+        layout_el.attrib.pop("type", None)
+        cSld = layout_el.cSld
+        cSld.set("name", BRAND_LAYOUT_PREFIX + layout)
+
+        if cSld.bg is not None:
+            cSld.remove(cSld.bg)
+        if slide._element.cSld.bg is not None:
+            cSld.insert(0, slide._element.cSld.bg)
+
+        spTree = cSld.spTree
+        for shape_el in list(spTree.iter_shape_elms()):
+            spTree.remove(shape_el)
+        for shape_el in list(slide.shapes._spTree.iter_shape_elms()):
+            # Re-point image references at relationships of the layout part
+            for el in shape_el.iter():
+                for attr in REL_ATTRS:
+                    rId = el.get(attr)
+                    if rId:
+                        rel = slide.part.rels[rId]
+                        el.set(attr, slide_layout.part.relate_to(rel.target_part, rel.reltype))
+            spTree.insert_element_before(shape_el, "p:extLst")
+
+    def _drop_last_slide(self):
+        """Remove the most recently added slide from the presentation."""
+        sldIdLst = self.prs.slides._sldIdLst
+        sldId = sldIdLst[-1]
+        self.prs.part.drop_rel(sldId.rId)
+        sldIdLst.remove(sldId)
+
+    # ----------------------------------------------------------
+    # IMAGE REGISTRY
+    # ----------------------------------------------------------
+
+    def _probe_image(self, image_path):
+        """Return the registry entry for an image, reading its header only once.
+
+        Entries hold the path, displayed pixel size (after EXIF rotation),
+        aspect ratio and format, plus the image parts embedded so far (one
+        per target pixel size). Unreadable images are remembered as None.
+        """
+        key = os.path.abspath(image_path)
+        if key in self._assets:
+            return self._assets[key]
+        if self.asset_cache is not None:
+            try:
+                shared = self.asset_cache[key]
+            except KeyError:
+                pass
+            else:
+                asset = dict(shared, parts={}) if shared is not None else None
+                self._assets[key] = asset
+                return asset
+        asset = None
         try:
-            img = Image.open(self.logo_path)
-            img_w, img_h = img.size
-            aspect = img_w / img_h
-
-            # Fit within max bounds while maintaining aspect ratio
-            width = max_width
-            height = int(width / aspect)
-            if height > max_height:
-                height = max_height
-                width = int(height * aspect)
-
-            pic = slide.shapes.add_picture(self.logo_path, left, top, width, height)
-            return pic
+            with Image.open(key) as img:
+                img_w, img_h = img.size
+                img_format = img.format
+                orientation = img.getexif().get(EXIF_ORIENTATION, 1)
+            if orientation in QUARTER_TURNS:
+                img_w, img_h = img_h, img_w
+            if img_w and img_h:
+                asset = {
+                    "path": key, "size": (img_w, img_h), "aspect": img_w / img_h,
+                    "format": img_format, "rotated": orientation not in (None, 1),
+                    "sha256": None, "blobs": {}, "parts": {},
+                }
         except Exception:
+            asset = None
+        self._assets[key] = asset
+        self._share_asset(key, asset)
+        return asset
+
+    def _share_asset(self, key, asset):
+        """Store an asset in the shared cache without this deck's image parts."""
+        if self.asset_cache is not None:
+            self.asset_cache[key] = dict(asset, parts={}) if asset is not None else None
+
+    def _target_pixels(self, asset, width, height):
+        """Pixel size needed to fill a width × height (EMU) frame, or None to embed as is.
+
+        Images with an EXIF orientation are always re-encoded upright, since
+        PowerPoint does not apply the tag.
+        """
+        if not self.image_dpi:
+            return asset["size"] if asset["rotated"] else None
+        target = (
+            max(1, math.ceil(width / EMU_PER_INCH * self.image_dpi)),
+            max(1, math.ceil(height / EMU_PER_INCH * self.image_dpi)),
+        )
+        src_w, src_h = asset["size"]
+        if (src_w <= target[0] and src_h <= target[1] and asset["format"] in EMBEDDABLE_FORMATS
+                and not asset["rotated"]):
             return None
+        return target
+
+    def _derive_image(self, asset, target):
+        """Return the bytes of the resampled, re-encoded copy of an image.
+
+        Copies are cached on disk under a digest of the source bytes and the
+        output settings, so an unchanged image is only decoded once. The copy
+        is turned upright per its EXIF orientation and keeps the source's RGB
+        ICC profile; CMYK and greyscale profiles are converted to sRGB.
+        """
+        if asset["sha256"] is None:
+            digest = hashlib.sha256()
+            with open(asset["path"], "rb") as f:
+                for block in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(block)
+            asset["sha256"] = digest.hexdigest()
+        key = hashlib.sha256(
+            f"{IMAGE_CACHE_VERSION}:{asset['sha256']}:{target[0]}x{target[1]}:"
+            f"{self.jpeg_quality}".encode("utf-8")
+        ).hexdigest()
+
+        cache_dir = os.path.join(self.image_cache_dir, key[:2]) if self.image_cache_dir else None
+        if cache_dir:
+            for ext in (".jpg", ".png"):
+                cached = os.path.join(cache_dir, key + ext)
+                try:
+                    with open(cached, "rb") as f:
+                        blob = f.read()
+                except OSError:
+                    continue
+                try:
+                    os.utime(cached)  # recency for prune_image_cache()
+                except OSError:
+                    pass
+                return blob
+
+        with Image.open(asset["path"]) as img:
+            # JPEG decoders can scale down by powers of two while decoding;
+            # the draft size is in stored (pre-rotation) orientation
+            img.draft("RGB", target[::-1] if asset["size"] != img.size else target)
+            has_alpha = img.mode in ("RGBA", "LA", "PA") or (
+                img.mode == "P" and "transparency" in img.info
+            )
+            icc_profile = img.info.get("icc_profile")
+            img, icc_profile = convert_color(
+                ImageOps.exif_transpose(img), "RGBA" if has_alpha else "RGB", icc_profile
+            )
+            img.thumbnail(target, Image.LANCZOS)
+            buf = io.BytesIO()
+            extra = {"icc_profile": icc_profile} if icc_profile else {}
+            if has_alpha:
+                img.save(buf, "PNG", **extra)
+            else:
+                img.save(buf, "JPEG", quality=self.jpeg_quality, **extra)
+        blob = buf.getvalue()
+
+        if cache_dir:
+            out_path = os.path.join(cache_dir, key + (".png" if has_alpha else ".jpg"))
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+                tmp_path = f"{out_path}.{os.getpid()}.tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(blob)
+                os.replace(tmp_path, out_path)
+            except OSError:
+                pass
+        return blob
+
+    def _image_blob(self, asset, target):
+        """Bytes to embed for an asset at a target pixel size (None: the original)."""
+        blob = None
+        if target is not None:
+            blob = asset["blobs"].get(target) or self._derive_image(asset, target)
+            if (asset["format"] in EMBEDDABLE_FORMATS and not asset["rotated"]
+                    and len(blob) >= os.path.getsize(asset["path"])):
+                blob = None
+        if blob is None:
+            with open(asset["path"], "rb") as f:
+                blob = f.read()
+        return blob
+
+    def _image_part(self, asset, width, height):
+        """Image part for an asset shown in a width × height frame, built once per size.
+
+        The resampled copy is used unless it came out larger than an original
+        PowerPoint can already display.
+        """
+        target = self._target_pixels(asset, width, height)
+        part = asset["parts"].get(target)
+        if part is not None:
+            return part
+
+        image = PptxImage.from_blob(self._image_blob(asset, target), os.path.basename(asset["path"]))
+        part = self._parts_by_sha1.get(image.sha1)
+        if part is None:
+            part = ImagePart.new(self.prs.part.package, image)
+            self._parts_by_sha1[image.sha1] = part
+        asset["parts"][target] = part
+        return part
+
+    def _image_boxes(self, slides):
+        """Map each image path the slides will place to the boxes it is fitted into."""
+        boxes = {}
+        for slide_data in slides:
+            layout = slide_data.get("layout", "content")
+            image_path = slide_data.get("image_path")
+            if layout == "image" and image_path and os.path.exists(image_path):
+                boxes.setdefault(os.path.abspath(image_path), set()).add(IMAGE_BOX)
+            elif layout in LOGO_BOXES and self.logo_path and not self._layouts:
+                boxes.setdefault(os.path.abspath(self.logo_path), set()).add(LOGO_BOXES[layout])
+        return boxes
+
+    def _prepare_image(self, image_path, boxes):
+        """Probe an image and resample it for each box; failures are left to the slide builder."""
+        try:
+            asset = self._probe_image(image_path)
+            if asset is None:
+                return
+            for max_w, max_h in boxes:
+                target = self._target_pixels(asset, *fit_within(asset["aspect"], max_w, max_h))
+                if target is not None and target not in asset["blobs"]:
+                    asset["blobs"][target] = self._derive_image(asset, target)
+            # Re-store so a bounded cache accounts for the new blobs
+            self._share_asset(asset["path"], asset)
+        except Exception:
+            pass
+
+    def prefetch_images(self, slides, jobs=None):
+        """Probe and resample every image the slides reference, in a thread pool.
+
+        Pillow and hashlib release the GIL while decoding, resizing and
+        hashing, so threads overlap the image work; the results land in the
+        registry and slide building then only creates parts and XML.
+        """
+        boxes = self._image_boxes(slides)
+        if not boxes:
+            return
+        workers = min(jobs or os.cpu_count() or 1, len(boxes))
+        if workers <= 1:
+            for image_path, path_boxes in boxes.items():
+                self._prepare_image(image_path, path_boxes)
+            return
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(self._prepare_image, boxes.keys(), boxes.values()))
+
+    def _add_picture(self, slide, asset, left, top, width, height):
+        """Place a registry image on a slide, embedding each size only on first use.
+
+        shapes.add_picture() would re-read and re-hash the file and then scan
+        every image part in the package for a match; relating the slide to the
+        cached part skips all of that. Without the python-pptx internals this
+        relies on (SHARED_IMAGE_PARTS), the public add_picture() is used.
+        """
+        if not SHARED_IMAGE_PARTS:
+            blob = self._image_blob(asset, self._target_pixels(asset, width, height))
+            return slide.shapes.add_picture(io.BytesIO(blob), left, top, width, height)
+        part = self._image_part(asset, width, height)
+        rId = slide.part.relate_to(part, RT.IMAGE)
+        shapes = slide.shapes
+        pic = shapes._add_pic_from_image_part(part, rId, left, top, width, height)
+        shapes._recalculate_extents()
+        return shapes._shape_factory(pic)
 
     def _add_speaker_notes(self, slide, notes_text):
         """Add speaker notes to a slide."""
@@ -279,13 +971,7 @@ class BrandedDeckBuilder:
 
     def _build_title_slide(self, slide_data):
         """Big title + subtitle, brand colors, logo, dark background."""
-        slide = self._add_blank_slide()
-
-        # Dark background
-        self._set_slide_bg(slide, self.dark_bg)
-
-        # Accent bar at top
-        self._add_accent_bar(slide, Inches(0), height=Inches(0.08))
+        slide = self._add_layout_slide("title")
 
         # Title text
         tf = self._add_textbox(
@@ -309,28 +995,6 @@ class BrandedDeckBuilder:
                 space_before=Pt(18),
             )
 
-        # Bottom accent bar
-        self._add_accent_bar(slide, Inches(7.0), height=Inches(0.06))
-
-        # Logo in bottom-right
-        self._add_logo(
-            slide,
-            left=Inches(10.8), top=Inches(5.8),
-            max_width=Inches(1.8), max_height=Inches(0.9),
-        )
-
-        # Agency / date footer
-        footer_text = f"{self.agency_name}  |  {self.client_name}"
-        ft = self._add_textbox(
-            slide,
-            left=Inches(1.2), top=Inches(6.5),
-            width=Inches(6), height=Inches(0.5),
-        )
-        self._set_text(
-            ft, footer_text,
-            font_size=Pt(11), color=self.subtle_color,
-        )
-
         self._add_speaker_notes(slide, slide_data.get("notes", ""))
         return slide
 
@@ -340,19 +1004,7 @@ class BrandedDeckBuilder:
 
     def _build_section_header_slide(self, slide_data):
         """Section divider with large centered text and accent color bar."""
-        slide = self._add_blank_slide()
-
-        # Dark background
-        self._set_slide_bg(slide, self.dark_bg)
-
-        # Accent bar at left edge (vertical stripe)
-        shape = slide.shapes.add_shape(
-            MSO_SHAPE.RECTANGLE,
-            Inches(0), Inches(0), Inches(0.15), SLIDE_HEIGHT,
-        )
-        shape.fill.solid()
-        shape.fill.fore_color.rgb = self.accent
-        shape.line.fill.background()
+        slide = self._add_layout_slide("section_header")
 
         # Centered title
         tf = self._add_textbox(
@@ -367,9 +1019,6 @@ class BrandedDeckBuilder:
             color=self.white, bold=True,
         )
 
-        # Horizontal accent bar below title
-        self._add_accent_bar(slide, Inches(5.2), height=Inches(0.05))
-
         self._add_speaker_notes(slide, slide_data.get("notes", ""))
         return slide
 
@@ -379,19 +1028,10 @@ class BrandedDeckBuilder:
 
     def _build_content_slide(self, slide_data):
         """Title + bullet points body."""
-        slide = self._add_blank_slide()
+        slide = self._add_layout_slide("content")
 
-        if self.is_dark_bg:
-            self._set_slide_bg(slide, self.dark_bg)
-            title_color = self.primary
-            body_text_color = self.white
-        else:
-            self._set_slide_bg(slide, self.white)
-            title_color = self.primary
-            body_text_color = self.body_color
-
-        # Accent bar at top
-        self._add_accent_bar(slide, Inches(0), height=Inches(0.05))
+        title_color = self.primary
+        body_text_color = self.white if self.is_dark_bg else self.body_color
 
         # Title
         tf_title = self._add_textbox(
@@ -405,15 +1045,6 @@ class BrandedDeckBuilder:
             color=title_color, bold=True,
         )
 
-        # Thin accent underline below title
-        underline = slide.shapes.add_shape(
-            MSO_SHAPE.RECTANGLE,
-            Inches(1.0), Inches(1.55), Inches(2.5), Inches(0.04),
-        )
-        underline.fill.solid()
-        underline.fill.fore_color.rgb = self.accent
-        underline.line.fill.background()
-
         # Body bullets
         body = slide_data.get("body", [])
         if isinstance(body, str):
@@ -460,11 +1091,7 @@ class BrandedDeckBuilder:
 
     def _build_image_slide(self, slide_data):
         """Title + image, or placeholder text if image missing."""
-        slide = self._add_blank_slide()
-        self._set_slide_bg(slide, self.dark_bg)
-
-        # Accent bar at top
-        self._add_accent_bar(slide, Inches(0), height=Inches(0.05))
+        slide = self._add_layout_slide("image")
 
         # Title
         tf_title = self._add_textbox(
@@ -484,24 +1111,16 @@ class BrandedDeckBuilder:
         if image_path and os.path.exists(image_path):
             # Insert actual image, centered and fitted
             try:
-                img = Image.open(image_path)
-                img_w, img_h = img.size
-                aspect = img_w / img_h
-
-                max_w = Inches(11.0)
-                max_h = Inches(5.5)
-
-                width = max_w
-                height = int(width / aspect)
-                if height > max_h:
-                    height = max_h
-                    width = int(height * aspect)
+                asset = self._probe_image(image_path)
+                if asset is None:
+                    raise ValueError(f"Unreadable image: {image_path}")
+                width, height = fit_within(asset["aspect"], *IMAGE_BOX)
 
                 # Center horizontally
                 left = int((SLIDE_WIDTH - width) / 2)
                 top = Inches(1.6)
 
-                slide.shapes.add_picture(image_path, left, top, width, height)
+                self._add_picture(slide, asset, left, top, width, height)
             except Exception:
                 self._add_image_placeholder(slide, placeholder_text or "[Image could not be loaded]")
         else:
@@ -550,17 +1169,8 @@ class BrandedDeckBuilder:
 
     def _build_comparison_slide(self, slide_data):
         """Title + data table."""
-        slide = self._add_blank_slide()
-
-        if self.is_dark_bg:
-            self._set_slide_bg(slide, self.dark_bg)
-            title_color = self.primary
-        else:
-            self._set_slide_bg(slide, self.white)
-            title_color = self.primary
-
-        # Accent bar at top
-        self._add_accent_bar(slide, Inches(0), height=Inches(0.05))
+        slide = self._add_layout_slide("comparison")
+        title_color = self.primary
 
         # Title
         tf_title = self._add_textbox(
@@ -660,19 +1270,10 @@ class BrandedDeckBuilder:
 
     def _build_two_column_slide(self, slide_data):
         """Title + two content columns."""
-        slide = self._add_blank_slide()
+        slide = self._add_layout_slide("two_column")
 
-        if self.is_dark_bg:
-            self._set_slide_bg(slide, self.dark_bg)
-            title_color = self.primary
-            body_text_color = self.white
-        else:
-            self._set_slide_bg(slide, self.white)
-            title_color = self.primary
-            body_text_color = self.body_color
-
-        # Accent bar at top
-        self._add_accent_bar(slide, Inches(0), height=Inches(0.05))
+        title_color = self.primary
+        body_text_color = self.white if self.is_dark_bg else self.body_color
 
         # Title
         tf_title = self._add_textbox(
@@ -686,15 +1287,6 @@ class BrandedDeckBuilder:
             color=title_color, bold=True,
         )
 
-        # Accent underline
-        underline = slide.shapes.add_shape(
-            MSO_SHAPE.RECTANGLE,
-            Inches(1.0), Inches(1.4), Inches(2.5), Inches(0.04),
-        )
-        underline.fill.solid()
-        underline.fill.fore_color.rgb = self.accent
-        underline.line.fill.background()
-
         # Left column
         left_content = slide_data.get("left", [])
         if isinstance(left_content, str):
@@ -726,15 +1318,6 @@ class BrandedDeckBuilder:
             run.font.size = Pt(16)
             run.font.color.rgb = body_text_color
 
-        # Vertical divider
-        divider = slide.shapes.add_shape(
-            MSO_SHAPE.RECTANGLE,
-            Inches(6.55), Inches(1.9), Inches(0.03), Inches(4.5),
-        )
-        divider.fill.solid()
-        divider.fill.fore_color.rgb = self.accent
-        divider.line.fill.background()
-
         # Right column
         right_content = slide_data.get("right", [])
         if isinstance(right_content, str):
@@ -775,13 +1358,7 @@ class BrandedDeckBuilder:
 
     def _build_closing_slide(self, slide_data):
         """Thank you slide with brand presence."""
-        slide = self._add_blank_slide()
-
-        # Dark background
-        self._set_slide_bg(slide, self.dark_bg)
-
-        # Accent bar at top
-        self._add_accent_bar(slide, Inches(0), height=Inches(0.08))
+        slide = self._add_layout_slide("closing")
 
         # Main "Thank You" title
         tf = self._add_textbox(
@@ -807,33 +1384,6 @@ class BrandedDeckBuilder:
                 space_before=Pt(18),
             )
 
-        # Accent bar
-        self._add_accent_bar(slide, Inches(4.8), height=Inches(0.05))
-
-        # Logo centered at bottom
-        if self.logo_path:
-            self._add_logo(
-                slide,
-                left=Inches(5.5), top=Inches(5.5),
-                max_width=Inches(2.2), max_height=Inches(1.0),
-            )
-
-        # Agency footer
-        ft = self._add_textbox(
-            slide,
-            left=Inches(1.0), top=Inches(6.6),
-            width=Inches(11), height=Inches(0.5),
-        )
-        ft.paragraphs[0].alignment = PP_ALIGN.CENTER
-        self._set_text(
-            ft, f"Prepared by {self.agency_name}",
-            font_size=Pt(11), color=self.subtle_color,
-            alignment=PP_ALIGN.CENTER,
-        )
-
-        # Bottom accent bar
-        self._add_accent_bar(slide, Inches(7.2), height=Inches(0.08))
-
         self._add_speaker_notes(slide, slide_data.get("notes", ""))
         return slide
 
@@ -858,7 +1408,7 @@ class BrandedDeckBuilder:
         method_name = self.LAYOUT_MAP.get(layout)
 
         if method_name is None:
-            print(f"Warning: Unknown layout '{layout}', falling back to 'content'.")
+            self.warnings.append(f"Unknown layout '{layout}', falling back to 'content'.")
             method_name = "_build_content_slide"
 
         method = getattr(self, method_name)
@@ -873,28 +1423,123 @@ class BrandedDeckBuilder:
         slides = presentation_data.get("slides", [])
 
         if not slides:
-            print("Warning: No slides found in input data.")
+            self.warnings.append("No slides found in input data.")
             return
 
+        if self.image_jobs != 1:
+            self.prefetch_images(slides, self.image_jobs)
+
         for slide_data in slides:
             self._build_slide(slide_data)
 
-        print(f"Built {len(slides)} slides.")
-
     # ----------------------------------------------------------
     # SAVE
     # ----------------------------------------------------------
 
     def save(self, output_path):
-        """Save the presentation to disk."""
-        out_dir = os.path.dirname(output_path)
-        if out_dir:
-            os.makedirs(out_dir, exist_ok=True)
+        """Save the presentation to a path or a binary file object."""
+        if isinstance(output_path, (str, os.PathLike)):
+            out_dir = os.path.dirname(output_path)
+            if out_dir:
+                os.makedirs(out_dir, exist_ok=True)
         self.prs.save(output_path)
-        print(f"Branded presentation saved: {output_path}")
         return output_path
 
 
+# ============================================================
+# BATCH
+# ============================================================
+
+# Probe results and resampled images shared by the decks a worker builds,
+# least recently used images dropped past DEFAULT_ASSET_CACHE_BYTES
+_batch_asset_cache = AssetCache()
+
+
+def load_deck_data(input_path):
+    """Load and check a deck JSON file. Raises ValueError with a readable message."""
+    if not os.path.exists(input_path):
+        raise ValueError(f"Input file not found: {input_path}")
+    try:
+        with open(input_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON in input file: {e}")
+    if "brand" not in data:
+        raise ValueError("JSON input must contain a 'brand' object.")
+    if "presentation" not in data:
+        raise ValueError("JSON input must contain a 'presentation' object.")
+    return data
+
+
+def load_manifest(manifest_path):
+    """Return [(input_path, output_path)] for each deck in a batch manifest."""
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    base_dir = os.path.dirname(os.path.abspath(manifest_path))
+    entries = manifest.get("decks", []) if isinstance(manifest, dict) else manifest
+    decks = []
+    for entry in entries:
+        if isinstance(entry, str):
+            entry = {"input": entry}
+        input_path = os.path.join(base_dir, entry["input"])
+        output = entry.get("output") or os.path.splitext(entry["input"])[0] + ".pptx"
+        decks.append((input_path, os.path.join(base_dir, output)))
+    return decks
+
+
+def build_deck(input_path, output_path, options):
+    """Build one deck for a batch and return its timing record."""
+    started = time.perf_counter()
+    try:
+        data = load_deck_data(input_path)
+        builder = BrandedDeckBuilder(data["brand"], asset_cache=_batch_asset_cache, **options)
+        builder.build_from_data(data["presentation"])
+        builder.save(output_path)
+    except Exception as e:
+        return {"output": output_path, "error": str(e),
+                "seconds": time.perf_counter() - started}
+    record = {
+        "output": output_path,
+        "slides": len(builder.prs.slides),
+        "bytes": os.path.getsize(output_path),
+        "seconds": time.perf_counter() - started,
+    }
+    if builder.warnings:
+        record["warnings"] = builder.warnings
+    return record
+
+
+def _build_deck_job(job):
+    return build_deck(*job)
+
+
+def run_batch(decks, options, processes=1):
+    """Build every (input, output) deck, in worker processes if asked. Returns timing records."""
+    jobs = [(input_path, output_path, options) for input_path, output_path in decks]
+    if processes > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=min(processes, len(jobs))) as pool:
+            return list(pool.map(_build_deck_job, jobs))
+    return [_build_deck_job(job) for job in jobs]
+
+
+def format_batch_report(records, elapsed):
+    """Per-deck timing table for a batch run."""
+    lines = [
+        f"BATCH — {len(records)} decks in {elapsed:.2f}s",
+        f"{'Deck':<40} {'Slides':>6} {'Seconds':>8} {'Size':>10}",
+        "-" * 67,
+    ]
+    for r in records:
+        if "error" in r:
+            lines.append(f"{r['output']:<40} FAILED: {r['error']}")
+        else:
+            size = f"{r['bytes'] / 1_000_000:.1f} MB"
+            lines.append(f"{r['output']:<40} {r['slides']:>6} {r['seconds']:>8.2f} {size:>10}")
+        for warning in r.get("warnings", ()):
+            lines.append(f"    Warning: {warning}")
+    return "\n".join(lines)
+
+
 # ============================================================
 # CLI
 # ============================================================
@@ -905,40 +1550,96 @@ def main():
         epilog="Example: python3 generate_pptx.py --input deck.json --output output.pptx",
     )
     parser.add_argument(
-        "--input", required=True,
+        "--input",
         help="Path to JSON input file containing brand config and slide data",
     )
     parser.add_argument(
-        "--output", required=True,
+        "--output",
         help="Path for the output .pptx file",
     )
+    parser.add_argument(
+        "--batch",
+        help="Manifest JSON listing many decks to build in one run",
+    )
+    parser.add_argument(
+        "--processes", type=int, default=1,
+        help="With --batch: worker processes to spread decks over (default: 1)",
+    )
+    parser.add_argument(
+        "--image-dpi", type=int, default=DEFAULT_IMAGE_DPI,
+        help=f"Resample images to this many pixels per inch of frame (default: {DEFAULT_IMAGE_DPI}; 0 embeds originals)",
+    )
+    parser.add_argument(
+        "--jpeg-quality", type=int, default=DEFAULT_JPEG_QUALITY,
+        help=f"JPEG quality for resampled images (default: {DEFAULT_JPEG_QUALITY})",
+    )
+    parser.add_argument(
+        "--image-cache", default=DEFAULT_IMAGE_CACHE_DIR,
+        help="Directory for resampled image copies (default: ~/.cache/scaleflow/pptx-images)",
+    )
+    parser.add_argument(
+        "--image-cache-max-mb", type=int, default=DEFAULT_IMAGE_CACHE_MAX_MB,
+        help=f"Prune the image cache to this size after the run (default: {DEFAULT_IMAGE_CACHE_MAX_MB}; 0 never prunes)",
+    )
+    parser.add_argument(
+        "--template-cache", default=DEFAULT_TEMPLATE_CACHE_DIR,
+        help="Directory for compiled brand templates (default: ~/.cache/scaleflow/pptx-templates)",
+    )
+    parser.add_argument(
+        "--no-brand-template", action="store_true",
+        help="Draw backgrounds, bars and logo on every slide instead of in slide layouts",
+    )
+    parser.add_argument(
+        "--jobs", type=int, default=0,
+        help="Threads for image prefetch (default: one per CPU; 1 disables prefetch)",
+    )
     args = parser.parse_args()
 
-    # Validate input file
-    if not os.path.exists(args.input):
-        print(f"Error: Input file not found: {args.input}", file=sys.stderr)
-        sys.exit(1)
+    options = {
+        "image_dpi": args.image_dpi,
+        "jpeg_quality": args.jpeg_quality,
+        "image_cache_dir": args.image_cache,
+        "image_jobs": args.jobs or None,
+        "brand_template": not args.no_brand_template,
+        "template_cache_dir": args.template_cache,
+    }
 
-    # Load JSON data
+    if args.batch:
+        try:
+            decks = load_manifest(args.batch)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"Error: Cannot read batch manifest: {e}", file=sys.stderr)
+            sys.exit(1)
+        started = time.perf_counter()
+        records = run_batch(decks, options, args.processes)
+        print(format_batch_report(records, time.perf_counter() - started))
+        if args.image_cache and args.image_cache_max_mb:
+            prune_image_cache(args.image_cache, args.image_cache_max_mb)
+        if any("error" in r for r in records):
+            sys.exit(1)
+        return
+
+    if not args.input or not args.output:
+        parser.error("--input and --output are required unless --batch is given")
+
+    # Validate and load input file
     try:
-        with open(args.input, "r", encoding="utf-8") as f:
-            data = json.load(f)
-    except json.JSONDecodeError as e:
-        print(f"Error: Invalid JSON in input file: {e}", file=sys.stderr)
-        sys.exit(1)
-
-    # Validate required keys
-    if "brand" not in data:
-        print("Error: JSON input must contain a 'brand' object.", file=sys.stderr)
-        sys.exit(1)
-    if "presentation" not in data:
-        print("Error: JSON input must contain a 'presentation' object.", file=sys.stderr)
+        data = load_deck_data(args.input)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
 
     # Build and save
-    builder = BrandedDeckBuilder(data["brand"])
+    builder = BrandedDeckBuilder(data["brand"], **options)
     builder.build_from_data(data["presentation"])
+    for warning in builder.warnings:
+        print(f"Warning: {warning}")
+    if len(builder.prs.slides):
+        print(f"Built {len(builder.prs.slides)} slides.")
     builder.save(args.output)
+    print(f"Branded presentation saved: {args.output}")
+    if args.image_cache and args.image_cache_max_mb:
+        prune_image_cache(args.image_cache, args.image_cache_max_mb)
 
 
 if __name__ == "__main__":
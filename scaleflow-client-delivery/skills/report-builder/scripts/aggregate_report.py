@@ -0,0 +1,657 @@
+#!/usr/bin/env python3
+"""
+aggregate_report.py
+===================
+
+Builds the report-builder ``document`` payload straight from the production
+tools' machine output, so no figure in the report is copied by hand.
+
+Reads any mix of:
+    --assets   validate_assets.py --json / --ndjson
+    --images   check_image_specs.py --json / --ndjson
+    --copy     validate_copy_lengths.py --json / --ndjson
+    --budget   calculate_budget.py --json
+    --ledger   credit_ledger.py status --json   (actual spend, for variance)
+
+Each flag can be repeated (e.g. one NDJSON shard per export folder) and "-"
+reads stdin. Inputs are parsed incrementally and every record is folded into
+running totals as it is read, so memory follows the number of distinct specs
+and platforms, not the number of assets; only file sizes are kept (8 bytes
+each) for the percentiles.
+
+Output is JSON for shared/generate_branded_docx.py: {"brand", "document"} when
+--brand is given, otherwise {"document"}. With --ndjson the header object is
+written first and each section on its own line, ready for
+generate_branded_docx.py --stream.
+
+Usage examples:
+    python aggregate_report.py --assets assets.ndjson --images images.ndjson \\
+        --copy copy.json --budget budget.json --ledger status.json \\
+        --brand brand.json --title "Spring Launch" --output report.json
+    python validate_assets.py --spec specs.json --assets ./exports --ndjson \\
+        | python aggregate_report.py --assets - --brand brand.json --ndjson \\
+        > report.ndjson
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import json
+import sys
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from pathlib import Path
+from typing import Any, Iterable, Iterator, TextIO
+
+# Shared helpers live in <marketplace root>/shared
+SHARED_DIR = Path(__file__).resolve().parents[4] / "shared"
+if str(SHARED_DIR) not in sys.path:
+    sys.path.append(str(SHARED_DIR))
+
+from scaleflow.jsonstream import iter_json_values  # noqa: E402
+
+# ---------------------------------------------------------------------------
+# Reporting constants
+# ---------------------------------------------------------------------------
+
+# Upper bounds (MB) of the file-size distribution buckets; the last bucket is open
+SIZE_BUCKETS_MB: tuple[float, ...] = (0.5, 1, 2, 5, 10, 20, 50)
+
+# Rows shown in per-spec / per-line breakdown tables before the rest are rolled up
+TABLE_LIMIT = 25
+
+# Most frequent failure reasons listed per source
+TOP_FAILURES = 5
+
+BYTES_PER_MB = 1024 * 1024
+
+
+# ---------------------------------------------------------------------------
+# Input parsing
+# ---------------------------------------------------------------------------
+
+
+def iter_records(fh: TextIO) -> Iterator[dict]:
+    """Yield per-item result records from a tool's --json or --ndjson output."""
+    return expand_records(iter_json_values(fh))
+
+
+def expand_records(values: Iterable[Any]) -> Iterator[dict]:
+    """Flatten decoded output values into per-item result records.
+
+    A whole --json report is expanded into its "results" / "images" list;
+    NDJSON trailer records (``{"summary": {...}}``) are skipped because the
+    totals are recomputed from the records themselves.
+    """
+    for value in values:
+        if isinstance(value, list):
+            yield from value
+        elif isinstance(value, dict):
+            if "results" in value and isinstance(value["results"], list):
+                yield from value["results"]
+            elif "images" in value and isinstance(value["images"], list):
+                yield from value["images"]
+            elif set(value) == {"summary"}:
+                continue
+            else:
+                yield value
+
+
+def iter_sources(paths: Iterable[str]) -> Iterator[dict]:
+    """Chain iter_records over several paths ("-" is stdin)."""
+    for path in paths:
+        if path == "-":
+            yield from iter_records(sys.stdin)
+        else:
+            with open(path, "r", encoding="utf-8") as fh:
+                yield from iter_records(fh)
+
+
+def load_json(path: str) -> Any:
+    if path == "-":
+        return json.load(sys.stdin)
+    with open(path, "r", encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+# ---------------------------------------------------------------------------
+# Size distribution
+# ---------------------------------------------------------------------------
+
+
+def bucket_labels(bounds: tuple[float, ...] = SIZE_BUCKETS_MB) -> list[str]:
+    labels = [f"< {bounds[0]:g} MB"]
+    labels += [f"{lo:g}–{hi:g} MB" for lo, hi in zip(bounds, bounds[1:])]
+    labels.append(f"≥ {bounds[-1]:g} MB")
+    return labels
+
+
+def size_distribution(sizes: array) -> dict | None:
+    """Bucket counts and percentiles for an array of sizes in MB."""
+    if not sizes:
+        return None
+    ordered = sorted(sizes)
+    buckets = [0] * (len(SIZE_BUCKETS_MB) + 1)
+    for size in ordered:
+        buckets[bisect_right(SIZE_BUCKETS_MB, size)] += 1
+    n = len(ordered)
+
+    def pct(p: float) -> float:
+        return ordered[min(n - 1, int(p * n))]
+
+    return {
+        "count": n,
+        "total_mb": round(sum(ordered), 3),
+        "mean_mb": round(sum(ordered) / n, 4),
+        "p50_mb": round(pct(0.50), 4),
+        "p90_mb": round(pct(0.90), 4),
+        "max_mb": round(ordered[-1], 4),
+        "buckets": dict(zip(bucket_labels(), buckets)),
+    }
+
+
+def rate(passed: int, total: int) -> float | None:
+    return round(100.0 * passed / total, 1) if total else None
+
+
+# ---------------------------------------------------------------------------
+# Aggregation (one pass per source)
+# ---------------------------------------------------------------------------
+
+
+def aggregate_assets(records: Iterable[dict]) -> dict:
+    """Fold validate_assets.py results into pass rates, failures and sizes."""
+    total = passed = errors = unmatched = 0
+    failed_checks: Counter[str] = Counter()
+    by_spec: dict[str, list[int]] = {}
+    sizes = array("d")
+    for rec in records:
+        total += 1
+        spec = rec.get("spec_name") or "UNMATCHED"
+        ok = bool(rec.get("passed"))
+        passed += ok
+        if spec == "UNMATCHED":
+            unmatched += 1
+        elif rec.get("error"):
+            errors += 1
+        counts = by_spec.setdefault(spec, [0, 0])
+        counts[0] += 1
+        counts[1] += ok
+        for check in rec.get("checks") or ():
+            if not check.get("passed"):
+                failed_checks[check.get("name", "?")] += 1
+        if rec.get("file_size_bytes") is not None:
+            sizes.append(rec["file_size_bytes"] / BYTES_PER_MB)
+    return {
+        "total": total,
+        "passed": passed,
+        "failed": total - passed,
+        "pass_rate": rate(passed, total),
+        "errors": errors,
+        "unmatched": unmatched,
+        "failed_checks": dict(failed_checks.most_common()),
+        "by_spec": {
+            spec: {"total": t, "passed": p, "pass_rate": rate(p, t)}
+            for spec, (t, p) in sorted(by_spec.items(), key=lambda kv: (kv[1][1] - kv[1][0], kv[0]))
+        },
+        "sizes": size_distribution(sizes),
+    }
+
+
+def aggregate_images(records: Iterable[dict]) -> dict:
+    """Fold check_image_specs.py results into status counts, failures and sizes."""
+    status: Counter[str] = Counter()
+    failed_checks: Counter[str] = Counter()
+    formats: Counter[str] = Counter()
+    ratios: Counter[str] = Counter()
+    sizes = array("d")
+    errors = 0
+    for rec in records:
+        status[rec.get("status") or "SKIPPED"] += 1
+        if rec.get("error"):
+            errors += 1
+        for name, check in (rec.get("checks") or {}).items():
+            if not check.get("pass"):
+                failed_checks[name] += 1
+        if rec.get("format"):
+            formats[rec["format"]] += 1
+        if rec.get("aspect_ratio"):
+            ratios[str(rec["aspect_ratio"])] += 1
+        if rec.get("file_size_mb") is not None:
+            sizes.append(float(rec["file_size_mb"]))
+    total = sum(status.values())
+    checked = status["PASSED"] + status["FAILED"]
+    return {
+        "total": total,
+        "passed": status["PASSED"],
+        "failed": status["FAILED"],
+        "skipped": status["SKIPPED"],
+        "pass_rate": rate(status["PASSED"], checked),
+        "errors": errors,
+        "failed_checks": dict(failed_checks.most_common()),
+        "formats": dict(formats.most_common()),
+        "aspect_ratios": dict(ratios.most_common()),
+        "sizes": size_distribution(sizes),
+    }
+
+
+def aggregate_copy(records: Iterable[dict]) -> dict:
+    """Fold validate_copy_lengths.py results into per-platform pass rates and overage."""
+    status: Counter[str] = Counter()
+    by_platform: dict[str, list[int]] = {}
+    over_total = over_max = warnings = 0
+    for rec in records:
+        st = rec.get("status") or "UNKNOWN"
+        status[st] += 1
+        if rec.get("warning"):
+            warnings += 1
+        counts = by_platform.setdefault(rec.get("platform") or "unknown", [0, 0, 0])
+        counts[0] += 1
+        counts[1] += st == "PASS"
+        counts[2] += st == "FAIL"
+        if st == "FAIL" and rec.get("limit") is not None:
+            over = int(rec.get("char_count", 0)) - int(rec["limit"])
+            over_total += over
+            over_max = max(over_max, over)
+    total = sum(status.values())
+    checked = status["PASS"] + status["FAIL"]
+    return {
+        "total": total,
+        "passed": status["PASS"],
+        "failed": status["FAIL"],
+        "unknown": status["UNKNOWN"],
+        "pass_rate": rate(status["PASS"], checked),
+        "warnings": warnings,
+        "mean_overage": round(over_total / status["FAIL"], 1) if status["FAIL"] else 0,
+        "max_overage": over_max,
+        "by_platform": {
+            platform: {"total": t, "passed": p, "failed": f, "pass_rate": rate(p, t)}
+            for platform, (t, p, f) in sorted(by_platform.items(), key=lambda kv: (-kv[1][2], kv[0]))
+        },
+    }
+
+
+def credit_variance(budget: dict | None, ledger: dict | None) -> dict:
+    """Compare calculate_budget.py --json against credit_ledger.py status --json.
+
+    Ledger lines already carry their own budget; without a ledger only the
+    plan is reported. With both, the budget file supplies the buffer and the
+    plan's available credits where the ledger lacks them.
+    """
+    plan_budget = (budget or {}).get("budget") or {}
+    result: dict[str, Any] = {
+        "plan": (ledger or {}).get("plan") or (budget or {}).get("plan"),
+        "budget": plan_budget.get("total"),
+        "budget_with_buffer": plan_budget.get("total_with_buffer")
+        or (ledger or {}).get("budget_total"),
+        "available": (ledger or {}).get("available", plan_budget.get("available")),
+        "spent": None,
+        "lines": [],
+        "models": {},
+        "unplanned": 0,
+    }
+    if ledger:
+        result["spent"] = ledger.get("spent", 0)
+        result["unplanned"] = ledger.get("unplanned", 0)
+        result["models"] = dict(sorted((ledger.get("models") or {}).items(), key=lambda kv: -kv[1]))
+        for line in ledger.get("lines") or ():
+            result["lines"].append({
+                "line": line.get("line"),
+                "count": line.get("count"),
+                "asset_type": line.get("asset_type"),
+                "model": line.get("model"),
+                "budget": line.get("budget", 0),
+                "spent": line.get("spent", 0),
+                "variance": line.get("spent", 0) - line.get("budget", 0),
+            })
+    else:
+        for i, line in enumerate(plan_budget.get("results") or (), 1):
+            result["lines"].append({
+                "line": i,
+                "count": line.get("count"),
+                "asset_type": line.get("asset_type"),
+                "model": line.get("model"),
+                "budget": line.get("line_total", 0),
+                "spent": None,
+                "variance": None,
+            })
+    if result["spent"] is not None:
+        base = result["budget_with_buffer"] or sum(l["budget"] for l in result["lines"])
+        result["variance"] = result["spent"] - base
+        result["variance_pct"] = rate(result["variance"], base)
+        if result["available"] is not None:
+            result["remaining"] = result["available"] - result["spent"]
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Document sections
+# ---------------------------------------------------------------------------
+
+
+def long_date(d: datetime.date) -> str:
+    """"May 1, 2026" without the platform-specific %-d."""
+    return f"{d:%B} {d.day}, {d.year}"
+
+
+def fmt_int(n: int | float | None) -> str:
+    return "—" if n is None else f"{n:,}"
+
+
+def fmt_pct(p: float | None) -> str:
+    return "—" if p is None else f"{p:.1f}%"
+
+
+def whole(n: int | float) -> int | float:
+    return int(n) if isinstance(n, float) and n.is_integer() else round(n, 1)
+
+
+def fmt_credits(n: int | float | None) -> str:
+    return "—" if n is None else f"{whole(n):,} cr"
+
+
+def fmt_signed(n: int | float | None) -> str:
+    return "—" if n is None else f"{whole(n):+,} cr"
+
+
+def fmt_size(mb: float) -> str:
+    """Sizes under 1 MB in KB (or bytes), so small assets do not all read as 0.0 MB."""
+    if mb * 1024 < 1:
+        return f"{mb * BYTES_PER_MB:,.0f} B"
+    if mb < 1:
+        return f"{mb * 1024:,.0f} KB"
+    return f"{mb:,.1f} MB"
+
+
+def top_failures(failed_checks: dict[str, int]) -> str:
+    return ", ".join(f"{name} ({count:,})" for name, count in list(failed_checks.items())[:TOP_FAILURES])
+
+
+def size_content(sizes: dict | None) -> list[dict]:
+    if not sizes:
+        return []
+    return [
+        {"type": "paragraph", "text": (
+            f"File sizes across {sizes['count']:,} files: median {fmt_size(sizes['p50_mb'])}, "
+            f"90th percentile {fmt_size(sizes['p90_mb'])}, largest {fmt_size(sizes['max_mb'])} "
+            f"({fmt_size(sizes['total_mb'])} in total)."
+        )},
+        {"type": "table", "headers": ["File size", "Files", "Share"], "rows": [
+            [label, fmt_int(n), fmt_pct(rate(n, sizes["count"]))]
+            for label, n in sizes["buckets"].items() if n
+        ]},
+    ]
+
+
+def limited_rows(rows: list[list[str]], label: str) -> list[list[str]]:
+    if len(rows) <= TABLE_LIMIT:
+        return rows
+    hidden = len(rows) - TABLE_LIMIT
+    return rows[:TABLE_LIMIT] + [[f"… {hidden:,} more {label}"] + [""] * (len(rows[0]) - 1)]
+
+
+def overview_section(assets: dict | None, images: dict | None, copy: dict | None) -> dict:
+    rows = []
+    for name, stats in (("Asset specs", assets), ("Image QA", images), ("Copy lengths", copy)):
+        if stats:
+            rows.append([name, fmt_int(stats["total"]), fmt_int(stats["passed"]),
+                         fmt_int(stats["failed"]), fmt_pct(stats["pass_rate"])])
+    return {"heading": "QA Summary", "content": [
+        {"type": "table", "headers": ["Check", "Items", "Passed", "Failed", "Pass rate"], "rows": rows},
+    ]}
+
+
+def assets_section(stats: dict) -> dict:
+    content: list[dict] = [
+        {"type": "labeled", "pairs": [
+            {"label": "Assets checked", "value": fmt_int(stats["total"])},
+            {"label": "Pass rate", "value": fmt_pct(stats["pass_rate"])},
+            {"label": "Unmatched files", "value": fmt_int(stats["unmatched"])},
+            {"label": "Unreadable files", "value": fmt_int(stats["errors"])},
+        ]},
+    ]
+    if stats["failed_checks"]:
+        content.append({"type": "callout", "text": (
+            f"{stats['failed']:,} assets failed spec. Most common: {top_failures(stats['failed_checks'])}."
+        )})
+    rows = [[spec, fmt_int(s["total"]), fmt_int(s["passed"]), fmt_pct(s["pass_rate"])]
+            for spec, s in stats["by_spec"].items()]
+    if rows:
+        content.append({"type": "table", "headers": ["Spec", "Assets", "Passed", "Pass rate"],
+                        "rows": limited_rows(rows, "specs")})
+    content += size_content(stats["sizes"])
+    return {"heading": "Asset Spec Compliance", "content": content}
+
+
+def images_section(stats: dict) -> dict:
+    content: list[dict] = [
+        {"type": "labeled", "pairs": [
+            {"label": "Images checked", "value": fmt_int(stats["total"])},
+            {"label": "Pass rate", "value": fmt_pct(stats["pass_rate"])},
+            {"label": "Skipped", "value": fmt_int(stats["skipped"])},
+            {"label": "Formats", "value": ", ".join(
+                f"{fmt} ({n:,})" for fmt, n in stats["formats"].items()) or "—"},
+        ]},
+    ]
+    if stats["failed_checks"]:
+        content.append({"type": "callout", "text": (
+            f"{stats['failed']:,} images failed QA. Most common: {top_failures(stats['failed_checks'])}."
+        )})
+    if stats["aspect_ratios"]:
+        content.append({"type": "bullets", "items": [
+            f"{ratio}: {n:,} images" for ratio, n in list(stats["aspect_ratios"].items())[:TOP_FAILURES]
+        ]})
+    content += size_content(stats["sizes"])
+    return {"heading": "Image QA", "content": content}
+
+
+def copy_section(stats: dict) -> dict:
+    content: list[dict] = [
+        {"type": "labeled", "pairs": [
+            {"label": "Copy items checked", "value": fmt_int(stats["total"])},
+            {"label": "Pass rate", "value": fmt_pct(stats["pass_rate"])},
+            {"label": "Over limit", "value": fmt_int(stats["failed"])},
+            {"label": "Unknown platform", "value": fmt_int(stats["unknown"])},
+        ]},
+    ]
+    if stats["failed"]:
+        content.append({"type": "callout", "text": (
+            f"{stats['failed']:,} copy items exceed their platform limit, by "
+            f"{stats['mean_overage']:g} characters on average (at most {stats['max_overage']:,})."
+        )})
+    rows = [[platform, fmt_int(s["total"]), fmt_int(s["failed"]), fmt_pct(s["pass_rate"])]
+            for platform, s in stats["by_platform"].items()]
+    if rows:
+        content.append({"type": "table", "headers": ["Platform", "Items", "Over limit", "Pass rate"],
+                        "rows": limited_rows(rows, "platforms")})
+    return {"heading": "Copy Compliance", "content": content}
+
+
+def credits_section(stats: dict) -> dict:
+    pairs = [
+        {"label": "Plan", "value": (stats["plan"] or "—").capitalize()},
+        {"label": "Budgeted", "value": fmt_credits(stats["budget"])},
+        {"label": "Budget with buffer", "value": fmt_credits(stats["budget_with_buffer"])},
+        {"label": "Plan credits", "value": fmt_credits(stats["available"])},
+    ]
+    content: list[dict] = []
+    if stats["spent"] is None:
+        content.append({"type": "labeled", "pairs": pairs})
+        content.append({"type": "paragraph", "italic": True,
+                        "text": "No ledger supplied; actual spend is not reported."})
+        rows = [[fmt_int(l["count"]), l["asset_type"], l["model"], fmt_credits(l["budget"])]
+                for l in stats["lines"]]
+        if rows:
+            content.append({"type": "table", "headers": ["Count", "Asset type", "Model", "Budget"],
+                            "rows": limited_rows(rows, "lines")})
+        return {"heading": "Credit Usage", "content": content}
+
+    pairs += [
+        {"label": "Spent", "value": fmt_credits(stats["spent"])},
+        {"label": "Variance", "value": f"{fmt_signed(stats['variance'])} ({fmt_pct(stats['variance_pct'])})"},
+        {"label": "Remaining", "value": fmt_credits(stats.get("remaining"))},
+    ]
+    content.append({"type": "labeled", "pairs": pairs})
+    over = [l for l in stats["lines"] if l["variance"] > 0]
+    if stats["variance"] > 0 or over or stats["unplanned"]:
+        notes = []
+        if stats["variance"] > 0:
+            notes.append(f"Spend is {whole(stats['variance']):,} credits over the buffered budget.")
+        if over:
+            notes.append(f"{len(over):,} deliverable lines ran over budget.")
+        if stats["unplanned"]:
+            notes.append(f"{whole(stats['unplanned']):,} credits went to unplanned work.")
+        content.append({"type": "callout", "text": " ".join(notes)})
+    rows = [[l["asset_type"], l["model"], fmt_credits(l["budget"]), fmt_credits(l["spent"]),
+             fmt_signed(l["variance"])]
+            for l in sorted(stats["lines"], key=lambda l: -l["variance"])]
+    if rows:
+        content.append({"type": "table", "headers": ["Asset type", "Model", "Budget", "Spent", "Variance"],
+                        "rows": limited_rows(rows, "lines")})
+    if stats["models"]:
+        content.append({"type": "bullets", "items": [
+            f"{model}: {fmt_credits(spent)}" for model, spent in stats["models"].items()
+        ]})
+    return {"heading": "Credit Usage", "content": content}
+
+
+def build_document(
+    assets: dict | None = None,
+    images: dict | None = None,
+    copy: dict | None = None,
+    credits: dict | None = None,
+    title: str = "Campaign Report",
+    subtitle: str = "Production QA and credit usage",
+    date: str | None = None,
+    client: str | None = None,
+    footer: str | None = None,
+) -> dict:
+    """Assemble the generate_branded_docx.py ``document`` object from aggregates."""
+    sections = []
+    if assets or images or copy:
+        sections.append(overview_section(assets, images, copy))
+    if assets:
+        sections.append(assets_section(assets))
+    if images:
+        sections.append(images_section(images))
+    if copy:
+        sections.append(copy_section(copy))
+    if credits:
+        sections.append(credits_section(credits))
+
+    meta = []
+    if client:
+        meta.append({"label": "Client", "value": client})
+    for label, stats in (("Assets", assets), ("Images", images), ("Copy items", copy)):
+        if stats:
+            meta.append({"label": label, "value": f"{stats['total']:,} ({fmt_pct(stats['pass_rate'])} pass)"})
+    if credits and credits.get("spent") is not None:
+        meta.append({"label": "Credits", "value": (
+            f"{fmt_credits(credits['spent'])} spent of {fmt_credits(credits['budget_with_buffer'])}"
+        )})
+
+    document: dict[str, Any] = {
+        "title": title,
+        "subtitle": subtitle,
+        "date": date or long_date(datetime.date.today()),
+        "meta": meta,
+        "sections": sections,
+    }
+    if footer:
+        document["footer"] = footer
+    return document
+
+
+# ---------------------------------------------------------------------------
+# Output
+# ---------------------------------------------------------------------------
+
+
+def write_payload(payload: dict, out: TextIO, ndjson: bool) -> None:
+    if not ndjson:
+        json.dump(payload, out, indent=2, ensure_ascii=False)
+        out.write("\n")
+        return
+    document = dict(payload["document"])
+    sections = document.pop("sections")
+    out.write(json.dumps({**payload, "document": document}, ensure_ascii=False) + "\n")
+    for section in sections:
+        out.write(json.dumps(section, ensure_ascii=False) + "\n")
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Aggregate validator and budget output into a branded report payload.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument("--assets", action="append", default=[], metavar="PATH",
+                        help="validate_assets.py --json/--ndjson output (repeatable, '-' for stdin)")
+    parser.add_argument("--images", action="append", default=[], metavar="PATH",
+                        help="check_image_specs.py --json/--ndjson output (repeatable)")
+    parser.add_argument("--copy", action="append", default=[], metavar="PATH",
+                        help="validate_copy_lengths.py --json/--ndjson output (repeatable)")
+    parser.add_argument("--budget", metavar="PATH", help="calculate_budget.py --json output")
+    parser.add_argument("--ledger", metavar="PATH", help="credit_ledger.py status --json output")
+    parser.add_argument("--brand", metavar="PATH",
+                        help="Brand JSON object; included so the output feeds generate_branded_docx.py directly")
+    parser.add_argument("--title", default="Campaign Report", help="Report title")
+    parser.add_argument("--subtitle", default="Production QA and credit usage", help="Report subtitle")
+    parser.add_argument("--date", help="Report date (default: today)")
+    parser.add_argument("--footer", help="Closing footer text")
+    parser.add_argument("--ndjson", action="store_true",
+                        help="Write a header line then one section per line (for generate_branded_docx.py --stream)")
+    parser.add_argument("--output", "-o", metavar="PATH", help="Write to PATH instead of stdout")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    if not (args.assets or args.images or args.copy or args.budget or args.ledger):
+        print("Error: give at least one of --assets, --images, --copy, --budget, --ledger",
+              file=sys.stderr)
+        return 2
+    stdin_uses = sum(p == "-" for p in args.assets + args.images + args.copy + [args.budget, args.ledger])
+    if stdin_uses > 1:
+        print("Error: only one input can be read from stdin", file=sys.stderr)
+        return 2
+
+    try:
+        assets = aggregate_assets(iter_sources(args.assets)) if args.assets else None
+        images = aggregate_images(iter_sources(args.images)) if args.images else None
+        copy = aggregate_copy(iter_sources(args.copy)) if args.copy else None
+        budget = load_json(args.budget) if args.budget else None
+        ledger = load_json(args.ledger) if args.ledger else None
+        brand = load_json(args.brand) if args.brand else None
+    except (OSError, ValueError) as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return 2
+
+    credits = credit_variance(budget, ledger) if (budget or ledger) else None
+    document = build_document(
+        assets, images, copy, credits,
+        title=args.title,
+        subtitle=args.subtitle,
+        date=args.date,
+        client=(brand or {}).get("client_name"),
+        footer=args.footer,
+    )
+    payload = {"brand": brand, "document": document} if brand else {"document": document}
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as out:
+            write_payload(payload, out, args.ndjson)
+    else:
+        write_payload(payload, sys.stdout, args.ndjson)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
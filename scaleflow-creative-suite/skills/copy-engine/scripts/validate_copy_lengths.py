@@ -9,19 +9,42 @@ Reads an array of copy items (JSON) and checks each item's text length against
 the hard character limit for its declared platform. Produces a formatted report
 and exits with code 0 (all pass) or 1 (any fail).
 
+Length is measured the way each platform counts it (see PLATFORM_COUNTING):
+Twitter/X uses weighted counting (CJK and most non-Latin scripts count double,
+URLs count as 23, emoji as 2), Instagram and Threads count grapheme clusters,
+everything else counts code points.
+
 Usage examples:
     python validate_copy_lengths.py --input copy_items.json
     python validate_copy_lengths.py --input copy_items.json --strict
     python validate_copy_lengths.py --input copy_items.json --json
+    python validate_copy_lengths.py --input copy_items.json --ndjson
     cat copy_items.json | python validate_copy_lengths.py
+    cat huge_export.ndjson | python validate_copy_lengths.py --stream --ndjson
+
+With --stream the input is parsed incrementally: either a top-level JSON array
+read one item at a time, or NDJSON (one object per line). Combined with
+--ndjson (or the text report) memory stays flat regardless of input size.
 """
 
 from __future__ import annotations
 
 import argparse
 import json
+import re
 import sys
-from typing import Any
+import unicodedata
+from bisect import bisect_right
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, TextIO
+
+# Shared helpers live in <marketplace root>/shared
+SHARED_DIR = Path(__file__).resolve().parents[4] / "shared"
+if str(SHARED_DIR) not in sys.path:
+    sys.path.append(str(SHARED_DIR))
+
+from scaleflow.jsonstream import iter_json_values  # noqa: E402
 
 # ---------------------------------------------------------------------------
 # Platform character limits
@@ -52,8 +75,228 @@ PLATFORM_LIMITS: dict[str, int] = {
     "sms": 160,
 }
 
+# How each platform measures length; platforms not listed use "code_points".
+# Measurers are registered in MEASURERS below.
+PLATFORM_COUNTING: dict[str, str] = {
+    "instagram_feed": "graphemes",
+    "instagram_story": "graphemes",
+    "instagram_reel": "graphemes",
+    "instagram_bio": "graphemes",
+    "threads": "graphemes",
+    "twitter": "twitter_weighted",
+}
+
 STRICT_THRESHOLD = 0.80  # Warn when usage exceeds 80 %
 
+BATCH_SIZE = 8192  # Items validated together by validate_batch()
+STREAM_READ_SIZE = 1 << 16  # Characters read per refill when --stream is used
+STREAM_BATCH_SIZE = 256  # Smaller batches with --stream so output keeps up with input
+
+# ---------------------------------------------------------------------------
+# Length measurement
+# ---------------------------------------------------------------------------
+
+# Grapheme break classes (a subset of UAX #29 sufficient for copy text)
+_GB_OTHER, _GB_EXTEND, _GB_ZWJ, _GB_RI, _GB_PICTO, _GB_CR, _GB_LF = range(7)
+
+# Sorted, non-overlapping (start, end, class) code point ranges. Combining
+# marks (categories Mn/Me/Mc) are classified through unicodedata instead.
+_GB_RANGES: list[tuple[int, int, int]] = sorted([
+    (0x000A, 0x000A, _GB_LF), (0x000D, 0x000D, _GB_CR),
+    (0x00A9, 0x00A9, _GB_PICTO), (0x00AE, 0x00AE, _GB_PICTO),
+    (0x1160, 0x11FF, _GB_EXTEND),  # Hangul medial vowels / final consonants
+    (0x200C, 0x200C, _GB_EXTEND), (0x200D, 0x200D, _GB_ZWJ),
+    (0x203C, 0x203C, _GB_PICTO), (0x2049, 0x2049, _GB_PICTO),
+    (0x2122, 0x2122, _GB_PICTO), (0x2139, 0x2139, _GB_PICTO),
+    (0x2194, 0x2199, _GB_PICTO), (0x21A9, 0x21AA, _GB_PICTO),
+    (0x231A, 0x231B, _GB_PICTO), (0x2328, 0x2328, _GB_PICTO),
+    (0x23CF, 0x23CF, _GB_PICTO), (0x23E9, 0x23F3, _GB_PICTO),
+    (0x23F8, 0x23FA, _GB_PICTO), (0x24C2, 0x24C2, _GB_PICTO),
+    (0x25AA, 0x25AB, _GB_PICTO), (0x25B6, 0x25B6, _GB_PICTO),
+    (0x25C0, 0x25C0, _GB_PICTO), (0x25FB, 0x25FE, _GB_PICTO),
+    (0x2600, 0x27BF, _GB_PICTO), (0x2934, 0x2935, _GB_PICTO),
+    (0x2B05, 0x2B07, _GB_PICTO), (0x2B1B, 0x2B1C, _GB_PICTO),
+    (0x2B50, 0x2B50, _GB_PICTO), (0x2B55, 0x2B55, _GB_PICTO),
+    (0x3030, 0x3030, _GB_PICTO), (0x303D, 0x303D, _GB_PICTO),
+    (0x3297, 0x3297, _GB_PICTO), (0x3299, 0x3299, _GB_PICTO),
+    (0xD7B0, 0xD7FF, _GB_EXTEND),  # Hangul Jamo Extended-B
+    (0xFE00, 0xFE0F, _GB_EXTEND),  # variation selectors
+    (0x1F000, 0x1F0FF, _GB_PICTO), (0x1F10D, 0x1F10F, _GB_PICTO),
+    (0x1F12F, 0x1F12F, _GB_PICTO), (0x1F16C, 0x1F171, _GB_PICTO),
+    (0x1F17E, 0x1F17F, _GB_PICTO), (0x1F18E, 0x1F18E, _GB_PICTO),
+    (0x1F191, 0x1F19A, _GB_PICTO), (0x1F1AD, 0x1F1E5, _GB_PICTO),
+    (0x1F1E6, 0x1F1FF, _GB_RI),  # regional indicators (flags)
+    (0x1F201, 0x1F20F, _GB_PICTO), (0x1F21A, 0x1F21A, _GB_PICTO),
+    (0x1F22F, 0x1F22F, _GB_PICTO), (0x1F232, 0x1F23A, _GB_PICTO),
+    (0x1F23C, 0x1F23F, _GB_PICTO), (0x1F249, 0x1F3FA, _GB_PICTO),
+    (0x1F3FB, 0x1F3FF, _GB_EXTEND),  # skin tone modifiers
+    (0x1F400, 0x1F53D, _GB_PICTO), (0x1F546, 0x1F64F, _GB_PICTO),
+    (0x1F680, 0x1F6FF, _GB_PICTO), (0x1F774, 0x1F77F, _GB_PICTO),
+    (0x1F7D5, 0x1F7FF, _GB_PICTO), (0x1F80C, 0x1F80F, _GB_PICTO),
+    (0x1F848, 0x1F84F, _GB_PICTO), (0x1F85A, 0x1F85F, _GB_PICTO),
+    (0x1F888, 0x1F88F, _GB_PICTO), (0x1F8AE, 0x1F8FF, _GB_PICTO),
+    (0x1F90C, 0x1F93A, _GB_PICTO), (0x1F93C, 0x1F945, _GB_PICTO),
+    (0x1F947, 0x1FAFF, _GB_PICTO), (0x1FC00, 0x1FFFD, _GB_PICTO),
+    (0xE0020, 0xE007F, _GB_EXTEND),  # emoji tag sequences
+    (0xE0100, 0xE01EF, _GB_EXTEND),  # variation selectors supplement
+])
+_GB_STARTS = [start for start, _, _ in _GB_RANGES]
+_GB_CACHE: dict[str, int] = {}
+
+# Twitter/X weighted counting (twitter-text v3 config): code points in these
+# ranges weigh 1, everything else 2; URLs count as 23 and emoji as 2.
+_TWITTER_LIGHT_RANGES = [(0x0000, 0x10FF), (0x2000, 0x200D), (0x2010, 0x201F), (0x2032, 0x2037)]
+_TWITTER_LIGHT_STARTS = [start for start, _ in _TWITTER_LIGHT_RANGES]
+TWITTER_URL_LENGTH = 23
+TWITTER_EMOJI_WEIGHT = 2
+_KEYCAP = "\u20e3"  # COMBINING ENCLOSING KEYCAP
+_URL_RE = re.compile(r"(?:https?://|www\.)\S+", re.IGNORECASE)
+_NON_ASCII_RUN = re.compile(r"[^\x00-\x7f]+")
+
+
+def _grapheme_class(ch: str) -> int:
+    """Return the grapheme break class of one character (memoised)."""
+    cls = _GB_CACHE.get(ch)
+    if cls is None:
+        cp = ord(ch)
+        i = bisect_right(_GB_STARTS, cp) - 1
+        if i >= 0 and cp <= _GB_RANGES[i][1]:
+            cls = _GB_RANGES[i][2]
+        elif unicodedata.category(ch) in ("Mn", "Me", "Mc"):
+            cls = _GB_EXTEND
+        else:
+            cls = _GB_OTHER
+        _GB_CACHE[ch] = cls
+    return cls
+
+
+def split_graphemes(text: str) -> list[str]:
+    """Split text into (extended) grapheme clusters.
+
+    Implements the UAX #29 rules that matter for copy: CR LF, combining
+    marks and other extenders, emoji ZWJ sequences and regional-indicator
+    flag pairs.
+    """
+    clusters: list[str] = []
+    start = 0
+    prev = None
+    ri_run = 0  # consecutive regional indicators in the current run
+    emoji_seq = False  # current cluster began with an emoji
+    for i, ch in enumerate(text):
+        cls = _grapheme_class(ch)
+        if prev is None:
+            join = False
+        elif prev == _GB_CR:
+            join = cls == _GB_LF
+        elif prev == _GB_LF:
+            join = False
+        elif cls in (_GB_EXTEND, _GB_ZWJ):
+            join = True
+        elif cls == _GB_PICTO and prev == _GB_ZWJ:
+            join = emoji_seq
+        elif cls == _GB_RI and prev == _GB_RI:
+            join = ri_run % 2 == 1
+        else:
+            join = False
+
+        if not join:
+            if prev is not None:
+                clusters.append(text[start:i])
+            start = i
+            emoji_seq = cls == _GB_PICTO
+        ri_run = ri_run + 1 if cls == _GB_RI else 0
+        prev = cls
+    if prev is not None:
+        clusters.append(text[start:])
+    return clusters
+
+
+def _non_ascii_runs(text: str) -> Iterator[str]:
+    """Yield each run of non-ASCII characters, prefixed by the character
+    before it (if any) so grapheme rules see the right context.
+
+    No ASCII character can join a cluster that started on a non-ASCII one
+    (CR LF aside), so segmenting just these runs is exact and the ASCII
+    stretches between them can be counted with ``len``.
+    """
+    for m in _NON_ASCII_RUN.finditer(text):
+        start = m.start()
+        yield text[start - 1 if start else 0:m.end()]
+
+
+def count_code_points(text: str) -> int:
+    """Plain code point count (Python ``len``)."""
+    return len(text)
+
+
+def count_graphemes(text: str) -> int:
+    """Count user-perceived characters (grapheme clusters)."""
+    # Only CR LF combines in ASCII
+    total = len(text) - text.count("\r\n")
+    if text.isascii():
+        return total
+    for run in _non_ascii_runs(text):
+        total -= len(run) - len(split_graphemes(run))
+    return total
+
+
+def _twitter_weight(text: str) -> int:
+    """Weighted length of URL-free text, following twitter-text v3."""
+    total = len(text)
+    for run in _non_ascii_runs(text):
+        total += _twitter_run_weight(run) - len(run)
+    return total
+
+
+def _twitter_run_weight(text: str) -> int:
+    """Weighted length of a short run, segmenting into grapheme clusters."""
+    total = 0
+    for cluster in split_graphemes(text):
+        # An emoji anywhere in the cluster, or a keycap ("1" U+FE0F U+20E3)
+        if _KEYCAP in cluster or any(
+            _grapheme_class(ch) in (_GB_PICTO, _GB_RI) for ch in cluster
+        ):
+            total += TWITTER_EMOJI_WEIGHT
+            continue
+        for ch in cluster:
+            cp = ord(ch)
+            i = bisect_right(_TWITTER_LIGHT_STARTS, cp) - 1
+            total += 1 if i >= 0 and cp <= _TWITTER_LIGHT_RANGES[i][1] else 2
+    return total
+
+
+def count_twitter_weighted(text: str) -> int:
+    """Twitter/X weighted length: CJK etc. count 2, URLs 23, emoji 2."""
+    has_url = "://" in text or "www." in text.lower()
+    if text.isascii():
+        if not has_url:
+            return len(text)
+        return len(text) + sum(
+            TWITTER_URL_LENGTH - (m.end() - m.start()) for m in _URL_RE.finditer(text)
+        )
+    text = unicodedata.normalize("NFC", text)
+    if not has_url:
+        return _twitter_weight(text)
+    total = 0
+    pos = 0
+    for m in _URL_RE.finditer(text):
+        total += _twitter_weight(text[pos:m.start()]) + TWITTER_URL_LENGTH
+        pos = m.end()
+    return total + _twitter_weight(text[pos:])
+
+
+MEASURERS: dict[str, Callable[[str], int]] = {
+    "code_points": count_code_points,
+    "graphemes": count_graphemes,
+    "twitter_weighted": count_twitter_weighted,
+}
+
+
+def measurer_for(platform: str) -> Callable[[str], int]:
+    """Return the length function used for a (normalised) platform key."""
+    return MEASURERS[PLATFORM_COUNTING.get(platform, "code_points")]
+
+
 # ---------------------------------------------------------------------------
 # Validation logic
 # ---------------------------------------------------------------------------
@@ -79,7 +322,7 @@ def validate_item(item: dict[str, Any], strict: bool = False) -> dict[str, Any]:
     label = item.get("label", "")
     fmt = item.get("format", "")
 
-    char_count = len(text)
+    char_count = measurer_for(platform)(text)
 
     if platform not in PLATFORM_LIMITS:
         return {
@@ -110,9 +353,88 @@ def validate_item(item: dict[str, Any], strict: bool = False) -> dict[str, Any]:
     return result
 
 
+def _validate_chunk(chunk: list[dict[str, Any]], strict: bool) -> list[dict[str, Any]]:
+    """Validate one chunk of items column by column."""
+    raw_platforms = [item.get("platform", "") for item in chunk]
+
+    # Normalise and look up each distinct platform string once per chunk
+    platform_of = {raw: raw.strip().lower() for raw in set(raw_platforms)}
+    limit_of = {raw: PLATFORM_LIMITS.get(key) for raw, key in platform_of.items()}
+    measure_of = {raw: measurer_for(key) for raw, key in platform_of.items()}
+
+    platforms = [platform_of[raw] for raw in raw_platforms]
+    limits = [limit_of[raw] for raw in raw_platforms]
+    if all(measure is count_code_points for measure in measure_of.values()):
+        counts = [len(item.get("text", "")) for item in chunk]
+    else:
+        counts = [
+            measure_of[raw](item.get("text", ""))
+            for raw, item in zip(raw_platforms, chunk)
+        ]
+    statuses = [
+        "UNKNOWN" if limit is None else ("PASS" if count <= limit else "FAIL")
+        for count, limit in zip(counts, limits)
+    ]
+
+    results = [
+        {
+            "platform": platform,
+            "format": item.get("format", ""),
+            "label": item.get("label", ""),
+            "char_count": char_count,
+            "limit": limit,
+            "status": status,
+        }
+        for item, platform, char_count, limit, status in zip(
+            chunk, platforms, counts, limits, statuses
+        )
+    ]
+
+    # Sparse fix-ups: unknown platforms and (in strict mode) near-limit passes
+    for result, status in zip(results, statuses):
+        if status == "UNKNOWN":
+            result["message"] = f"Unknown platform '{result['platform']}'"
+        elif strict and status == "PASS":
+            char_count, limit = result["char_count"], result["limit"]
+            if char_count > limit * STRICT_THRESHOLD:
+                result["warning"] = (
+                    f"Over {int(STRICT_THRESHOLD * 100)}% of limit ({char_count}/{limit})"
+                )
+    return results
+
+
+def validate_batch(
+    items: Iterable[dict[str, Any]],
+    strict: bool = False,
+    batch_size: int = BATCH_SIZE,
+) -> Iterator[dict[str, Any]]:
+    """Validate copy items in column-wise batches, yielding results lazily.
+
+    Items are pulled ``batch_size`` at a time and processed as columns:
+    each distinct platform string is normalised and its limit and length
+    measurer looked up once per chunk, then counts, limits and statuses are
+    built in single list passes. Results are identical to :func:`validate_item` and come back
+    in input order.
+    """
+    it = iter(items)
+    while True:
+        chunk = list(islice(it, batch_size))
+        if not chunk:
+            return
+        yield from _validate_chunk(chunk, strict)
+
+
 def validate_all(items: list[dict[str, Any]], strict: bool = False) -> list[dict[str, Any]]:
     """Validate a list of copy items."""
-    return [validate_item(item, strict=strict) for item in items]
+    results: list[dict[str, Any]] = []
+    for start in range(0, len(items), BATCH_SIZE):
+        results.extend(_validate_chunk(items[start:start + BATCH_SIZE], strict))
+    return results
+
+
+def iter_validate(items: Iterable[dict[str, Any]], strict: bool = False) -> Iterator[dict[str, Any]]:
+    """Lazily validate copy items, yielding one result per item."""
+    return validate_batch(items, strict=strict)
 
 # ---------------------------------------------------------------------------
 # Output formatters
@@ -120,15 +442,21 @@ def validate_all(items: list[dict[str, Any]], strict: bool = False) -> list[dict
 
 def format_report(results: list[dict[str, Any]]) -> str:
     """Return a human-readable validation report."""
-    lines: list[str] = []
-    lines.append("COPY LENGTH VALIDATION")
-    lines.append("\u2550" * 50)
+    return "\n".join(iter_report_lines(results))
+
+
+def iter_report_lines(results: Iterable[dict[str, Any]]) -> Iterator[str]:
+    """Yield the lines of the human-readable report as results arrive."""
+    yield "COPY LENGTH VALIDATION"
+    yield "\u2550" * 50
 
     pass_count = 0
     fail_count = 0
     unknown_count = 0
+    total = 0
 
     for r in results:
+        total += 1
         platform = r["platform"]
         label = r["label"] or r["format"] or "-"
         char_count = r["char_count"]
@@ -150,19 +478,18 @@ def format_report(results: list[dict[str, Any]]) -> str:
         else:
             detail = f"{char_count:>5} chars  (no limit found)"
 
-        lines.append(f"{icon} {platform:<20s} {label:<18s} {detail}")
+        yield f"{icon} {platform:<20s} {label:<18s} {detail}"
 
         if r.get("warning"):
-            lines.append(f"       WARNING: {r['warning']}")
+            yield f"       WARNING: {r['warning']}"
 
         if r.get("message"):
-            lines.append(f"       NOTE: {r['message']}")
+            yield f"       NOTE: {r['message']}"
 
-    lines.append("\u2500" * 50)
+    yield "\u2500" * 50
 
-    total = len(results)
     if fail_count == 0 and unknown_count == 0:
-        lines.append(f"Result: ALL PASSED ({pass_count}/{total})")
+        yield f"Result: ALL PASSED ({pass_count}/{total})"
     else:
         parts: list[str] = []
         if fail_count:
@@ -170,13 +497,11 @@ def format_report(results: list[dict[str, Any]]) -> str:
         if unknown_count:
             parts.append(f"{unknown_count} UNKNOWN")
         parts.append(f"{pass_count} passed")
-        lines.append(f"Result: {', '.join(parts)} (out of {total})")
+        yield f"Result: {', '.join(parts)} (out of {total})"
 
-    return "\n".join(lines)
 
-
-def format_json(results: list[dict[str, Any]]) -> str:
-    """Return machine-readable JSON output."""
+def build_json_report(results: list[dict[str, Any]]) -> dict[str, Any]:
+    """Return the --json report object for a list of results."""
     summary = {
         "total": len(results),
         "passed": sum(1 for r in results if r["status"] == "PASS"),
@@ -184,11 +509,34 @@ def format_json(results: list[dict[str, Any]]) -> str:
         "unknown": sum(1 for r in results if r["status"] == "UNKNOWN"),
         "all_passed": all(r["status"] == "PASS" for r in results),
     }
-    output = {
+    return {
         "summary": summary,
         "results": results,
     }
-    return json.dumps(output, indent=2)
+
+
+def format_json(results: list[dict[str, Any]]) -> str:
+    """Return machine-readable JSON output."""
+    return json.dumps(build_json_report(results), indent=2)
+
+
+def write_ndjson(results: Iterable[dict[str, Any]], out: TextIO = sys.stdout) -> dict[str, Any]:
+    """Write one compact JSON object per result as it arrives.
+
+    A final ``{"summary": {...}}`` record carries the same totals as
+    :func:`format_json`. Returns the summary dict.
+    """
+    summary: dict[str, Any] = {"total": 0, "passed": 0, "failed": 0, "unknown": 0}
+    status_keys = {"PASS": "passed", "FAIL": "failed", "UNKNOWN": "unknown"}
+    for r in results:
+        summary["total"] += 1
+        summary[status_keys[r["status"]]] += 1
+        out.write(json.dumps(r, separators=(",", ":")) + "\n")
+        out.flush()
+    summary["all_passed"] = summary["passed"] == summary["total"]
+    out.write(json.dumps({"summary": summary}, separators=(",", ":")) + "\n")
+    out.flush()
+    return summary
 
 # ---------------------------------------------------------------------------
 # CLI
@@ -209,17 +557,30 @@ def build_parser() -> argparse.ArgumentParser:
         help="Path to a JSON file containing an array of copy items. "
              "If omitted, reads from stdin.",
     )
-    parser.add_argument(
+    output_mode = parser.add_mutually_exclusive_group()
+    output_mode.add_argument(
         "--json",
         action="store_true",
         dest="json_output",
         help="Output results as machine-readable JSON.",
     )
+    output_mode.add_argument(
+        "--ndjson",
+        action="store_true",
+        dest="ndjson_output",
+        help="Stream one compact JSON object per item, then a summary record.",
+    )
     parser.add_argument(
         "--strict",
         action="store_true",
         help="Warn about items that exceed 80%% of the platform limit.",
     )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Parse the input incrementally (JSON array or NDJSON) instead of "
+             "loading it whole; results are written as items are read.",
+    )
     return parser
 
 
@@ -232,17 +593,64 @@ def load_input(path: str | None) -> list[dict[str, Any]]:
         data = json.load(sys.stdin)
 
     if not isinstance(data, list):
-        print("Error: input JSON must be an array of copy items.", file=sys.stderr)
-        sys.exit(2)
+        raise ValueError("input JSON must be an array of copy items.")
 
     return data
 
 
+def iter_json_items(fh: TextIO, read_size: int = STREAM_READ_SIZE) -> Iterator[Any]:
+    """Incrementally decode copy items from a text stream.
+
+    Accepts either a top-level JSON array, yielding its elements one at a
+    time, or NDJSON / concatenated JSON objects. Only the current item and
+    one read buffer are held in memory. Malformed input raises ValueError,
+    like :func:`load_input`.
+    """
+    for item in iter_json_values(fh, read_size, array_items=True):
+        if not isinstance(item, dict):
+            raise ValueError("input JSON must be an array of copy items or NDJSON objects.")
+        yield item
+
+
 def main() -> None:
     parser = build_parser()
     args = parser.parse_args()
 
-    items = load_input(args.input)
+    if args.stream:
+        fh = open(args.input, "r", encoding="utf-8") if args.input else sys.stdin
+        with fh:
+            statuses: set[str] = set()
+
+            def tracked() -> Iterator[dict[str, Any]]:
+                for r in validate_batch(
+                    iter_json_items(fh), strict=args.strict, batch_size=STREAM_BATCH_SIZE
+                ):
+                    statuses.add(r["status"])
+                    yield r
+
+            try:
+                if args.ndjson_output:
+                    write_ndjson(tracked())
+                elif args.json_output:
+                    print(format_json(list(tracked())))
+                else:
+                    for line in iter_report_lines(tracked()):
+                        print(line, flush=True)
+            except ValueError as exc:
+                print(f"Error: {exc}", file=sys.stderr)
+                sys.exit(2)
+        sys.exit(1 if statuses - {"PASS"} else 0)
+
+    try:
+        items = load_input(args.input)
+    except ValueError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        sys.exit(2)
+
+    if args.ndjson_output:
+        summary = write_ndjson(iter_validate(items, strict=args.strict))
+        sys.exit(0 if summary["all_passed"] else 1)
+
     results = validate_all(items, strict=args.strict)
 
     if args.json_output:
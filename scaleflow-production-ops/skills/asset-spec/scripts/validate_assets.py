@@ -7,19 +7,44 @@ Validates exported creative assets against an export specification table.
 Usage:
     python validate_assets.py --spec specs.json --assets ./exports/
     python validate_assets.py --spec specs.json --assets ./exports/ --json
+    python validate_assets.py --spec specs.json --assets ./exports/ --ndjson | tee results.ndjson
     python validate_assets.py --spec specs.json --assets ./exports/ --mapping mapping.json --verbose
+    python validate_assets.py --spec specs.json --assets ./exports/ --jobs 8
+    python validate_assets.py --spec specs.json --assets ./exports/ --no-cache
+    python validate_assets.py --spec specs.json --assets ./exports/ --recursive --exclude "*/_archive/*"
+
+Results are cached on disk (default: ~/.cache/scaleflow/validate_assets.sqlite3)
+keyed by file path, size, mtime and spec, so re-runs after a partial re-export
+only re-open the files that changed.
 """
 
 import argparse
 import fnmatch
+import hashlib
 import json
 import os
+import re
+import sqlite3
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from itertools import islice
 from pathlib import Path
+from typing import Iterable, Iterator
+
+# Shared helpers live in <marketplace root>/shared
+SHARED_DIR = Path(__file__).resolve().parents[4] / "shared"
+if str(SHARED_DIR) not in sys.path:
+    sys.path.append(str(SHARED_DIR))
+
+from scaleflow.scan import iter_files  # noqa: E402
 
 try:
     from PIL import Image
 except ImportError:
+    if __name__ != "__main__":
+        raise  # imported as a library: let the caller handle it
     print(
         "ERROR: Pillow is required. Install with: pip install Pillow>=10.0.0",
         file=sys.stderr,
@@ -65,15 +90,30 @@ COLOR_SPACE_MODES = {
 
 DIMENSION_TOLERANCE = 1  # pixels
 
+# Files pulled from the directory scan per validation batch (per worker)
+VALIDATION_BATCH_SIZE = 256
+
+# Result cache. Bump CACHE_VERSION whenever validate_asset() output changes.
+CACHE_VERSION = 2
+DEFAULT_CACHE_PATH = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "scaleflow"
+    / "validate_assets.sqlite3"
+)
+DEFAULT_CACHE_MAX_ENTRIES = 200_000
+
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
 
-def file_size_mb(path: Path) -> float:
-    """Return file size in megabytes."""
-    return path.stat().st_size / (1024 * 1024)
+def file_size_bytes(path: Path) -> int | None:
+    """Return file size in bytes, or None if the file cannot be read."""
+    try:
+        return path.stat().st_size
+    except OSError:
+        return None
 
 
 def is_video(path: Path) -> bool:
@@ -84,31 +124,277 @@ def canonical_format(path: Path) -> str:
     return FORMAT_ALIASES.get(path.suffix.lower(), path.suffix.lower().lstrip("."))
 
 
-def match_file_to_spec(filename: str, specs: list[dict], mapping: dict | None) -> dict | None:
-    """Return the first spec that matches the given filename."""
-    # Explicit mapping takes priority
-    if mapping and filename in mapping:
-        spec_name = mapping[filename]
-        for spec in specs:
-            if spec.get("asset_name") == spec_name:
-                return spec
+# ---------------------------------------------------------------------------
+# Spec matching
+# ---------------------------------------------------------------------------
+
+
+def _glob_span(pattern: str) -> tuple[int, int] | None:
+    """
+    Return (start of first wildcard, end of last wildcard) in a glob pattern,
+    or None if it is a plain literal. Follows fnmatch's rules, so an
+    unterminated ``[`` counts as a literal character.
+    """
+    first = last = None
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        end = None
+        if c in "*?":
+            end = i + 1
+        elif c == "[":
+            j = i + 1
+            if j < n and pattern[j] == "!":
+                j += 1
+            if j < n and pattern[j] == "]":
+                j += 1
+            close = pattern.find("]", j)
+            if close != -1:
+                end = close + 1
+        if end is None:
+            i += 1
+            continue
+        if first is None:
+            first = i
+        last = end
+        i = end
+    return None if first is None else (first, last)
+
+
+class _PatternPass:
+    """
+    One precedence tier of glob patterns, compiled for fast first-match lookup.
+
+    Patterns without wildcards go into an exact-name dict. The rest are
+    bucketed by their literal prefix (the text before the first wildcard) and
+    the literal extension they end with, if any. A filename can only match
+    patterns whose prefix it starts with, so lookup probes one bucket per
+    distinct prefix length instead of scanning every spec. The surviving
+    candidates are joined, in original spec order, into one alternation regex
+    that is compiled once per bucket combination and reused. Regex alternation
+    is tried left to right, so the lowest spec index still wins.
+    """
+
+    def __init__(self, entries: list[tuple[int, str]]) -> None:
+        self._exact: dict[str, int] = {}
+        self._buckets: dict[tuple[str | None, str], list[tuple[int, str]]] = {}
+        self._compiled: dict[tuple, tuple[re.Pattern, dict[int, int], int]] = {}
+
+        prefix_lengths: set[int] = set()
+        for idx, pattern in entries:
+            pattern = os.path.normcase(pattern)
+            span = _glob_span(pattern)
+            if span is None:
+                self._exact.setdefault(pattern, idx)
+                continue
+            prefix = pattern[: span[0]]
+            tail = pattern[span[1]:]
+            ext = tail[tail.rindex("."):] if "." in tail else None
+            prefix_lengths.add(len(prefix))
+            self._buckets.setdefault((ext, prefix), []).append(
+                (idx, fnmatch.translate(pattern))
+            )
+        self._prefix_lengths = sorted(prefix_lengths)
+
+    def match(self, filename: str) -> int | None:
+        """Return the lowest spec index whose pattern matches ``filename``."""
+        name = os.path.normcase(filename)
+        exact = self._exact.get(name)
+
+        dot = name.rfind(".")
+        ext = name[dot:] if dot != -1 else None
+        keys = []
+        for length in self._prefix_lengths:
+            if length > len(name):
+                break
+            prefix = name[:length]
+            for key in ((ext, prefix), (None, prefix)):
+                if key in self._buckets:
+                    keys.append(key)
+        if not keys:
+            return exact
+
+        bucket_set = tuple(keys)
+        compiled = self._compiled.get(bucket_set)
+        if compiled is None:
+            compiled = self._compile(bucket_set)
+        regex, slots, first_idx = compiled
+
+        if exact is not None and exact < first_idx:
+            return exact
+        m = regex.match(name)
+        if m is None:
+            return exact
+        # The outer wrapper group closes last, so lastindex identifies it
+        glob_idx = slots[m.lastindex]
+        return glob_idx if exact is None else min(exact, glob_idx)
+
+    def _compile(self, bucket_set: tuple) -> tuple[re.Pattern, dict[int, int], int]:
+        candidates: list[tuple[int, str]] = []
+        for key in bucket_set:
+            candidates.extend(self._buckets[key])
+        candidates.sort()
+
+        # Map each alternative's outer group number to its spec index,
+        # allowing for any groups the translated glob itself contains.
+        slots: dict[int, int] = {}
+        group = 1
+        for idx, rx in candidates:
+            slots[group] = idx
+            group += 1 + re.compile(rx).groups
+        regex = re.compile("|".join(f"({rx})" for _, rx in candidates))
+        compiled = (regex, slots, candidates[0][0])
+        self._compiled[bucket_set] = compiled
+        return compiled
+
+
+class SpecIndex:
+    """
+    Specs compiled once for repeated filename matching.
 
-    # Fall back to filename_pattern glob matching
-    for spec in specs:
-        pattern = spec.get("filename_pattern")
-        if pattern and fnmatch.fnmatch(filename, pattern):
-            return spec
-
-    # Try pattern matching with format extension appended
-    for spec in specs:
-        pattern = spec.get("filename_pattern")
-        fmt = spec.get("format", "")
-        if pattern:
-            pattern_with_ext = f"{pattern}.{fmt}"
-            if fnmatch.fnmatch(filename, pattern_with_ext):
+    Precedence is identical to a linear scan: explicit mapping by
+    ``asset_name`` first, then ``filename_pattern`` globs, then
+    ``filename_pattern`` with ``.format`` appended, each tier returning the
+    earliest matching spec.
+    """
+
+    def __init__(self, specs: list[dict]) -> None:
+        self.specs = specs
+        self._by_name: dict[str, dict] = {}
+        raw: list[tuple[int, str]] = []
+        with_ext: list[tuple[int, str]] = []
+        for idx, spec in enumerate(specs):
+            name = spec.get("asset_name")
+            if name is not None:
+                self._by_name.setdefault(name, spec)
+            pattern = spec.get("filename_pattern")
+            if pattern:
+                raw.append((idx, pattern))
+                with_ext.append((idx, f"{pattern}.{spec.get('format', '')}"))
+        self._passes = (_PatternPass(raw), _PatternPass(with_ext))
+
+    def match(self, filename: str, mapping: dict | None = None) -> dict | None:
+        """Return the first spec that matches the given filename."""
+        # Explicit mapping takes priority
+        if mapping and filename in mapping:
+            spec = self._by_name.get(mapping[filename])
+            if spec is not None:
                 return spec
 
-    return None
+        for tier in self._passes:
+            idx = tier.match(filename)
+            if idx is not None:
+                return self.specs[idx]
+        return None
+
+
+def match_file_to_spec(
+    filename: str, specs: list[dict] | SpecIndex, mapping: dict | None
+) -> dict | None:
+    """
+    Return the first spec that matches the given filename.
+
+    Pass a prebuilt SpecIndex when matching many files; a plain spec list is
+    compiled on every call.
+    """
+    index = specs if isinstance(specs, SpecIndex) else SpecIndex(specs)
+    return index.match(filename, mapping)
+
+
+# ---------------------------------------------------------------------------
+# Result cache
+# ---------------------------------------------------------------------------
+
+
+class ResultCache:
+    """
+    On-disk LRU cache of validate_asset() results, backed by SQLite.
+
+    Entries are keyed by a digest of (absolute path, size, mtime, optional
+    content hash, spec hash), so any change to the file or its spec is a miss.
+    Stale entries are never looked up again and age out through LRU eviction,
+    which keeps at most ``max_entries`` rows when the cache is closed.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+        hash_content: bool = False,
+    ) -> None:
+        self.path = path
+        self.max_entries = max_entries
+        self.hash_content = hash_content
+        self._touched: dict[str, float] = {}
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(path))
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "key TEXT PRIMARY KEY, result TEXT NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)"
+        )
+
+    def __enter__(self) -> "ResultCache":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def key(self, file_path: Path, spec: dict) -> str:
+        """Return the cache key for validating ``file_path`` against ``spec``."""
+        st = file_path.stat()
+        content_hash = ""
+        if self.hash_content:
+            digest = hashlib.sha256()
+            with open(file_path, "rb") as f:
+                for block in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(block)
+            content_hash = digest.hexdigest()
+        spec_hash = hashlib.sha256(
+            json.dumps(spec, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+        raw = "\0".join(
+            (
+                str(CACHE_VERSION),
+                str(file_path.resolve()),
+                str(st.st_size),
+                str(st.st_mtime_ns),
+                content_hash,
+                spec_hash,
+            )
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> dict | None:
+        row = self._db.execute(
+            "SELECT result FROM results WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        self._touched[key] = time.time()
+        return json.loads(row[0])
+
+    def put(self, key: str, result: dict) -> None:
+        self._db.execute(
+            "INSERT OR REPLACE INTO results (key, result, last_used) VALUES (?, ?, ?)",
+            (key, json.dumps(result), time.time()),
+        )
+
+    def close(self) -> None:
+        """Flush LRU timestamps, evict down to ``max_entries`` and close."""
+        self._db.executemany(
+            "UPDATE results SET last_used = ? WHERE key = ?",
+            ((used, key) for key, used in self._touched.items()),
+        )
+        self._db.execute(
+            "DELETE FROM results WHERE key NOT IN "
+            "(SELECT key FROM results ORDER BY last_used DESC LIMIT ?)",
+            (self.max_entries,),
+        )
+        self._db.commit()
+        self._db.close()
 
 
 # ---------------------------------------------------------------------------
@@ -122,16 +408,18 @@ def validate_asset(file_path: Path, spec: dict) -> dict:
 
     Returns a result dict with per-check outcomes.
     """
+    size_bytes = file_path.stat().st_size
     result = {
         "file": file_path.name,
         "spec_name": spec.get("asset_name", "Unknown"),
+        "file_size_bytes": size_bytes,
         "checks": [],
         "passed": True,
         "error": None,
     }
 
     checks = result["checks"]
-    actual_size_mb = file_size_mb(file_path)
+    actual_size_mb = size_bytes / (1024 * 1024)
 
     # ------------------------------------------------------------------
     # Format check
@@ -267,6 +555,129 @@ def validate_asset(file_path: Path, spec: dict) -> dict:
     return result
 
 
+def unmatched_result(filename: str, size_bytes: int | None = None) -> dict:
+    """Return the placeholder result recorded for a file with no matching spec."""
+    return {
+        "file": filename,
+        "spec_name": "UNMATCHED",
+        "file_size_bytes": size_bytes,
+        "checks": [],
+        "passed": False,
+        "error": "No matching spec found for this file.",
+    }
+
+
+def _validate_job(job: tuple[Path, dict]) -> dict:
+    """Process-pool entry point: unpack a (path, spec) pair for validate_asset."""
+    file_path, spec = job
+    return validate_asset(file_path, spec)
+
+
+def iter_results(
+    asset_files: Iterable[Path],
+    specs: list[dict],
+    mapping: dict | None,
+    jobs: int = 1,
+    cache: ResultCache | None = None,
+) -> Iterator[tuple[Path, dict | None]]:
+    """
+    Match and validate asset files, yielding (path, result) pairs.
+
+    Results come back in the same order as ``asset_files`` regardless of
+    ``jobs``. Files without a matching spec yield ``None`` as their result.
+    ``asset_files`` is consumed lazily in batches, so a streaming scan starts
+    producing results immediately and memory stays bounded by the batch size.
+    With ``jobs > 1`` the Pillow work runs in a process pool; spec matching
+    and cache lookups stay in the parent process since they are cheap.
+    """
+    index = SpecIndex(specs)
+    files = iter(asset_files)
+    batch_size = VALIDATION_BATCH_SIZE * max(jobs, 1)
+
+    with ExitStack() as stack:
+        pool = None
+        if jobs > 1:
+            pool = stack.enter_context(ProcessPoolExecutor(max_workers=jobs))
+
+        while True:
+            batch = list(islice(files, batch_size))
+            if not batch:
+                return
+
+            planned: list[tuple[Path, dict | None, str | None, dict | None]] = []
+            for path in batch:
+                spec = index.match(path.name, mapping)
+                key = cached = None
+                if spec is not None and cache is not None:
+                    key = cache.key(path, spec)
+                    cached = cache.get(key)
+                planned.append((path, spec, key, cached))
+
+            misses = [
+                (path, spec)
+                for path, spec, _, cached in planned
+                if spec is not None and cached is None
+            ]
+            if pool is not None and len(misses) > 1:
+                chunksize = max(1, min(64, len(misses) // (jobs * 4)))
+                validated = pool.map(_validate_job, misses, chunksize=chunksize)
+            else:
+                validated = map(_validate_job, misses)
+
+            for path, spec, key, result in planned:
+                if spec is None:
+                    yield path, None
+                    continue
+                if result is None:
+                    result = next(validated)
+                    if cache is not None:
+                        cache.put(key, result)
+                yield path, result
+
+
+def iter_directory_results(
+    assets_dir: Path,
+    specs: list[dict],
+    mapping: dict | None = None,
+    jobs: int = 1,
+    cache: ResultCache | None = None,
+    recursive: bool = False,
+    include: list[str] | None = None,
+    exclude: list[str] | None = None,
+    unmatched: list[str] | None = None,
+) -> Iterator[dict]:
+    """
+    Scan ``assets_dir`` and yield one result per supported file, in scan order.
+
+    With ``recursive`` the ``file`` field is the path relative to
+    ``assets_dir``. Files without a matching spec are appended by name to
+    ``unmatched`` when a list is given, otherwise yielded inline as
+    unmatched_result() records.
+    """
+    scanned = iter_files(
+        assets_dir,
+        IMAGE_EXTENSIONS | VIDEO_EXTENSIONS,
+        recursive=recursive,
+        include=include,
+        exclude=exclude,
+    )
+
+    def display_name(file_path: Path) -> str:
+        if recursive:
+            return file_path.relative_to(assets_dir).as_posix()
+        return file_path.name
+
+    for file_path, result in iter_results(scanned, specs, mapping, jobs=jobs, cache=cache):
+        if result is None:
+            if unmatched is not None:
+                unmatched.append(display_name(file_path))
+                continue
+            result = unmatched_result(display_name(file_path), file_size_bytes(file_path))
+        elif recursive:
+            result["file"] = display_name(file_path)
+        yield result
+
+
 # ---------------------------------------------------------------------------
 # Reporting
 # ---------------------------------------------------------------------------
@@ -275,13 +686,17 @@ SEPARATOR = "\u2550" * 50
 THIN_SEP = "\u2500" * 50
 
 
-def print_report(results: list[dict], verbose: bool = False) -> None:
-    """Print a human-readable validation report."""
+def print_report(results: Iterable[dict], verbose: bool = False) -> None:
+    """Print a human-readable validation report, one entry as each result arrives."""
     print()
     print("ASSET VALIDATION REPORT")
     print(SEPARATOR)
 
+    total = 0
+    passed = 0
     for res in results:
+        total += 1
+        passed += 1 if res["passed"] else 0
         print(f"File: {res['file']}")
         print(f"Spec: {res['spec_name']}")
 
@@ -297,20 +712,19 @@ def print_report(results: list[dict], verbose: bool = False) -> None:
             print(f"  {icon} {label + ':':13s} {chk['actual']} (expected {chk['expected']})")
 
         status = "PASSED" if res["passed"] else "FAILED"
-        print(f"  Status: {status}")
+        print(f"  Status: {status}", flush=True)
         print(THIN_SEP)
 
     # Summary
-    total = len(results)
-    passed = sum(1 for r in results if r["passed"])
     failed = total - passed
     print()
     print(f"Summary: {passed}/{total} assets passed, {failed} failed")
     print()
 
 
-def print_json_report(results: list[dict]) -> None:
+def print_json_report(results: Iterable[dict]) -> None:
     """Print machine-readable JSON report."""
+    results = list(results)
     report = {
         "total": len(results),
         "passed": sum(1 for r in results if r["passed"]),
@@ -320,6 +734,20 @@ def print_json_report(results: list[dict]) -> None:
     print(json.dumps(report, indent=2))
 
 
+def print_ndjson_report(results: Iterable[dict]) -> None:
+    """
+    Print one compact JSON object per result as it arrives, then a final
+    ``{"summary": {...}}`` record with the same totals as the JSON report.
+    """
+    total = passed = 0
+    for res in results:
+        total += 1
+        passed += 1 if res["passed"] else 0
+        print(json.dumps(res, separators=(",", ":")), flush=True)
+    summary = {"total": total, "passed": passed, "failed": total - passed}
+    print(json.dumps({"summary": summary}, separators=(",", ":")), flush=True)
+
+
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
@@ -344,20 +772,76 @@ def main() -> int:
         default=None,
         help="Optional JSON file mapping filenames to spec asset_name values.",
     )
-    parser.add_argument(
+    output_mode = parser.add_mutually_exclusive_group()
+    output_mode.add_argument(
         "--json",
         action="store_true",
         dest="json_output",
         help="Output results as JSON.",
     )
+    output_mode.add_argument(
+        "--ndjson",
+        action="store_true",
+        dest="ndjson_output",
+        help="Stream one JSON object per result as it completes, then a summary record.",
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",
         help="Show detailed output for all checks (including passing).",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes for image checks (default: 1, 0 = all CPUs).",
+    )
+    parser.add_argument(
+        "--recursive",
+        action="store_true",
+        help="Scan sub-directories of --assets as well.",
+    )
+    parser.add_argument(
+        "--include",
+        action="append",
+        metavar="GLOB",
+        help="Only validate files whose relative path or name matches GLOB (repeatable).",
+    )
+    parser.add_argument(
+        "--exclude",
+        action="append",
+        metavar="GLOB",
+        help="Skip files and directories whose relative path or name matches GLOB (repeatable).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-validate every file instead of reusing cached results.",
+    )
+    parser.add_argument(
+        "--cache",
+        default=str(DEFAULT_CACHE_PATH),
+        help=f"Path of the result cache database (default: {DEFAULT_CACHE_PATH}).",
+    )
+    parser.add_argument(
+        "--cache-max-entries",
+        type=int,
+        default=DEFAULT_CACHE_MAX_ENTRIES,
+        help=f"Evict least-recently-used results beyond this count (default: {DEFAULT_CACHE_MAX_ENTRIES}).",
+    )
+    parser.add_argument(
+        "--hash-content",
+        action="store_true",
+        help="Include a SHA-256 of file contents in the cache key (catches edits that keep size and mtime).",
+    )
 
     args = parser.parse_args()
 
+    if args.jobs < 0:
+        print("ERROR: --jobs must be 0 or a positive integer.", file=sys.stderr)
+        return 2
+    jobs = args.jobs or os.cpu_count() or 1
+
     # Load spec
     spec_path = Path(args.spec)
     if not spec_path.is_file():
@@ -395,64 +879,87 @@ def main() -> int:
         print(f"ERROR: Assets directory not found: {assets_dir}", file=sys.stderr)
         return 2
 
-    all_extensions = IMAGE_EXTENSIONS | VIDEO_EXTENSIONS
-    asset_files = sorted(
-        p for p in assets_dir.iterdir()
-        if p.is_file() and p.suffix.lower() in all_extensions
+    scanned = iter_files(
+        assets_dir,
+        IMAGE_EXTENSIONS | VIDEO_EXTENSIONS,
+        recursive=args.recursive,
+        include=args.include,
+        exclude=args.exclude,
     )
-
-    if not asset_files:
+    if next(scanned, None) is None:
         print("WARNING: No supported asset files found in the directory.", file=sys.stderr)
         return 0
 
-    # Validate each file
-    results: list[dict] = []
+    # Validate each file, streaming results into the report as they complete.
+    # Verbose mode reports unmatched files inline, otherwise they are
+    # collected and listed at the end.
     unmatched: list[str] = []
+    any_failed = False
 
-    for file_path in asset_files:
-        spec = match_file_to_spec(file_path.name, specs, mapping)
-        if spec is None:
-            unmatched.append(file_path.name)
-            if args.verbose:
-                results.append(
-                    {
-                        "file": file_path.name,
-                        "spec_name": "UNMATCHED",
-                        "checks": [],
-                        "passed": False,
-                        "error": "No matching spec found for this file.",
-                    }
-                )
-            continue
-
-        result = validate_asset(file_path, spec)
-        results.append(result)
+    cache = None
+    if not args.no_cache:
+        try:
+            cache = ResultCache(
+                Path(args.cache),
+                max_entries=args.cache_max_entries,
+                hash_content=args.hash_content,
+            )
+        except (sqlite3.Error, OSError) as exc:
+            print(f"WARNING: Result cache disabled: {exc}", file=sys.stderr)
+
+    def collect() -> Iterator[dict]:
+        nonlocal any_failed
+        for result in iter_directory_results(
+            assets_dir,
+            specs,
+            mapping,
+            jobs=jobs,
+            cache=cache,
+            recursive=args.recursive,
+            include=args.include,
+            exclude=args.exclude,
+            unmatched=None if args.verbose else unmatched,
+        ):
+            if args.verbose and result["spec_name"] == "UNMATCHED":
+                unmatched.append(result["file"])
+            any_failed = any_failed or not result["passed"]
+            yield result
+
+    def collect_with_unmatched() -> Iterator[dict]:
+        nonlocal any_failed
+        yield from collect()
+        if not args.verbose:
+            any_failed = any_failed or bool(unmatched)
+            yield from (
+                unmatched_result(name, file_size_bytes(assets_dir / name)) for name in unmatched
+            )
+
+    # Output. The cache is closed (committing what was validated) even if
+    # the report is cut short by an error or a closed pipe.
+    machine_output = args.json_output or args.ndjson_output
+    try:
+        if args.ndjson_output:
+            print_ndjson_report(collect_with_unmatched())
+        elif args.json_output:
+            print_json_report(collect_with_unmatched())
+        else:
+            print_report(collect(), verbose=args.verbose)
+    except BrokenPipeError:
+        # The reader stopped early (e.g. piped into head): exit quietly, and
+        # point stdout at devnull so the final flush cannot fail again
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    finally:
+        if cache is not None:
+            cache.close()
 
     # Report unmatched files
-    if unmatched and not args.json_output:
+    if unmatched and not machine_output:
         print(f"\nWARNING: {len(unmatched)} file(s) did not match any spec:", file=sys.stderr)
         for name in unmatched:
             print(f"  - {name}", file=sys.stderr)
 
-    # Output
-    if args.json_output:
-        if unmatched:
-            for name in unmatched:
-                results.append(
-                    {
-                        "file": name,
-                        "spec_name": "UNMATCHED",
-                        "checks": [],
-                        "passed": False,
-                        "error": "No matching spec found for this file.",
-                    }
-                )
-        print_json_report(results)
-    else:
-        print_report(results, verbose=args.verbose)
-
     # Exit code
-    any_failed = any(not r["passed"] for r in results)
     return 1 if any_failed else 0
 
 
@@ -6,22 +6,39 @@ Performs technical quality assurance checks on generated images,
 validating resolution, format, file size, DPI, color mode, and
 suggesting suitable platforms based on dimensions.
 
+By default images are only probed: size, mode, format and DPI come from the
+file header and EXIF without decoding pixel data. Pass --deep-verify to fully
+decode every image and catch truncated or corrupt files.
+
 Usage:
     python check_image_specs.py --images hero.png banner.jpg
     python check_image_specs.py --images ./output/ --min-width 1920 --min-height 1080
     python check_image_specs.py --images *.png --expected-format PNG --json
+    python check_image_specs.py --images ./masters/ --deep-verify
+    python check_image_specs.py --images ./exports/ --recursive --include "*_IG-*"
+    python check_image_specs.py --images ./exports/ --recursive --ndjson
 """
 
 import argparse
 import json
 import math
-import os
 import sys
+from itertools import chain
 from pathlib import Path
+from typing import Iterable, Iterator, TextIO
+
+# Shared helpers live in <marketplace root>/shared
+SHARED_DIR = Path(__file__).resolve().parents[4] / "shared"
+if str(SHARED_DIR) not in sys.path:
+    sys.path.append(str(SHARED_DIR))
+
+from scaleflow.scan import iter_files  # noqa: E402
 
 try:
     from PIL import Image
 except ImportError:
+    if __name__ != "__main__":
+        raise  # imported as a library: let the caller handle it
     print(
         "ERROR: Pillow is required. Install with: pip install -r requirements.txt",
         file=sys.stderr,
@@ -48,6 +65,10 @@ PLATFORM_DIMENSIONS = {
 
 IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp", ".tiff", ".tif", ".bmp"}
 
+# Verification levels reported on every result
+VERIFY_PROBE = "probe"  # header + EXIF only
+VERIFY_DEEP = "deep"    # full pixel decode
+
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -133,23 +154,28 @@ def suggest_platforms(width: int, height: int) -> list[str]:
     return PLATFORM_DIMENSIONS.get((width, height), [])
 
 
-def collect_image_paths(paths: list[str]) -> list[Path]:
+def iter_image_paths(
+    paths: list[str],
+    recursive: bool = False,
+    include: list[str] | None = None,
+    exclude: list[str] | None = None,
+) -> Iterator[Path]:
     """
-    Given a list of file/directory paths, return a flat list of image file
-    Paths. Directories are scanned (non-recursively) for image extensions.
+    Lazily yield image file Paths from a list of file/directory paths.
+    Directories are scanned for image extensions, descending into
+    sub-directories when ``recursive`` is set. Explicit file paths are
+    always yielded as given.
     """
-    result: list[Path] = []
     for p_str in paths:
         p = Path(p_str)
         if p.is_dir():
-            for child in sorted(p.iterdir()):
-                if child.is_file() and child.suffix.lower() in IMAGE_EXTENSIONS:
-                    result.append(child)
+            yield from iter_files(
+                p, IMAGE_EXTENSIONS, recursive=recursive, include=include, exclude=exclude
+            )
         elif p.is_file():
-            result.append(p)
+            yield p
         else:
             print(f"WARNING: path does not exist, skipping: {p}", file=sys.stderr)
-    return result
 
 
 # ---------------------------------------------------------------------------
@@ -162,12 +188,18 @@ def check_image(
     max_file_size_mb: float,
     expected_format: str | None,
     min_dpi: int,
+    deep_verify: bool = False,
 ) -> dict:
     """
     Run all QA checks on a single image file and return a results dict.
+
+    Metadata is read from the header only unless ``deep_verify`` is set, in
+    which case the pixel data is fully decoded to catch corruption. The level
+    used is recorded under ``verification``.
     """
     result: dict = {
         "file": str(filepath),
+        "verification": VERIFY_DEEP if deep_verify else VERIFY_PROBE,
         "error": None,
         "dimensions": None,
         "aspect_ratio": None,
@@ -191,14 +223,35 @@ def check_image(
         result["error"] = f"Cannot read file: {exc}"
         return result
 
-    # Open image
+    # Open image (Image.open only parses the header; pixels load lazily)
     try:
         img = Image.open(filepath)
-        img.load()  # force full decode to catch corruption
     except Exception as exc:
         result["error"] = f"Cannot open image: {exc}"
         return result
 
+    with img:
+        if deep_verify:
+            try:
+                img.load()  # force full decode to catch corruption
+            except Exception as exc:
+                result["error"] = f"Cannot decode image: {exc}"
+                return result
+        return _fill_checks(result, img, size_mb, min_width, min_height,
+                            max_file_size_mb, expected_format, min_dpi)
+
+
+def _fill_checks(
+    result: dict,
+    img: Image.Image,
+    size_mb: float,
+    min_width: int,
+    min_height: int,
+    max_file_size_mb: float,
+    expected_format: str | None,
+    min_dpi: int,
+) -> dict:
+    """Populate metadata and pass/fail checks on ``result`` from an open image."""
     width, height = img.size
     result["dimensions"] = {"width": width, "height": height}
     result["aspect_ratio"] = compute_aspect_ratio(width, height)
@@ -277,6 +330,7 @@ def format_text_report(results: list[dict]) -> str:
         lines.append("\u2550" * 50)
 
         lines.append(f"File: {r['file']}")
+        lines.append(f"  Verification:  {r.get('verification', VERIFY_PROBE)}")
 
         if r["error"]:
             lines.append(f"  ERROR: {r['error']}")
@@ -352,9 +406,9 @@ def format_text_report(results: list[dict]) -> str:
     return "\n".join(lines)
 
 
-def format_json_report(results: list[dict]) -> str:
-    """Format results as a JSON string."""
-    report = {
+def build_json_report(results: list[dict]) -> dict:
+    """Return the --json report object for a list of results."""
+    return {
         "report": "IMAGE TECHNICAL QA REPORT",
         "images": results,
         "summary": {
@@ -364,7 +418,27 @@ def format_json_report(results: list[dict]) -> str:
             "skipped": sum(1 for r in results if r["status"] == "SKIPPED"),
         },
     }
-    return json.dumps(report, indent=2)
+
+
+def format_json_report(results: list[dict]) -> str:
+    """Format results as a JSON string."""
+    return json.dumps(build_json_report(results), indent=2)
+
+
+def write_ndjson_report(results: Iterable[dict], out: TextIO = sys.stdout) -> dict:
+    """
+    Write one compact JSON object per result as it arrives, followed by a
+    ``{"summary": {...}}`` record. Returns the summary dict.
+    """
+    summary = {"total": 0, "passed": 0, "failed": 0, "skipped": 0}
+    for r in results:
+        summary["total"] += 1
+        summary[r["status"].lower()] += 1
+        out.write(json.dumps(r, separators=(",", ":")) + "\n")
+        out.flush()
+    out.write(json.dumps({"summary": summary}, separators=(",", ":")) + "\n")
+    out.flush()
+    return summary
 
 
 # ---------------------------------------------------------------------------
@@ -418,43 +492,86 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         help="Minimum DPI (default: 72).",
     )
     parser.add_argument(
+        "--recursive",
+        action="store_true",
+        help="Descend into sub-directories of any directory given to --images.",
+    )
+    parser.add_argument(
+        "--include",
+        action="append",
+        metavar="GLOB",
+        help="Only check files whose relative path or name matches GLOB (repeatable).",
+    )
+    parser.add_argument(
+        "--exclude",
+        action="append",
+        metavar="GLOB",
+        help="Skip files and directories whose relative path or name matches GLOB (repeatable).",
+    )
+    parser.add_argument(
+        "--deep-verify",
+        action="store_true",
+        help="Fully decode every image to detect corruption (slower; default reads headers only).",
+    )
+    output_mode = parser.add_mutually_exclusive_group()
+    output_mode.add_argument(
         "--json",
         action="store_true",
         dest="json_output",
         help="Output results in JSON format.",
     )
+    output_mode.add_argument(
+        "--ndjson",
+        action="store_true",
+        dest="ndjson_output",
+        help="Stream one JSON object per image as it is checked, then a summary record.",
+    )
     return parser.parse_args(argv)
 
 
 def main(argv: list[str] | None = None) -> int:
     args = parse_args(argv)
 
-    image_paths = collect_image_paths(args.images)
-
-    if not image_paths:
+    scanned = iter_image_paths(
+        args.images,
+        recursive=args.recursive,
+        include=args.include,
+        exclude=args.exclude,
+    )
+    first_path = next(scanned, None)
+    if first_path is None:
         print("ERROR: No image files found for the given input.", file=sys.stderr)
         return 1
-
-    results: list[dict] = []
-    for img_path in image_paths:
-        # Skip non-image files passed explicitly
-        if img_path.suffix.lower() not in IMAGE_EXTENSIONS:
-            print(
-                f"WARNING: '{img_path}' does not have a recognized image extension, skipping.",
-                file=sys.stderr,
+    image_paths = chain([first_path], scanned)
+
+    def iter_results() -> Iterator[dict]:
+        for img_path in image_paths:
+            # Skip non-image files passed explicitly
+            if img_path.suffix.lower() not in IMAGE_EXTENSIONS:
+                print(
+                    f"WARNING: '{img_path}' does not have a recognized image extension, skipping.",
+                    file=sys.stderr,
+                )
+                continue
+
+            yield check_image(
+                filepath=img_path,
+                min_width=args.min_width,
+                min_height=args.min_height,
+                max_file_size_mb=args.max_file_size_mb,
+                expected_format=args.expected_format,
+                min_dpi=args.min_dpi,
+                deep_verify=args.deep_verify,
             )
-            continue
 
-        result = check_image(
-            filepath=img_path,
-            min_width=args.min_width,
-            min_height=args.min_height,
-            max_file_size_mb=args.max_file_size_mb,
-            expected_format=args.expected_format,
-            min_dpi=args.min_dpi,
-        )
-        results.append(result)
+    if args.ndjson_output:
+        summary = write_ndjson_report(iter_results())
+        if not summary["total"]:
+            print("ERROR: No valid image files to process.", file=sys.stderr)
+            return 1
+        return 1 if summary["failed"] else 0
 
+    results = list(iter_results())
     if not results:
         print("ERROR: No valid image files to process.", file=sys.stderr)
         return 1
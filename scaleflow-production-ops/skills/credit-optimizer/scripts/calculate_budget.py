@@ -3,12 +3,23 @@
 ScaleFlow Credit Budget Calculator
 
 Calculates estimated Weavy AI credit costs for a project based on deliverables.
-Reads the credit table from references/weavy-credit-table.md and produces a
-formatted budget breakdown.
+Prices come from the per-plan CREDIT_COSTS. A table given with --credit-table
+holds your own prices in plan credits and overrides CREDIT_COSTS for every
+model it lists. references/weavy-credit-table.md has one "Credits" column in
+a different unit, so it is never read unless passed that way. The parsed
+table is cached as a compiled index, rebuilt whenever the markdown changes.
 
 Usage:
     python scripts/calculate_budget.py --plan starter --deliverables deliverables.txt
     python scripts/calculate_budget.py --plan professional --interactive
+    python scripts/calculate_budget.py --batch portfolio.json
+    python scripts/calculate_budget.py --credit-table my-prices.md --deliverables deliverables.txt
+    python scripts/calculate_budget.py --plan team --deliverables deliverables.txt --simulate 1e6
+    python scripts/calculate_budget.py --deliverables deliverables.txt --simulate 1e6 --history history.json
+    python scripts/calculate_budget.py --deliverables deliverables.txt --candidates candidates.json
+    python scripts/calculate_budget.py --plan team --deliverables deliverables.txt \
+        --candidates candidates.json --optimize quality --min-quality 3
+    python scripts/calculate_budget.py --plan team --deliverables deliverables.txt --json > budget.json
 
 The deliverables file should list one deliverable per line in format:
     [count] x [type] using [model]
@@ -17,10 +28,71 @@ The deliverables file should list one deliverable per line in format:
     5 x social_static using ideogram_v3
     2 x video_15sec using kling_2_1
     1 x 3d_product using trellis_3d
+
+Spacing and case are free ("3X Hero_Image  USING flux_kontext"), "- " list
+markers and trailing "# comments" are ignored, and these forms can be mixed:
+    3,hero_image,flux_kontext                                    (CSV, ; or tab)
+    {"count": 3, "asset_type": "hero_image", "model": "flux_kontext"}
+    - count: 3                                                   (YAML-like)
+      asset_type: hero_image
+      model: flux_kontext
+A file that is a single JSON array of such objects works too. Lines that
+cannot be parsed and models with no price on the plan are reported with their
+line numbers; --strict turns them into errors.
+
+The batch file prices many projects against several plans and iteration
+scenarios in one pass. Projects are deliverables files (relative to the batch
+file) or inline lists of deliverable lines, checked and reported like
+--deliverables (inline lists are numbered by entry); each scenario overrides
+ITERATION_MULTIPLIERS for the asset types it names. "plans" defaults to all
+tiers and "scenarios" to the stock multipliers:
+    {
+      "plans": ["starter", "professional", "team"],
+      "scenarios": {"baseline": {}, "heavy": {"hero_image": 6, "video_15sec": 8}},
+      "projects": {
+        "spring": "spring-deliverables.txt",
+        "launch": ["3 x hero_image using flux_kontext", "2 x video_15sec using kling_2_1"]
+      }
+    }
+
+--simulate N replaces the fixed ITERATION_MULTIPLIERS average with a random
+iteration count per asset: 1 + Poisson(multiplier - 1), so the mean matches
+the multiplier. A history file maps asset types to observed iteration counts
+per asset and samples from those instead:
+    {"hero_image": [3, 4, 4, 6, 9], "video_15sec": [4, 5, 5, 7, 12]}
+
+--candidates picks the model for each deliverable line instead of pricing the
+one typed. The file lists allowed models per asset type with a quality score
+(higher is better) and, optionally, cheap draft models following the
+draft-to-final pattern (workflow-architect/references/pipeline-patterns.md):
+all iterations but the last run on the draft model, the final one on the
+chosen model. Asset types without candidates keep their typed model.
+    {
+      "candidates": {
+        "hero_image": {"flux_kontext": 3, "imagen_4": 4, "gpt_image_1": 5},
+        "video_15sec": {"kling_2_1": 5, "ltx_2_fast": 2}
+      },
+      "drafts": {"hero_image": ["flux_fast"], "video_15sec": ["ltx_2_fast"]}
+    }
+--optimize cost (default) takes the cheapest assignment meeting --min-quality;
+--optimize quality takes the best total quality whose total with buffer fits
+--cap (default: the plan's credits).
 """
 
 import argparse
+import hashlib
+import json
+import math
+import os
+import pickle
+import re
 import sys
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # only needed for --batch
+    np = None
 
 # Credit costs per model per plan tier
 CREDIT_COSTS = {
@@ -125,18 +197,172 @@ ITERATION_MULTIPLIERS = {
     "edit": 2,             # Edits may need refinement
 }
 
+DEFAULT_CREDIT_TABLE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "references", "weavy-credit-table.md",
+)
+CREDIT_INDEX_VERSION = 1
+CREDIT_INDEX_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "scaleflow",
+)
+
+# Model keys used in deliverables whose table name doesn't slug to the same key
+MODEL_ALIASES = {
+    "minimax_image": "minimax_image_01",
+    "gpt_image_edit": "gpt_image_1_edit",
+    "topaz_image_upscale": "topaz_upscale",
+    "topaz_video_upscale": "topaz_video_upscaler",
+    "trellis_3d": "trellis",
+    "rodin_3d": "rodin",
+}
+
+TABLE_ROW = re.compile(r"^\|\s*([^|]+?)\s*\|\s*(\d+(?:\.\d+)?)\s*\|\s*$")
+HEADING = re.compile(r"^##\s+(.+?)\s*$")
+
+# One pattern for every line-oriented deliverables form; the matching
+# alternative is told apart by which named groups are set.
+DELIVERABLE_LINE = re.compile(
+    r"""^\s*(?:-\s+)?(?:
+        (?P<count>\d+)\s*[x×]\s+(?P<type>[\w.-]+)\s+using\s+(?P<model>[\w.-]+)
+      | "?(?P<csv_count>\d+)"?\s*[,;\t]\s*"?(?P<csv_type>[\w.-]+)"?\s*[,;\t]\s*"?(?P<csv_model>[\w.-]+)"?
+      | (?P<key>count|asset_type|type|model)\s*:\s*["']?(?P<value>[\w.-]+)["']?
+      | (?P<header>count\s*[,;\t]\s*(?:asset_)?type\s*[,;\t]\s*model)
+      | (?P<blank>)
+    )\s*(?:\#.*)?$""",
+    re.IGNORECASE | re.VERBOSE,
+)
 
-def calculate_budget(deliverables, plan):
+# Trials simulated per block, bounding memory for --simulate 1e6 and beyond
+SIMULATION_CHUNK = 1 << 17
+
+# Most line × credit-step back-pointers --optimize quality may hold (2 bytes each)
+KNAPSACK_MAX_CELLS = 50_000_000
+
+_credit_indexes = {}
+
+
+def model_key(name):
+    """Slug a table model name: "Runway Gen-4 Image" -> "runway_gen4_image"."""
+    return re.sub(r"[^a-z0-9]+", "_", name.lower().replace("-", "")).strip("_")
+
+
+def parse_credit_table(filepath):
+    """Parse the markdown credit table into a compiled price index.
+
+    The index is a dict with a name -> slot mapping ("slots") into parallel
+    compact arrays/lists: "prices" (array of doubles), "names" (table display
+    names) and "categories" (the ## heading each model is listed under).
+    """
+    slots = {}
+    prices = array("d")
+    names = []
+    categories = []
+    category = None
+    with open(filepath, encoding="utf-8") as f:
+        for line in f:
+            heading = HEADING.match(line)
+            if heading:
+                category = heading.group(1)
+                continue
+            row = TABLE_ROW.match(line)
+            if not row:
+                continue
+            key = model_key(row.group(1))
+            if key in slots:
+                prices[slots[key]] = float(row.group(2))
+                continue
+            slots[key] = len(prices)
+            prices.append(float(row.group(2)))
+            names.append(row.group(1))
+            categories.append(category)
+    return {"slots": slots, "prices": prices, "names": names, "categories": categories}
+
+
+def load_credit_index(filepath=DEFAULT_CREDIT_TABLE, cache_dir=CREDIT_INDEX_DIR):
+    """Return the compiled index for a credit table, parsing it only when it changed.
+
+    The index is memoised per process and pickled to cache_dir keyed by the
+    table's path; the pickle is reused while the table's mtime and size match.
+    A missing or unwritable cache just means the markdown is parsed again.
+    """
+    path = os.path.abspath(filepath)
+    st = os.stat(path)
+    stamp = (CREDIT_INDEX_VERSION, path, st.st_mtime_ns, st.st_size)
+
+    cached = _credit_indexes.get(path)
+    if cached and cached["stamp"] == stamp:
+        return cached
+
+    cache_file = None
+    if cache_dir:
+        digest = hashlib.sha1(path.encode("utf-8")).hexdigest()[:16]
+        cache_file = os.path.join(cache_dir, f"credit-index-{digest}.pickle")
+        try:
+            with open(cache_file, "rb") as f:
+                cached = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+            cached = None
+        if isinstance(cached, dict) and cached.get("stamp") == stamp:
+            _credit_indexes[path] = cached
+            return cached
+
+    index = parse_credit_table(path)
+    index["stamp"] = stamp
+    _credit_indexes[path] = index
+    if cache_file:
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            tmp = f"{cache_file}.{os.getpid()}.tmp"
+            with open(tmp, "wb") as f:
+                pickle.dump(index, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, cache_file)
+        except OSError:
+            pass
+    return index
+
+
+def table_price(index, model):
+    """Look up a model's per-generation price in a credit index, or None."""
+    slot = index["slots"].get(MODEL_ALIASES.get(model, model))
+    if slot is None:
+        return None
+    price = index["prices"][slot]
+    return int(price) if price.is_integer() else price
+
+
+def plan_costs(plan, credit_table=None):
+    """Per-generation cost by model for a plan.
+
+    CREDIT_COSTS is priced per plan. A credit_table is the caller's own price
+    list in plan credits: it overrides CREDIT_COSTS for the models it lists
+    and adds the ones CREDIT_COSTS lacks. The bundled reference table is in a
+    different unit, so nothing is read from it unless it is passed explicitly.
+    """
+    costs = dict(CREDIT_COSTS.get(plan, CREDIT_COSTS["starter"]))
+    if not credit_table:
+        return costs
+    index = load_credit_index(credit_table)
+    for model in costs:
+        price = table_price(index, model)
+        if price is not None:
+            costs[model] = price
+    for key in index["slots"]:
+        costs.setdefault(key, table_price(index, key))
+    return costs
+
+
+def calculate_budget(deliverables, plan, credit_table=None):
     """Calculate total estimated credits for a list of deliverables."""
-    costs = CREDIT_COSTS.get(plan, CREDIT_COSTS["starter"])
+    costs = plan_costs(plan, credit_table)
     results = []
     total = 0
 
     for count, asset_type, model in deliverables:
         cost_per_gen = costs.get(model, 0)
         iterations = ITERATION_MULTIPLIERS.get(asset_type, 3)
-        line_total = count * cost_per_gen * iterations
-        total += line_total
+        line_total = round(count * cost_per_gen * iterations, 2)
+        total = round(total + line_total, 2)
         results.append({
             "count": count,
             "asset_type": asset_type,
@@ -159,6 +385,266 @@ def calculate_budget(deliverables, plan):
     }
 
 
+def calculate_budget_matrix(projects, plans=None, scenarios=None,
+                            credit_table=None):
+    """Price every project against every plan and iteration scenario at once.
+
+    projects maps a name to a deliverables list as accepted by
+    calculate_budget(); scenarios maps a name to ITERATION_MULTIPLIERS
+    overrides. Each distinct (asset_type, model) pair becomes one column, so
+    the whole matrix is a single contraction of a project × pair count matrix
+    with plan × pair prices and scenario × pair iterations. Returns the axis
+    names plus arrays shaped (projects, plans, scenarios) whose cells match
+    what calculate_budget() reports for that combination.
+    """
+    if np is None:
+        raise RuntimeError("numpy is required for batch budgets. Install with: pip install numpy")
+    plans = list(plans or CREDIT_COSTS)
+    scenarios = dict(scenarios or {"baseline": {}})
+    names = list(projects)
+
+    pairs = {}
+    cells = []
+    for row, name in enumerate(names):
+        for count, asset_type, model in projects[name]:
+            col = pairs.setdefault((asset_type, model), len(pairs))
+            cells.append((row, col, count))
+
+    counts = np.zeros((len(names), len(pairs)), dtype=np.int64)
+    if cells:
+        rows, cols, values = zip(*cells)
+        np.add.at(counts, (np.array(rows), np.array(cols)), np.array(values, dtype=np.int64))
+
+    plan_prices = [plan_costs(plan, credit_table) for plan in plans]
+    prices = np.array(
+        [[costs.get(model, 0) for _, model in pairs] for costs in plan_prices],
+    ).reshape(len(plans), len(pairs))
+    iterations = np.array(
+        [[{**ITERATION_MULTIPLIERS, **overrides}.get(asset_type, 3) for asset_type, _ in pairs]
+         for overrides in scenarios.values()],
+    ).reshape(len(scenarios), len(pairs))
+
+    total = np.einsum("pk,lk,sk->pls", counts, prices, iterations)
+    if total.dtype.kind == "f":
+        total = total.round(2)
+    buffer = (total * 0.2).astype(np.int64)
+    available = np.array([PLAN_CREDITS.get(plan, 1500) for plan in plans])[None, :, None]
+
+    return {
+        "projects": names,
+        "plans": plans,
+        "scenarios": list(scenarios),
+        "total": total,
+        "buffer": buffer,
+        "total_with_buffer": total + buffer,
+        "available": np.broadcast_to(available, total.shape),
+        "surplus_or_shortfall": available - (total + buffer),
+    }
+
+
+def simulate_budget(deliverables, plan, trials, history=None, seed=None,
+                    credit_table=None):
+    """Monte Carlo credit burn for a deliverables list over many trials.
+
+    Without history every asset needs 1 + Poisson(multiplier - 1) iterations.
+    A line of count assets therefore draws count + Poisson(count * (multiplier
+    - 1)) in total, and lines sharing a per-generation cost pool into one
+    Poisson column, so each trial costs a handful of draws whatever the
+    counts. Asset types with observed history draw how many of the line's
+    assets land on each observed count from a multinomial instead.
+    """
+    if np is None:
+        raise RuntimeError("numpy is required for --simulate. Install with: pip install numpy")
+    costs = plan_costs(plan, credit_table)
+    history = history or {}
+    rng = np.random.default_rng(seed)
+
+    fixed = 0
+    extra_rates = {}
+    empirical = []
+    for count, asset_type, model in deliverables:
+        cost = costs.get(model, 0)
+        if not count or not cost:
+            continue
+        observed = history.get(asset_type)
+        if observed:
+            values, freq = np.unique(np.asarray(observed, dtype=np.float64), return_counts=True)
+            empirical.append((count, cost * values, freq / freq.sum()))
+            continue
+        mean = ITERATION_MULTIPLIERS.get(asset_type, 3)
+        fixed += count * cost
+        extra_rates[cost] = extra_rates.get(cost, 0) + count * max(mean - 1, 0)
+
+    unit_costs = np.array(list(extra_rates), dtype=np.float64)
+    rates = np.array(list(extra_rates.values()), dtype=np.float64)
+    burn = np.empty(trials)
+    for start in range(0, trials, SIMULATION_CHUNK):
+        n = min(SIMULATION_CHUNK, trials - start)
+        block = np.full(n, float(fixed))
+        if len(rates):
+            block += rng.poisson(rates, size=(n, len(rates))) @ unit_costs
+        for count, line_costs, pvals in empirical:
+            block += rng.multinomial(count, pvals, size=n) @ line_costs
+        burn[start:start + n] = block
+
+    estimate = calculate_budget(deliverables, plan, credit_table)
+    available = PLAN_CREDITS.get(plan, 1500)
+    p50, p90, p99 = np.percentile(burn, [50, 90, 99])
+    return {
+        "trials": trials,
+        "mean": float(burn.mean()),
+        "p50": float(p50),
+        "p90": float(p90),
+        "p99": float(p99),
+        "estimate_with_buffer": estimate["total_with_buffer"],
+        "p_exceed_estimate": float((burn > estimate["total_with_buffer"]).mean()),
+        "available": available,
+        "p_exceed_available": float((burn > available).mean()),
+    }
+
+
+def model_options(count, asset_type, model, costs, candidates, drafts=None, min_quality=0):
+    """List the (line_total, quality, model, draft_model) choices for one line.
+
+    Choices are sorted cheapest first and pruned to the ones that buy more
+    quality than every cheaper choice, so a dominated model never reaches
+    the solver.
+    """
+    iterations = ITERATION_MULTIPLIERS.get(asset_type, 3)
+    allowed = candidates.get(asset_type)
+    if not allowed:
+        return [(round(count * costs.get(model, 0) * iterations, 2), 0, model, None)]
+
+    options = []
+    for final, quality in allowed.items():
+        price = costs.get(final)
+        if price is None or quality < min_quality:
+            continue
+        options.append((round(count * price * iterations, 2), quality, final, None))
+        if iterations < 2:
+            continue
+        for draft in (drafts or {}).get(asset_type, []):
+            draft_price = costs.get(draft)
+            if draft_price is not None and draft != final:
+                line_total = round(count * (draft_price * (iterations - 1) + price), 2)
+                options.append((line_total, quality, final, draft))
+    if not options:
+        raise ValueError(f"No priced candidate model for {asset_type} meets quality {min_quality}")
+
+    options.sort(key=lambda o: (o[0], -o[1]))
+    pruned = []
+    for option in options:
+        if not pruned or option[1] > pruned[-1][1]:
+            pruned.append(option)
+    return pruned
+
+
+def _best_quality_picks(lines, counts, cap):
+    """Multiple-choice knapsack: the option per line maximising quality within cap.
+
+    dp[t] is the best quality reachable at exactly t steps of credits, where
+    a step is the largest unit dividing every line total (so fractional
+    prices stay exact without inflating the table); one vector update per
+    option per line keeps hundreds of lines × dozens of models fast. Returns
+    None when no assignment fits; raises ValueError when the table would
+    exceed KNAPSACK_MAX_CELLS.
+    """
+    scale = 1
+    while scale < 100 and any(abs(o[0] * scale - round(o[0] * scale)) > 1e-9
+                              for options in lines for o in options):
+        scale *= 10
+    weights = [[int(round(o[0] * scale)) for o in options] for options in lines]
+    unit = math.gcd(*(w for row in weights for w in row)) or 1
+    weights = [[w // unit for w in row] for row in weights]
+    scale /= unit
+    # Totals above the dearest assignment are unreachable
+    size = min(int(cap * scale + 1e-9), sum(max(row) for row in weights)) + 1
+    if len(lines) * size > KNAPSACK_MAX_CELLS:
+        raise ValueError(
+            f"Credit cap {cap} is too fine-grained to optimise {len(lines)} lines for quality "
+            f"({size} steps of {1 / scale:g} credits); lower the cap or merge lines"
+        )
+
+    dp = np.full(size, -np.inf)
+    dp[0] = 0
+    choice = np.full((len(lines), size), -1, dtype=np.int16)
+    for i, options in enumerate(lines):
+        new = np.full(size, -np.inf)
+        pick = choice[i]
+        for j, (w, option) in enumerate(zip(weights[i], options)):
+            if w >= size:
+                continue
+            reach = dp[:size - w] + option[1] * counts[i]
+            better = reach > new[w:]
+            new[w:][better] = reach[better]
+            pick[w:][better] = j
+        dp = new
+
+    totals = np.arange(size) / scale
+    fits = (totals + np.floor(totals * 0.2) <= cap) & (dp > -np.inf)
+    if not fits.any():
+        return None
+    best = dp[fits].max()
+    t = int(np.flatnonzero(fits & (dp == best))[0])
+
+    picks = [0] * len(lines)
+    for i in range(len(lines) - 1, -1, -1):
+        picks[i] = int(choice[i, t])
+        t -= weights[i][picks[i]]
+    return picks
+
+
+def optimize_models(deliverables, plan, candidates, objective="cost", min_quality=0,
+                    drafts=None, cap=None, credit_table=None):
+    """Choose a model (and optional draft model) per line for a plan.
+
+    objective "cost" takes each line's cheapest choice meeting min_quality;
+    "quality" maximises the count-weighted quality score whose total with
+    buffer fits cap, falling back to the cheapest choices when nothing fits.
+    """
+    if objective == "quality" and np is None:
+        raise RuntimeError("numpy is required for --optimize quality. Install with: pip install numpy")
+    costs = plan_costs(plan, credit_table)
+    cap = PLAN_CREDITS.get(plan, 1500) if cap is None else cap
+    lines = [model_options(count, asset_type, model, costs, candidates, drafts, min_quality)
+             for count, asset_type, model in deliverables]
+
+    picks = None
+    if objective == "quality":
+        picks = _best_quality_picks(lines, [d[0] for d in deliverables], cap)
+    if picks is None:
+        picks = [0] * len(lines)
+
+    results = []
+    total = 0
+    quality = 0
+    for (count, asset_type, _), options, pick in zip(deliverables, lines, picks):
+        line_total, score, model, draft = options[pick]
+        total = round(total + line_total, 2)
+        quality += count * score
+        results.append({
+            "count": count,
+            "asset_type": asset_type,
+            "model": model,
+            "draft_model": draft,
+            "quality": score,
+            "iterations": ITERATION_MULTIPLIERS.get(asset_type, 3),
+            "line_total": line_total,
+        })
+
+    buffer = int(total * 0.2)
+    return {
+        "objective": objective,
+        "results": results,
+        "quality": quality,
+        "total": total,
+        "buffer": buffer,
+        "total_with_buffer": total + buffer,
+        "available": cap,
+        "surplus_or_shortfall": round(cap - (total + buffer), 2),
+    }
+
+
 def format_budget(budget, plan):
     """Format budget as readable text output."""
     lines = []
@@ -191,34 +677,360 @@ def format_budget(budget, plan):
     return "\n".join(lines)
 
 
-def parse_deliverables_file(filepath):
-    """Parse deliverables from a text file."""
+def format_assignment(assignment, plan):
+    """Format an optimize_models() result as readable text output."""
+    goal = "CHEAPEST" if assignment["objective"] == "cost" else "BEST QUALITY"
+    lines = []
+    lines.append(f"MODEL ASSIGNMENT — {plan.upper()} PLAN, {goal}")
+    lines.append(f"{'='*60}")
+    lines.append("")
+    lines.append(f"{'Deliverable':<20} {'Model (draft → final)':<28} {'Q':<3} {'Total':<8}")
+    lines.append(f"{'-'*60}")
+
+    for r in assignment["results"]:
+        model = f"{r['draft_model']} → {r['model']}" if r["draft_model"] else r["model"]
+        lines.append(
+            f"{r['count']}x {r['asset_type']:<16} {model:<28} "
+            f"{r['quality']:<3} {r['line_total']:<8}"
+        )
+
+    lines.append(f"{'-'*60}")
+    lines.append(f"{'Quality score:':<46} {assignment['quality']}")
+    lines.append(f"{'Estimated total:':<46} {assignment['total']}")
+    lines.append(f"{'Buffer (20%):':<46} {assignment['buffer']}")
+    lines.append(f"{'Total with buffer:':<46} {assignment['total_with_buffer']}")
+    lines.append(f"{'Credit cap:':<46} {assignment['available']}")
+    lines.append(f"{'-'*60}")
+
+    diff = assignment["surplus_or_shortfall"]
+    if diff >= 0:
+        lines.append(f"SURPLUS: {diff} credits remaining")
+    else:
+        lines.append(f"SHORTFALL: {abs(diff)} credits over the cap even with the cheapest models")
+        lines.append(f"Options: lower --min-quality, allow draft models, reduce scope, or top up")
+
+    return "\n".join(lines)
+
+
+def format_simulation(sim, plan):
+    """Format a simulate_budget() result as readable text output."""
+    lines = []
+    lines.append(f"CREDIT RISK SIMULATION — {plan.upper()} PLAN ({sim['trials']:,} trials)")
+    lines.append(f"{'='*60}")
+    lines.append(f"{'Mean credit burn:':<46} {sim['mean']:.0f}")
+    lines.append(f"{'P50 / P90 / P99:':<46} {sim['p50']:.0f} / {sim['p90']:.0f} / {sim['p99']:.0f}")
+    lines.append(f"{'Estimate with buffer:':<46} {sim['estimate_with_buffer']}")
+    lines.append(f"{'Chance of exceeding estimate:':<46} {sim['p_exceed_estimate']:.1%}")
+    lines.append(f"{'Available credits:':<46} {sim['available']}")
+    lines.append(f"{'Chance of exceeding plan credits:':<46} {sim['p_exceed_available']:.1%}")
+    return "\n".join(lines)
+
+
+def format_budget_matrix(matrix):
+    """Format a budget matrix as a compact table, one column per plan.
+
+    Each cell shows the total with buffer and the surplus (+) or shortfall (-)
+    against that plan's credits.
+    """
+    plans = matrix["plans"]
+    name_width = max([len("Project")] + [len(n) for n in matrix["projects"]]) + 2
+    scenario_width = max([len("Scenario")] + [len(s) for s in matrix["scenarios"]]) + 2
+    width = name_width + scenario_width + 18 * len(plans)
+
+    lines = []
+    lines.append(
+        f"BUDGET MATRIX — {len(matrix['projects'])} projects × "
+        f"{len(plans)} plans × {len(matrix['scenarios'])} scenarios"
+    )
+    lines.append("=" * width)
+    lines.append("")
+    lines.append(
+        f"{'Project':<{name_width}}{'Scenario':<{scenario_width}}"
+        + "".join(f"{plan:<18}" for plan in plans).rstrip()
+    )
+    lines.append("-" * width)
+
+    needed = matrix["total_with_buffer"]
+    diff = matrix["surplus_or_shortfall"]
+    for p, name in enumerate(matrix["projects"]):
+        for s, scenario in enumerate(matrix["scenarios"]):
+            row = f"{name:<{name_width}}{scenario:<{scenario_width}}"
+            for l in range(len(plans)):
+                cell = f"{needed[p, l, s]:.0f} ({diff[p, l, s]:+.0f})"
+                row += f"{cell:<18}"
+            lines.append(row.rstrip())
+
+    lines.append("-" * width)
+    fits = int((diff >= 0).sum())
+    lines.append(f"Fits within plan credits: {fits} of {diff.size} combinations")
+    return "\n".join(lines)
+
+
+def parse_deliverable_line(line):
+    """Parse one "[count] x [type] using [model]" or CSV line, or return None."""
+    m = DELIVERABLE_LINE.match(line)
+    if not m:
+        return None
+    if m.group("count"):
+        return (int(m.group("count")), m.group("type").lower(), m.group("model").lower())
+    if m.group("csv_count"):
+        return (int(m.group("csv_count")), m.group("csv_type").lower(), m.group("csv_model").lower())
+    return None
+
+
+def _deliverable_from_object(item):
+    """Build a deliverable tuple from a JSON/YAML-like mapping, or raise ValueError."""
+    if not isinstance(item, dict):
+        raise ValueError("expected an object with count, asset_type and model")
+    asset_type = item.get("asset_type", item.get("type"))
+    fields = (("count", item.get("count")), ("asset_type", asset_type), ("model", item.get("model")))
+    missing = [name for name, value in fields if value in (None, "")]
+    if missing:
+        raise ValueError(f"missing {', '.join(missing)}")
+    try:
+        count = int(item["count"])
+    except (TypeError, ValueError):
+        raise ValueError(f"count is not a whole number: {item['count']!r}") from None
+    return (count, str(asset_type).lower(), str(item["model"]).lower())
+
+
+def iter_deliverables(lines, problems):
+    """Stream deliverables from text lines in any of the supported forms.
+
+    Yields (lineno, (count, asset_type, model)). Lines that cannot be parsed
+    are appended to problems as (lineno, message) and skipped.
+    """
+    pending = None
+    pending_line = 0
+    pending_dashed = False
+
+    def flush():
+        if pending is None:
+            return None
+        try:
+            return _deliverable_from_object(pending)
+        except ValueError as e:
+            problems.append((pending_line, str(e)))
+            return None
+
+    for lineno, line in enumerate(lines, 1):
+        stripped = line.strip()
+        if stripped.startswith("{"):
+            try:
+                yield lineno, _deliverable_from_object(json.loads(stripped))
+            except json.JSONDecodeError as e:
+                problems.append((lineno, f"invalid JSON: {e.msg}"))
+            except ValueError as e:
+                problems.append((lineno, str(e)))
+            continue
+
+        m = DELIVERABLE_LINE.match(line)
+        if m is None:
+            problems.append((lineno, f"cannot parse: {stripped}"))
+            continue
+        if m.group("key"):
+            # A YAML-like item starts at "- key:", a repeated key, or an
+            # unindented key after a dashed item
+            dashed = stripped.startswith("-")
+            if (dashed or pending is None or m.group("key").lower() in pending
+                    or (pending_dashed and not line[:1].isspace())):
+                deliverable = flush()
+                if deliverable:
+                    yield pending_line, deliverable
+                pending, pending_line, pending_dashed = {}, lineno, dashed
+            pending[m.group("key").lower()] = m.group("value")
+            continue
+        if m.group("blank") is not None or m.group("header"):
+            continue
+
+        deliverable = flush()
+        if deliverable:
+            yield pending_line, deliverable
+        pending = None
+        yield lineno, parse_deliverable_line(line)
+
+    deliverable = flush()
+    if deliverable:
+        yield pending_line, deliverable
+
+
+def parse_deliverables_file(filepath, problems=None, known_models=None):
+    """Parse deliverables from a text file.
+
+    Unparseable lines and, when known_models is given, models outside it are
+    appended to problems as (lineno, message). A file holding one JSON array
+    is numbered by item instead of line.
+    """
+    if problems is None:
+        problems = []
+    # Read whole rather than peek and seek, so stdin and pipes work
+    with open(filepath, encoding="utf-8-sig") as f:
+        text = f.read()
+    if text.lstrip().startswith("["):
+        try:
+            items = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"{filepath}: invalid JSON at line {e.lineno}: {e.msg}") from None
+        numbered = []
+        for i, item in enumerate(items, 1):
+            try:
+                numbered.append((i, _deliverable_from_object(item)))
+            except ValueError as e:
+                problems.append((i, str(e)))
+    else:
+        numbered = iter_deliverables(text.splitlines(), problems)
+    deliverables = check_deliverables(numbered, problems, known_models)
+    problems.sort()
+    return deliverables
+
+
+def check_deliverables(numbered, problems, known_models=None):
+    """Keep the (lineno, deliverable) pairs with a count of at least 1.
+
+    Dropped lines and, when known_models is given, models outside it are
+    appended to problems as (lineno, message).
+    """
     deliverables = []
-    with open(filepath) as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-            parts = line.split(" x ")
-            if len(parts) == 2:
-                count = int(parts[0].strip())
-                rest = parts[1].split(" using ")
-                if len(rest) == 2:
-                    asset_type = rest[0].strip()
-                    model = rest[1].strip()
-                    deliverables.append((count, asset_type, model))
+    for lineno, deliverable in numbered:
+        if deliverable is None:
+            continue
+        if deliverable[0] < 1:
+            problems.append((lineno, "count must be at least 1"))
+            continue
+        if known_models is not None and deliverable[2] not in known_models:
+            problems.append((lineno, f"unknown model {deliverable[2]} (priced at 0)"))
+        deliverables.append(deliverable)
     return deliverables
 
 
+def load_batch_file(filepath, problems=None, credit_table=None):
+    """Load a batch file into (projects, plans, scenarios) for calculate_budget_matrix().
+
+    Deliverables problems are appended to problems as (source, lineno,
+    message), where source is the project's deliverables file, or
+    "<batch file>:<project>" for an inline list numbered by entry. Models
+    count as unknown when any of the batch's plans cannot price them.
+    """
+    if problems is None:
+        problems = []
+    with open(filepath) as f:
+        data = json.load(f)
+    base_dir = os.path.dirname(os.path.abspath(filepath))
+
+    plans = data.get("plans") or list(CREDIT_COSTS)
+    unknown = [plan for plan in plans if plan not in CREDIT_COSTS]
+    if unknown:
+        raise ValueError(f"Unknown plan(s) in batch file: {', '.join(unknown)}")
+    known_models = set.intersection(*(set(plan_costs(plan, credit_table)) for plan in plans))
+
+    projects = {}
+    for name, source in data.get("projects", {}).items():
+        found = []
+        if isinstance(source, str):
+            label = os.path.join(base_dir, source)
+            projects[name] = parse_deliverables_file(label, found, known_models)
+        else:
+            label = f"{filepath}:{name}"
+            # Inline entries are lines, objects or [count, asset_type, model] lists
+            lines = []
+            for entry in source:
+                if isinstance(entry, list):
+                    entry = dict(zip(("count", "asset_type", "model"), entry))
+                lines.append(entry if isinstance(entry, str) else json.dumps(entry))
+            projects[name] = check_deliverables(iter_deliverables(lines, found), found,
+                                                known_models)
+            found.sort()
+        problems.extend((label, lineno, message) for lineno, message in found)
+
+    return projects, plans, data.get("scenarios")
+
+
+def trial_count(value):
+    """argparse type for --simulate: accepts 1000000 or 1e6."""
+    try:
+        trials = int(float(value))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid trial count: {value}")
+    if trials < 1:
+        raise argparse.ArgumentTypeError("trial count must be at least 1")
+    return trials
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="ScaleFlow Credit Budget Calculator")
     parser.add_argument("--plan", choices=["starter", "professional", "team"],
                         default="starter", help="Weavy plan tier")
     parser.add_argument("--deliverables", help="Path to deliverables file")
+    parser.add_argument("--credit-table",
+                        help="Markdown price list, in plan credits, that overrides CREDIT_COSTS "
+                             "for the models it lists (default: CREDIT_COSTS only)")
+    parser.add_argument("--batch",
+                        help="JSON file of projects × plans × scenarios to price in one table")
+    parser.add_argument("--simulate", type=trial_count, metavar="N",
+                        help="Run N Monte Carlo trials of iteration counts (e.g. 1e6)")
+    parser.add_argument("--history",
+                        help="JSON of observed iteration counts per asset type for --simulate")
+    parser.add_argument("--seed", type=int, help="Random seed for --simulate")
+    parser.add_argument("--strict", action="store_true",
+                        help="Fail on unparseable deliverables lines or unknown models")
+    parser.add_argument("--candidates",
+                        help="JSON of candidate models per asset type to choose from")
+    parser.add_argument("--optimize", choices=["cost", "quality"], default="cost",
+                        help="With --candidates: cheapest assignment or best quality within the cap")
+    parser.add_argument("--min-quality", type=float, default=0,
+                        help="With --candidates: lowest acceptable quality score")
+    parser.add_argument("--cap", type=float,
+                        help="With --candidates: credit cap (default: the plan's credits)")
+    parser.add_argument("--json", action="store_true",
+                        help="Output the budget (and any assignment or simulation) as JSON")
     args = parser.parse_args()
+    credit_table = args.credit_table
+
+    if credit_table:
+        try:
+            load_credit_index(credit_table)
+        except OSError as e:
+            print(f"ERROR: Cannot read credit table: {e}", file=sys.stderr)
+            sys.exit(2)
+
+    if args.batch:
+        problems = []
+        try:
+            projects, plans, scenarios = load_batch_file(args.batch, problems, credit_table)
+        except (OSError, ValueError) as e:
+            print(f"ERROR: {e}", file=sys.stderr)
+            sys.exit(2)
+        level = "ERROR" if args.strict else "WARNING"
+        for source, lineno, message in problems:
+            print(f"{level}: {source}:{lineno}: {message}", file=sys.stderr)
+        if problems and args.strict:
+            sys.exit(2)
+        try:
+            matrix = calculate_budget_matrix(projects, plans, scenarios, credit_table)
+        except (OSError, ValueError, RuntimeError) as e:
+            print(f"ERROR: {e}", file=sys.stderr)
+            sys.exit(2)
+        if args.json:
+            print(json.dumps({key: value.tolist() if hasattr(value, "tolist") else value
+                              for key, value in matrix.items()}, indent=2))
+        else:
+            print(format_budget_matrix(matrix))
+        sys.exit(0)
 
     if args.deliverables:
-        deliverables = parse_deliverables_file(args.deliverables)
+        problems = []
+        try:
+            deliverables = parse_deliverables_file(
+                args.deliverables, problems, plan_costs(args.plan, credit_table)
+            )
+        except (OSError, ValueError) as e:
+            print(f"ERROR: {e}", file=sys.stderr)
+            sys.exit(2)
+        level = "ERROR" if args.strict else "WARNING"
+        for lineno, message in problems:
+            print(f"{level}: {args.deliverables}:{lineno}: {message}", file=sys.stderr)
+        if problems and args.strict:
+            sys.exit(2)
     else:
         # Example deliverables for demonstration
         deliverables = [
@@ -228,7 +1040,46 @@ if __name__ == "__main__":
             (1, "3d_product", "trellis_3d"),
             (6, "upscale", "topaz_image_upscale"),
         ]
-        print("No deliverables file specified. Using example project:\n")
+        print("No deliverables file specified. Using example project:\n",
+              file=sys.stderr if args.json else sys.stdout)
+
+    report = {"plan": args.plan}
+
+    if args.candidates:
+        try:
+            with open(args.candidates) as f:
+                options = json.load(f)
+            assignment = optimize_models(
+                deliverables, args.plan, options.get("candidates", {}), args.optimize,
+                args.min_quality, options.get("drafts"), args.cap, credit_table,
+            )
+        except (OSError, ValueError, RuntimeError) as e:
+            print(f"ERROR: {e}", file=sys.stderr)
+            sys.exit(2)
+        report["assignment"] = assignment
+        if not args.json:
+            print(format_assignment(assignment, args.plan))
+    else:
+        budget = calculate_budget(deliverables, args.plan, credit_table)
+        report["budget"] = budget
+        if not args.json:
+            print(format_budget(budget, args.plan))
+
+    if args.simulate:
+        try:
+            history = None
+            if args.history:
+                with open(args.history) as f:
+                    history = json.load(f)
+            sim = simulate_budget(deliverables, args.plan, args.simulate, history,
+                                  args.seed, credit_table)
+        except (OSError, ValueError, RuntimeError) as e:
+            print(f"ERROR: {e}", file=sys.stderr)
+            sys.exit(2)
+        report["simulation"] = sim
+        if not args.json:
+            print()
+            print(format_simulation(sim, args.plan))
 
-    budget = calculate_budget(deliverables, args.plan)
-    print(format_budget(budget, args.plan))
+    if args.json:
+        print(json.dumps(report, indent=2))
@@ -0,0 +1,416 @@
+#!/usr/bin/env python3
+"""
+ScaleFlow Credit Ledger
+
+Tracks actual Weavy AI credit spend during production against a budget from
+calculate_budget.py. Generation events are appended to a local SQLite ledger;
+running totals per deliverable line, per model and overall are updated in the
+same transaction, so "how much is left" is a single-row lookup however long
+the campaign runs. Every event also stores the cumulative spend after it,
+which lets tail show the live balance without rescanning the log.
+
+Usage:
+    python scripts/credit_ledger.py init --ledger spring.ledger --plan starter --deliverables deliverables.txt
+    python scripts/credit_ledger.py init --ledger spring.ledger --deliverables deliverables.txt --strict
+    python scripts/credit_ledger.py record --ledger spring.ledger --model flux_kontext --line 1
+    python scripts/credit_ledger.py record --ledger spring.ledger --model kling_2_1 --asset-type video_15sec --count 2
+    python scripts/credit_ledger.py record --ledger spring.ledger --events events.ndjson
+    python scripts/credit_ledger.py status --ledger spring.ledger
+    python scripts/credit_ledger.py tail --ledger spring.ledger -n 20 --follow
+
+Events omit --credits to be priced at the plan's per-generation cost for the
+model (times --count). An events file holds one JSON object per line with the
+same fields ("-" reads stdin):
+    {"model": "flux_kontext", "line": 1}
+    {"model": "kling_2_1", "asset_type": "video_15sec", "count": 2, "note": "client revision"}
+Events that name no planned line are matched to the first line with the same
+asset type and model, then the same asset type; anything else counts as
+unplanned spend.
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import time
+from datetime import datetime
+
+from calculate_budget import (
+    PLAN_CREDITS,
+    calculate_budget,
+    parse_deliverables_file,
+    plan_costs,
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS lines (
+    id INTEGER PRIMARY KEY, count INTEGER NOT NULL, asset_type TEXT NOT NULL,
+    model TEXT NOT NULL, budget REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS events (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT, ts REAL NOT NULL, line_id INTEGER,
+    model TEXT NOT NULL, count INTEGER NOT NULL, credits REAL NOT NULL,
+    balance REAL NOT NULL, note TEXT
+);
+CREATE TABLE IF NOT EXISTS totals (
+    scope TEXT NOT NULL, key TEXT NOT NULL, spent REAL NOT NULL, events INTEGER NOT NULL,
+    PRIMARY KEY (scope, key)
+);
+"""
+
+UPSERT_TOTAL = (
+    "INSERT INTO totals (scope, key, spent, events) VALUES (?, ?, ?, ?) "
+    "ON CONFLICT (scope, key) DO UPDATE SET "
+    "spent = spent + excluded.spent, events = events + excluded.events"
+)
+
+# Events committed per transaction when importing an events file
+RECORD_BATCH_SIZE = 10000
+
+
+class CreditLedger:
+    """Append-only credit ledger with incrementally maintained totals."""
+
+    def __init__(self, path, credit_table=None, create=True):
+        if not create and not os.path.isfile(path):
+            raise FileNotFoundError(f"Ledger not found: {path}")
+        self.path = path
+        self.credit_table = credit_table
+        self._db = sqlite3.connect(path, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(SCHEMA)
+        self._load_plan()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self._db.close()
+
+    def _load_plan(self):
+        meta = dict(self._db.execute("SELECT key, value FROM meta"))
+        self.plan = meta.get("plan")
+        self.available = float(meta["available"]) if "available" in meta else None
+        self.budget_total = float(meta["budget_total"]) if "budget_total" in meta else None
+        self._costs = plan_costs(self.plan, self.credit_table) if self.plan else {}
+        self._line_ids = set()
+        self._by_pair = {}
+        self._by_type = {}
+        for line_id, asset_type, model in self._db.execute(
+            "SELECT id, asset_type, model FROM lines ORDER BY id"
+        ):
+            self._line_ids.add(line_id)
+            self._by_pair.setdefault((asset_type, model), line_id)
+            self._by_type.setdefault(asset_type, line_id)
+
+    def init_plan(self, deliverables, plan):
+        """Record the budgeted deliverable lines for a plan. Only allowed once."""
+        if self.plan:
+            raise ValueError(f"Ledger {self.path} is already initialised for the {self.plan} plan")
+        budget = calculate_budget(deliverables, plan, self.credit_table)
+        with self._db:
+            self._db.execute("BEGIN")
+            self._db.executemany(
+                "INSERT INTO lines (id, count, asset_type, model, budget) VALUES (?, ?, ?, ?, ?)",
+                [(i, r["count"], r["asset_type"], r["model"], r["line_total"])
+                 for i, r in enumerate(budget["results"], 1)],
+            )
+            self._db.executemany(
+                "INSERT INTO meta (key, value) VALUES (?, ?)",
+                [("plan", plan),
+                 ("available", str(PLAN_CREDITS.get(plan, 1500))),
+                 ("budget_total", str(budget["total_with_buffer"])),
+                 ("created", str(time.time()))],
+            )
+        self._load_plan()
+        return budget
+
+    def resolve_event(self, event):
+        """Return (ts, line_id, model, count, credits, note) for one event dict.
+
+        Raises ValueError for anything that is not a recordable event.
+        """
+        if not self.plan:
+            raise ValueError("Ledger has no plan; run init first")
+        if not isinstance(event, dict):
+            raise ValueError("Event must be a JSON object")
+        model = event.get("model")
+        if not model or not isinstance(model, str):
+            raise ValueError("Event is missing a model")
+        try:
+            count = int(event.get("count", 1))
+            credits = event.get("credits")
+            if credits is not None:
+                credits = float(credits)
+            line_id = event.get("line")
+            if line_id is not None:
+                line_id = int(line_id)
+            ts = float(event.get("ts") or time.time())
+        except (TypeError, ValueError):
+            raise ValueError("Event count, credits, line and ts must be numbers") from None
+        if credits is None:
+            if model not in self._costs:
+                raise ValueError(f"No price for model {model}; pass credits explicitly")
+            credits = round(self._costs[model] * count, 2)
+        if line_id is not None:
+            if line_id not in self._line_ids:
+                raise ValueError(f"Unknown deliverable line {line_id}")
+        else:
+            asset_type = event.get("asset_type")
+            line_id = self._by_pair.get((asset_type, model), self._by_type.get(asset_type))
+        return (ts, line_id, model, count, credits, event.get("note"))
+
+    def record_many(self, events):
+        """Append events in one transaction and fold them into the running totals."""
+        return self.record_resolved([self.resolve_event(event) for event in events])
+
+    def record_resolved(self, rows):
+        """Append rows from resolve_event in one transaction."""
+        if not rows:
+            return 0
+        deltas = {}
+        with self._db:
+            self._db.execute("BEGIN IMMEDIATE")
+            balance = self._spent()
+            entries = []
+            for ts, line_id, model, count, credits, note in rows:
+                balance = round(balance + credits, 2)
+                entries.append((ts, line_id, model, count, credits, balance, note))
+                for key in (("all", ""), ("model", model),
+                            ("line", str(line_id) if line_id else "unplanned")):
+                    spent, n = deltas.get(key, (0, 0))
+                    deltas[key] = (spent + credits, n + 1)
+            self._db.executemany(
+                "INSERT INTO events (ts, line_id, model, count, credits, balance, note) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                entries,
+            )
+            self._db.executemany(
+                UPSERT_TOTAL,
+                [(scope, key, spent, n) for (scope, key), (spent, n) in deltas.items()],
+            )
+        return len(rows)
+
+    def record(self, model, credits=None, line=None, asset_type=None, count=1, note=None):
+        """Append a single generation event."""
+        return self.record_many([{
+            "model": model, "credits": credits, "line": line,
+            "asset_type": asset_type, "count": count, "note": note,
+        }])
+
+    def _spent(self):
+        row = self._db.execute(
+            "SELECT spent FROM totals WHERE scope = 'all' AND key = ''"
+        ).fetchone()
+        return row[0] if row else 0
+
+    def remaining(self):
+        """Credits left against PLAN_CREDITS for the ledger's plan."""
+        return round(self.available - self._spent(), 2)
+
+    def status(self):
+        """Budget vs spend per line and per model, from the running totals only."""
+        totals = {}
+        for scope, key, spent, n in self._db.execute("SELECT scope, key, spent, events FROM totals"):
+            totals[(scope, key)] = (round(spent, 2), n)
+        lines = []
+        for line_id, count, asset_type, model, budget in self._db.execute(
+            "SELECT id, count, asset_type, model, budget FROM lines ORDER BY id"
+        ):
+            spent, n = totals.get(("line", str(line_id)), (0, 0))
+            lines.append({
+                "line": line_id, "count": count, "asset_type": asset_type, "model": model,
+                "budget": budget, "spent": spent, "events": n,
+            })
+        spent = totals.get(("all", ""), (0, 0))[0]
+        return {
+            "plan": self.plan,
+            "lines": lines,
+            "unplanned": totals.get(("line", "unplanned"), (0, 0))[0],
+            "models": {key: value[0] for (scope, key), value in sorted(totals.items())
+                       if scope == "model"},
+            "spent": spent,
+            "budget_total": self.budget_total,
+            "available": self.available,
+            "remaining": round(self.available - spent, 2),
+        }
+
+    def last_seq(self):
+        row = self._db.execute("SELECT MAX(seq) FROM events").fetchone()
+        return row[0] or 0
+
+    def events_after(self, seq, limit=1000):
+        """Events with a sequence number above seq, oldest first."""
+        return self._db.execute(
+            "SELECT seq, ts, line_id, model, count, credits, balance, note FROM events "
+            "WHERE seq > ? ORDER BY seq LIMIT ?",
+            (seq, limit),
+        ).fetchall()
+
+
+def fmt_credits(value):
+    """Show whole credit amounts without a trailing .0."""
+    value = round(float(value), 2)
+    return f"{value:.0f}" if value.is_integer() else f"{value:.2f}"
+
+
+def format_status(status):
+    """Format a ledger status as readable text output."""
+    lines = []
+    lines.append(f"CREDIT LEDGER — {status['plan'].upper()} PLAN")
+    lines.append(f"{'='*60}")
+    lines.append("")
+    lines.append(f"{'#':<4}{'Deliverable':<20} {'Model':<20} {'Budget':<8} {'Spent':<8}")
+    lines.append(f"{'-'*60}")
+    for l in status["lines"]:
+        flag = "  OVER" if l["spent"] > l["budget"] else ""
+        lines.append(
+            f"{l['line']:<4}{l['count']}x {l['asset_type']:<16} {l['model']:<20} "
+            f"{fmt_credits(l['budget']):<8} {fmt_credits(l['spent']):<8}{flag}"
+        )
+    if status["unplanned"]:
+        lines.append(f"{'':<4}{'(unplanned)':<41} {'':<8} {fmt_credits(status['unplanned']):<8}")
+    lines.append(f"{'-'*60}")
+    for model, spent in status["models"].items():
+        lines.append(f"{'  ' + model + ':':<46} {fmt_credits(spent)}")
+    lines.append(f"{'-'*60}")
+    lines.append(f"{'Spent so far:':<46} {fmt_credits(status['spent'])}")
+    lines.append(f"{'Budget with buffer:':<46} {fmt_credits(status['budget_total'])}")
+    lines.append(f"{'Available credits:':<46} {fmt_credits(status['available'])}")
+    lines.append(f"{'Remaining:':<46} {fmt_credits(status['remaining'])}")
+    return "\n".join(lines)
+
+
+def format_event(row, available):
+    seq, ts, line_id, model, count, credits, balance, note = row
+    stamp = datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M:%S")
+    line = f"L{line_id}" if line_id else "--"
+    text = (f"#{seq:<8} {stamp}  {line:<5} {count}x {model:<20} "
+            f"{fmt_credits(credits):>8}  remaining {fmt_credits(available - balance)}")
+    return f"{text}  {note}" if note else text
+
+
+def iter_event_file(fh):
+    """Yield (line number, event) from an NDJSON file, skipping blank lines."""
+    for lineno, line in enumerate(fh, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield lineno, json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"line {lineno}: {e.msg}") from None
+
+
+def tail(ledger, n, follow, interval=1.0):
+    """Print the last n events, then (with follow) new events as they land."""
+    seq = max(ledger.last_seq() - n, 0)
+    while True:
+        rows = ledger.events_after(seq)
+        for row in rows:
+            print(format_event(row, ledger.available), flush=True)
+            seq = row[0]
+        if len(rows) == 1000:
+            continue
+        if not follow:
+            return
+        time.sleep(interval)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ScaleFlow Credit Ledger")
+    parser.add_argument("--credit-table",
+                        help="Markdown price list, in plan credits, that overrides CREDIT_COSTS")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    init = commands.add_parser("init", help="Create a ledger from a budget")
+    init.add_argument("--ledger", required=True, help="Ledger file to create")
+    init.add_argument("--plan", choices=["starter", "professional", "team"],
+                      default="starter", help="Weavy plan tier")
+    init.add_argument("--deliverables", required=True, help="Path to deliverables file")
+    init.add_argument("--strict", action="store_true",
+                      help="Fail on unparseable deliverables lines or unknown models")
+
+    record = commands.add_parser("record", help="Append generation events")
+    record.add_argument("--ledger", required=True, help="Ledger file")
+    record.add_argument("--model", help="Model used for the generation")
+    record.add_argument("--line", type=int, help="Deliverable line number (see status)")
+    record.add_argument("--asset-type", help="Asset type, to match a line when --line is omitted")
+    record.add_argument("--count", type=int, default=1, help="Number of generations")
+    record.add_argument("--credits", type=float, help="Credits spent (default: priced from the plan)")
+    record.add_argument("--note", help="Free-text note")
+    record.add_argument("--events", help="NDJSON file of events to append ('-' for stdin)")
+
+    status = commands.add_parser("status", help="Show spend vs budget per line and model")
+    status.add_argument("--ledger", required=True, help="Ledger file")
+    status.add_argument("--json", action="store_true", help="Output as JSON")
+
+    tail_cmd = commands.add_parser("tail", help="Show recent events")
+    tail_cmd.add_argument("--ledger", required=True, help="Ledger file")
+    tail_cmd.add_argument("-n", type=int, default=20, help="Number of recent events to show")
+    tail_cmd.add_argument("--follow", "-f", action="store_true", help="Keep printing new events")
+
+    args = parser.parse_args()
+
+    try:
+        if args.command == "init":
+            # Parsed before the ledger is created, so --strict leaves no file behind
+            problems = []
+            deliverables = parse_deliverables_file(
+                args.deliverables, problems, plan_costs(args.plan, args.credit_table)
+            )
+            level = "ERROR" if args.strict else "WARNING"
+            for lineno, message in problems:
+                print(f"{level}: {args.deliverables}:{lineno}: {message}", file=sys.stderr)
+            if problems and args.strict:
+                sys.exit(2)
+        with CreditLedger(args.ledger, args.credit_table,
+                          create=args.command == "init") as ledger:
+            if args.command == "init":
+                budget = ledger.init_plan(deliverables, args.plan)
+                print(f"Ledger {args.ledger}: {len(budget['results'])} lines, "
+                      f"budget {budget['total_with_buffer']} of {budget['available']} credits")
+            elif args.command == "record":
+                if args.events:
+                    fh = sys.stdin if args.events == "-" else open(args.events)
+                    recorded = 0
+                    with fh:
+                        batch = []
+                        for lineno, event in iter_event_file(fh):
+                            try:
+                                batch.append(ledger.resolve_event(event))
+                            except ValueError as e:
+                                raise ValueError(f"line {lineno}: {e}") from None
+                            if len(batch) >= RECORD_BATCH_SIZE:
+                                recorded += ledger.record_resolved(batch)
+                                batch = []
+                        recorded += ledger.record_resolved(batch)
+                elif args.model:
+                    recorded = ledger.record(args.model, args.credits, args.line,
+                                             args.asset_type, args.count, args.note)
+                else:
+                    parser.error("record needs --model or --events")
+                print(f"Recorded {recorded} events. Remaining: {fmt_credits(ledger.remaining())} credits")
+            elif args.command == "status":
+                if not ledger.plan:
+                    raise ValueError("Ledger has no plan; run init first")
+                report = ledger.status()
+                print(json.dumps(report, indent=2) if args.json else format_status(report))
+            elif args.command == "tail":
+                if not ledger.plan:
+                    raise ValueError("Ledger has no plan; run init first")
+                tail(ledger, args.n, args.follow)
+    except (OSError, ValueError, sqlite3.Error) as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        sys.exit(2)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
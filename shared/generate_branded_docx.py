@@ -7,20 +7,43 @@ dark title headers, bold section strips, and proper brand presence.
 
 Usage:
     python3 shared/generate_branded_docx.py --input data.json --output output.docx
+    python3 shared/generate_branded_docx.py --input data.json --output output.docx --jobs 4
+    python3 shared/generate_branded_docx.py --stream --input report.ndjson --output output.docx
+
+Every logo_path/image_path in the input is read and checked in a thread pool
+before the document is built, so image I/O overlaps instead of blocking it.
+
+--stream reads NDJSON (or any concatenation of JSON values): first
+{"brand": {...}, "document": {...}} without sections, then one section
+object per value. Each section is rendered and written to a spool file on
+disk before the next is read, so memory follows the largest section rather
+than the whole report.
 
 JSON input structure: see README or Brief Analyzer SKILL.md for full schema.
 """
 
+import io
+import itertools
 import json
+import re
 import sys
 import os
 import argparse
+import tempfile
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from docx import Document
 from docx.shared import Inches, Pt, Cm, RGBColor, Emu
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.enum.table import WD_TABLE_ALIGNMENT
 from docx.oxml.ns import qn
-from docx.oxml import OxmlElement
+from docx.oxml import OxmlElement, parse_xml
+from docx.oxml.ns import nsdecls
+from xml.sax.saxutils import escape, quoteattr
+from docx.image.image import Image as DocxImage
+from lxml import etree
+
+from scaleflow.jsonstream import iter_json_values
 
 
 # ============================================================
@@ -80,48 +103,96 @@ STYLE_FONT_MAP = {
 # XML HELPERS
 # ============================================================
 
+# Child order inside w:tcPr; helpers insert in place so Word accepts the result
+TC_PR_ORDER = (
+    "cnfStyle", "tcW", "gridSpan", "hMerge", "vMerge", "tcBorders", "shd",
+    "noWrap", "tcMar", "textDirection", "tcFitText", "vAlign", "hideMark",
+)
+
+W_TAG = re.compile(r"^<w:\w+")
+
+def parse_w(markup):
+    """Parse one w: element written without namespace declarations."""
+    return parse_xml(W_TAG.sub(lambda m: f"{m.group(0)} {nsdecls('w')}", markup, count=1))
+
+# xmlns declarations lxml writes on the root tag of a serialized fragment
+NS_DECL = re.compile(rb'\s+(xmlns:\w+="[^"]*")')
+
+def set_tc_pr_child(cell, child):
+    """Put child into the cell's w:tcPr, replacing any existing element of the same kind."""
+    tcPr = cell._tc.get_or_add_tcPr()
+    for existing in tcPr.findall(child.tag):
+        tcPr.remove(existing)
+    name = child.tag.split("}")[1]
+    successors = TC_PR_ORDER[TC_PR_ORDER.index(name) + 1:]
+    tcPr.insert_element_before(child, *(f"w:{n}" for n in successors))
+
+def borders_xml(tag, edge, sides=("top", "left", "bottom", "right")):
+    """Border container markup with the same edge attributes on each side."""
+    return f"<w:{tag}>" + "".join(f"<w:{side} {edge}/>" for side in sides) + f"</w:{tag}>"
+
+def border_edge(width, color, val="single"):
+    return f'w:val="{val}" w:sz="{width}" w:space="0" w:color="{color}"'
+
+NO_BORDER = border_edge("0", "auto", val="none")
+
+def margins_xml(top=None, bottom=None, left=None, right=None):
+    """w:tcMar markup for the given sides only; the rest come from the table style."""
+    sides = (("top", top), ("start", left), ("bottom", bottom), ("end", right))
+    return "<w:tcMar>" + "".join(
+        f'<w:{side} w:w="{val}" w:type="dxa"/>' for side, val in sides if val is not None
+    ) + "</w:tcMar>"
+
 def set_cell_shading(cell, color_hex):
-    shading = OxmlElement("w:shd")
-    shading.set(qn("w:fill"), color_hex)
-    shading.set(qn("w:val"), "clear")
-    cell._tc.get_or_add_tcPr().append(shading)
-
-def set_cell_borders(cell, color="D0D0D0", width="4"):
-    tc = cell._tc
-    tcPr = tc.get_or_add_tcPr()
-    tcBorders = OxmlElement("w:tcBorders")
-    for name in ["top", "left", "bottom", "right"]:
-        b = OxmlElement(f"w:{name}")
-        b.set(qn("w:val"), "single")
-        b.set(qn("w:sz"), width)
-        b.set(qn("w:color"), color)
-        b.set(qn("w:space"), "0")
-        tcBorders.append(b)
-    tcPr.append(tcBorders)
-
-def set_no_borders(cell):
-    tc = cell._tc
-    tcPr = tc.get_or_add_tcPr()
-    tcBorders = OxmlElement("w:tcBorders")
-    for name in ["top", "left", "bottom", "right"]:
-        b = OxmlElement(f"w:{name}")
-        b.set(qn("w:val"), "none")
-        b.set(qn("w:sz"), "0")
-        b.set(qn("w:space"), "0")
-        b.set(qn("w:color"), "auto")
-        tcBorders.append(b)
-    tcPr.append(tcBorders)
+    set_tc_pr_child(cell, parse_w(f'<w:shd w:fill="{color_hex}" w:val="clear"/>'))
 
 def set_cell_margins(cell, top=60, bottom=60, left=120, right=120):
-    tc = cell._tc
-    tcPr = tc.get_or_add_tcPr()
-    tcMar = OxmlElement("w:tcMar")
-    for side, val in [("top", top), ("bottom", bottom), ("start", left), ("end", right)]:
-        m = OxmlElement(f"w:{side}")
-        m.set(qn("w:w"), str(val))
-        m.set(qn("w:type"), "dxa")
-        tcMar.append(m)
-    tcPr.append(tcMar)
+    """Cell margins in twips; a side given as None falls back to the table style."""
+    set_tc_pr_child(cell, parse_w(margins_xml(top, bottom, left, right)))
+
+def set_table_full_width(table):
+    """Stretch a table across the text width (replaces python-docx's auto width)."""
+    tblW = table._tbl.tblPr.find(qn("w:tblW"))
+    tblW.set(qn("w:w"), "5000")
+    tblW.set(qn("w:type"), "pct")
+
+def table_style_xml(style_id, name, borders=NO_BORDER, margins=(0, 108, 0, 108),
+                    cell_props="", conditions=()):
+    """w:style markup for a custom table style.
+
+    borders is the edge markup used on every table edge and inside line;
+    margins are the default cell margins (top, left, bottom, right) in twips.
+    cell_props applies to every cell, and each (type, props) in conditions
+    to a conditional region such as firstRow, firstCol or band1Horz; both
+    are w:tcPr inner markup.
+    """
+    tbl_margins = "".join(
+        f'<w:{side} w:w="{val}" w:type="dxa"/>'
+        for side, val in zip(("top", "left", "bottom", "right"), margins)
+    )
+    tcPr = f"<w:tcPr>{cell_props}</w:tcPr>" if cell_props else ""
+    regions = "".join(
+        f'<w:tblStylePr w:type="{kind}"><w:tcPr>{props}</w:tcPr></w:tblStylePr>'
+        for kind, props in conditions
+    )
+    return (
+        f'<w:style {nsdecls("w")} w:type="table" w:customStyle="1" w:styleId="{style_id}">'
+        f'<w:name w:val="{name}"/><w:basedOn w:val="TableNormal"/><w:uiPriority w:val="99"/>'
+        '<w:tblPr><w:tblStyleRowBandSize w:val="1"/><w:tblStyleColBandSize w:val="1"/>'
+        + borders_xml("tblBorders", borders, ("top", "left", "bottom", "right", "insideH", "insideV"))
+        + f"<w:tblCellMar>{tbl_margins}</w:tblCellMar></w:tblPr>{tcPr}{regions}</w:style>"
+    )
+
+def add_table_style(doc, style_id, style_xml):
+    """Register a table style once per document; returns its styleId."""
+    styles = doc.styles.element
+    if styles.get_by_id(style_id) is None:
+        styles.append(parse_xml(style_xml))
+    return style_id
+
+# Full-width color blocks: no borders, roomy margins; each block sets its own fill
+BLOCK_STYLE_ID = "ScaleFlowBlock"
+BLOCK_STYLE_XML = table_style_xml(BLOCK_STYLE_ID, "ScaleFlow Block", margins=(140, 200, 140, 200))
 
 def set_row_height(row, height_pt):
     trPr = row._tr.get_or_add_trPr()
@@ -140,23 +211,48 @@ def set_paragraph_spacing(p, before=0, after=0, line=None):
         spacing.set(qn("w:lineRule"), "auto")
     pPr.append(spacing)
 
+# Tabs and line breaks become their own run children, as python-docx writes them
+RUN_BREAK = re.compile(r"(\t|\r|\n)")
+
+def run_xml(text, rPr):
+    """w:r markup for text under a prebuilt w:rPr fragment."""
+    parts = [f"<w:r>{rPr}"]
+    for chunk in RUN_BREAK.split(text):
+        if chunk == "\t":
+            parts.append("<w:tab/>")
+        elif chunk in ("\r", "\n"):
+            parts.append("<w:br/>")
+        elif chunk:
+            space = ' xml:space="preserve"' if chunk != chunk.strip() else ""
+            parts.append(f"<w:t{space}>{escape(chunk)}</w:t>")
+    parts.append("</w:r>")
+    return "".join(parts)
+
+def run_props_xml(font, size, color_hex, bold=False, italic=False):
+    """w:rPr markup matching what BrandedDocBuilder._run sets on a run."""
+    font = quoteattr(font)
+    b = "<w:b/>" if bold else '<w:b w:val="0"/>'
+    i = "<w:i/>" if italic else '<w:i w:val="0"/>'
+    return (
+        f"<w:rPr><w:rFonts w:ascii={font} w:hAnsi={font}/>{b}{i}"
+        f'<w:color w:val="{color_hex}"/><w:sz w:val="{int(size * 2)}"/></w:rPr>'
+    )
+
+def cell_props_xml(width, overrides=""):
+    """w:tcPr markup: the cell width plus any properties that differ from the table style."""
+    return f'<w:tcPr><w:tcW w:type="dxa" w:w="{width}"/>{overrides}</w:tcPr>'
+
 def make_full_width_block(doc, bg_color, height_pt=None):
     """Create a full-width single-cell table that acts as a color block.
     Returns the cell so you can add content to it."""
     table = doc.add_table(rows=1, cols=1)
     table.alignment = WD_TABLE_ALIGNMENT.CENTER
+    table._tbl.tblPr.style = add_table_style(doc, BLOCK_STYLE_ID, BLOCK_STYLE_XML)
+    set_table_full_width(table)
 
-    # Make table full width
-    tblPr = table._tbl.tblPr
-    tblW = OxmlElement("w:tblW")
-    tblW.set(qn("w:w"), "5000")
-    tblW.set(qn("w:type"), "pct")
-    tblPr.append(tblW)
-
+    # Borders and default margins come from the block style
     cell = table.rows[0].cells[0]
     set_cell_shading(cell, bg_color)
-    set_no_borders(cell)
-    set_cell_margins(cell, top=140, bottom=140, left=200, right=200)
 
     if height_pt:
         set_row_height(table.rows[0], height_pt)
@@ -167,6 +263,35 @@ def make_full_width_block(doc, bg_color, height_pt=None):
     return cell, table
 
 
+# ============================================================
+# IMAGE PREFETCH
+# ============================================================
+
+IMAGE_KEYS = ("logo_path", "image_path")
+
+def iter_image_paths(data):
+    """Yield every logo_path/image_path value found anywhere in the input JSON."""
+    if isinstance(data, dict):
+        for key, value in data.items():
+            if key in IMAGE_KEYS and isinstance(value, str) and value:
+                yield value
+            else:
+                yield from iter_image_paths(value)
+    elif isinstance(data, list):
+        for item in data:
+            yield from iter_image_paths(item)
+
+def load_image_blob(path):
+    """Read an image and check python-docx can parse it. Returns bytes or None."""
+    try:
+        with open(path, "rb") as f:
+            blob = f.read()
+        DocxImage.from_blob(blob)
+        return blob
+    except Exception:
+        return None
+
+
 # ============================================================
 # DOCUMENT BUILDER v2
 # ============================================================
@@ -209,7 +334,59 @@ class BrandedDocBuilder:
         logo_path = brand_config.get("logo_path")
         self.logo_path = logo_path if logo_path and os.path.exists(logo_path) else None
 
+        # Prefetched image bytes by absolute path
+        self._images = {}
+
         self._setup_page()
+        self._add_table_styles()
+
+    def prefetch_images(self, paths, jobs=None):
+        """Read and parse every image up front in a thread pool."""
+        paths = sorted({os.path.abspath(p) for p in paths if os.path.exists(p)})
+        if not paths:
+            return
+        workers = min(jobs or os.cpu_count() or 1, len(paths))
+        if workers <= 1:
+            blobs = map(load_image_blob, paths)
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                blobs = list(pool.map(load_image_blob, paths))
+        for path, blob in zip(paths, blobs):
+            if blob is not None:
+                self._images[path] = blob
+
+    def _picture(self, path):
+        """Prefetched bytes for an image as a stream, or the path if not prefetched."""
+        blob = self._images.get(os.path.abspath(path))
+        return io.BytesIO(blob) if blob is not None else path
+
+    def _add_table_styles(self):
+        """Register this brand's table styles, so cells only carry what differs from them."""
+        add_table_style(self.doc, BLOCK_STYLE_ID, BLOCK_STYLE_XML)
+        # Data tables: dark header row, light primary tint on alternate rows
+        add_table_style(self.doc, "ScaleFlowTable", table_style_xml(
+            "ScaleFlowTable", "ScaleFlow Table",
+            borders=border_edge("2", "E0E0E0"), margins=(40, 80, 40, 80),
+            conditions=[
+                ("firstRow", borders_xml("tcBorders", border_edge("2", self.secondary_hex))
+                 + f'<w:shd w:fill="{self.secondary_hex}" w:val="clear"/>'),
+                ("band1Horz", f'<w:shd w:fill="{self.light_primary}" w:val="clear"/>'),
+                ("band2Horz", '<w:shd w:fill="FFFFFF" w:val="clear"/>'),
+            ],
+        ))
+        # Title block meta: grey label column, off-white values
+        add_table_style(self.doc, "ScaleFlowMeta", table_style_xml(
+            "ScaleFlowMeta", "ScaleFlow Meta",
+            borders=border_edge("2", "EEEEEE"), margins=(40, 120, 40, 60),
+            cell_props='<w:shd w:fill="FAFAFA" w:val="clear"/>',
+            conditions=[("firstCol", '<w:shd w:fill="F7F7F7" w:val="clear"/>')],
+        ))
+        # Labeled pairs: borderless, accent rule left of the label column
+        add_table_style(self.doc, "ScaleFlowPairs", table_style_xml(
+            "ScaleFlowPairs", "ScaleFlow Pairs", margins=(30, 40, 30, 40),
+            conditions=[("firstCol", borders_xml(
+                "tcBorders", border_edge("16", self.accent_hex), sides=("left",)))],
+        ))
 
     def _setup_page(self):
         for section in self.doc.sections:
@@ -266,7 +443,7 @@ class BrandedDocBuilder:
                 logo_p = cell.add_paragraph()
                 logo_p.alignment = WD_ALIGN_PARAGRAPH.RIGHT
                 run = logo_p.add_run()
-                run.add_picture(self.logo_path, width=Inches(1.5))
+                run.add_picture(self._picture(self.logo_path), width=Inches(1.5))
             except Exception:
                 pass
 
@@ -280,13 +457,8 @@ class BrandedDocBuilder:
             self.doc.add_paragraph()  # small spacer
             meta_table = self.doc.add_table(rows=len(meta_pairs), cols=2)
             meta_table.alignment = WD_TABLE_ALIGNMENT.LEFT
-
-            # Full width
-            tblPr = meta_table._tbl.tblPr
-            tblW = OxmlElement("w:tblW")
-            tblW.set(qn("w:w"), "5000")
-            tblW.set(qn("w:type"), "pct")
-            tblPr.append(tblW)
+            meta_table._tbl.tblPr.style = "ScaleFlowMeta"
+            set_table_full_width(meta_table)
 
             for i, pair in enumerate(meta_pairs):
                 # Label
@@ -294,18 +466,12 @@ class BrandedDocBuilder:
                 lc.text = ""
                 p = lc.paragraphs[0]
                 self._run(p, pair["label"].upper(), size=8, color=self.subtle_color, bold=True)
-                set_cell_shading(lc, "F7F7F7")
-                set_cell_borders(lc, "EEEEEE", "2")
-                set_cell_margins(lc, top=40, bottom=40, left=120, right=60)
 
                 # Value
                 vc = meta_table.rows[i].cells[1]
                 vc.text = ""
                 p = vc.paragraphs[0]
                 self._run(p, pair["value"], size=9, color=self.body_color)
-                set_cell_shading(vc, "FAFAFA")
-                set_cell_borders(vc, "EEEEEE", "2")
-                set_cell_margins(vc, top=40, bottom=40, left=120, right=60)
 
             self.doc.add_paragraph()  # spacer after meta
 
@@ -346,76 +512,64 @@ class BrandedDocBuilder:
         """Labeled pairs as a clean two-column mini-table."""
         table = self.doc.add_table(rows=len(pairs), cols=2)
         table.alignment = WD_TABLE_ALIGNMENT.LEFT
-
-        tblPr = table._tbl.tblPr
-        tblW = OxmlElement("w:tblW")
-        tblW.set(qn("w:w"), "5000")
-        tblW.set(qn("w:type"), "pct")
-        tblPr.append(tblW)
+        table._tbl.tblPr.style = "ScaleFlowPairs"
+        set_table_full_width(table)
 
         for i, pair in enumerate(pairs):
             lc = table.rows[i].cells[0]
             lc.text = ""
             p = lc.paragraphs[0]
             self._run(p, pair["label"], size=9, color=self.body_color, bold=True)
-            set_no_borders(lc)
-            set_cell_margins(lc, top=30, bottom=30, left=100, right=40)
-
-            # Left accent border on label cell
-            tc = lc._tc
-            tcPr = tc.get_or_add_tcPr()
-            tcBorders = OxmlElement("w:tcBorders")
-            left_b = OxmlElement("w:left")
-            left_b.set(qn("w:val"), "single")
-            left_b.set(qn("w:sz"), "16")
-            left_b.set(qn("w:color"), self.accent_hex)
-            left_b.set(qn("w:space"), "0")
-            tcBorders.append(left_b)
-            tcPr.append(tcBorders)
+            # The accent rule on the label column comes from the style
+            set_cell_margins(lc, top=None, bottom=None, left=100, right=None)
 
             vc = table.rows[i].cells[1]
             vc.text = ""
             p = vc.paragraphs[0]
             self._run(p, pair["value"], size=9, color=self.subtle_color)
-            set_no_borders(vc)
-            set_cell_margins(vc, top=30, bottom=30, left=40, right=100)
+            set_cell_margins(vc, top=None, bottom=None, left=None, right=100)
 
         self.doc.add_paragraph()  # spacer
 
     def add_table(self, headers, rows):
-        """Branded data table with strong header row."""
-        table = self.doc.add_table(rows=1 + len(rows), cols=len(headers))
-        table.alignment = WD_TABLE_ALIGNMENT.LEFT
-
-        tblPr = table._tbl.tblPr
-        tblW = OxmlElement("w:tblW")
-        tblW.set(qn("w:w"), "5000")
-        tblW.set(qn("w:type"), "pct")
-        tblPr.append(tblW)
-
-        # Header row — secondary (dark) background
-        for i, header in enumerate(headers):
-            cell = table.rows[0].cells[i]
-            cell.text = ""
-            p = cell.paragraphs[0]
-            self._run(p, header, size=9, color=self.white, bold=True)
-            set_cell_shading(cell, self.secondary_hex)
-            set_cell_borders(cell, self.secondary_hex, "2")
-            set_cell_margins(cell, top=50, bottom=50, left=80, right=80)
-
-        # Data rows
-        for r, row_data in enumerate(rows):
-            for c, value in enumerate(row_data):
-                cell = table.rows[r + 1].cells[c]
-                cell.text = ""
-                p = cell.paragraphs[0]
-                self._run(p, str(value), size=9, color=self.body_color)
-                # Alternate rows with light primary tint
-                bg = self.light_primary if r % 2 == 0 else "FFFFFF"
-                set_cell_shading(cell, bg)
-                set_cell_borders(cell, "E0E0E0", "2")
-                set_cell_margins(cell, top=40, bottom=40, left=80, right=80)
-
+        """Branded data table with strong header row.
+
+        The whole w:tbl is written as one XML string from per-table cell and
+        run property fragments and parsed once, instead of going through
+        python-docx cell objects, so large tables cost little more per cell
+        than their text. Borders, shading and banding come from the brand's
+        ScaleFlowTable style. Rows longer than the header are cut to fit.
+        """
+        cols = len(headers)
+        col_width = Emu(self.doc._block_width // cols).twips if cols else 0
+
+        # Header cells keep slightly deeper margins than the style's default
+        head_tc = cell_props_xml(col_width, margins_xml(top=50, bottom=50))
+        head_r = run_props_xml(self.body_font, 9, str(self.white), bold=True)
+        body_tc = cell_props_xml(col_width)
+        body_r = run_props_xml(self.body_font, 9, str(self.body_color))
+
+        parts = [
+            f"<w:tbl {nsdecls('w')}><w:tblPr>"
+            '<w:tblStyle w:val="ScaleFlowTable"/><w:tblW w:w="5000" w:type="pct"/><w:jc w:val="left"/>'
+            '<w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0" w:lastRow="0" '
+            'w:noHBand="0" w:noVBand="1" w:val="04A0"/></w:tblPr><w:tblGrid>',
+            f'<w:gridCol w:w="{col_width}"/>' * cols,
+            "</w:tblGrid><w:tr>",
+        ]
+        for header in headers:
+            parts.append(f"<w:tc>{head_tc}<w:p>{run_xml(str(header), head_r)}</w:p></w:tc>")
+        parts.append("</w:tr>")
+        for row_data in rows:
+            parts.append("<w:tr>")
+            values = list(row_data)[:cols]
+            values += [""] * (cols - len(values))
+            for value in values:
+                parts.append(f"<w:tc>{body_tc}<w:p>{run_xml(str(value), body_r)}</w:p></w:tc>")
+            parts.append("</w:tr>")
+        parts.append("</w:tbl>")
+
+        self.doc.element.body._insert_tbl(parse_xml("".join(parts)))
         self.doc.add_paragraph()  # spacer
 
     def add_callout(self, text):
@@ -423,23 +577,9 @@ class BrandedDocBuilder:
         cell, tbl = make_full_width_block(self.doc, self.light_accent)
         set_cell_margins(cell, top=100, bottom=100, left=250, right=200)
 
-        # Strong left border in accent color
-        tc = cell._tc
-        tcPr = tc.get_or_add_tcPr()
-        tcBorders = OxmlElement("w:tcBorders")
-        left_b = OxmlElement("w:left")
-        left_b.set(qn("w:val"), "single")
-        left_b.set(qn("w:sz"), "36")
-        left_b.set(qn("w:color"), self.accent_hex)
-        left_b.set(qn("w:space"), "0")
-        tcBorders.append(left_b)
-        for name in ["top", "right", "bottom"]:
-            b = OxmlElement(f"w:{name}")
-            b.set(qn("w:val"), "none")
-            b.set(qn("w:sz"), "0")
-            b.set(qn("w:space"), "0")
-            tcBorders.append(b)
-        tcPr.append(tcBorders)
+        # Strong left border in accent color; the block style has no others
+        set_tc_pr_child(cell, parse_w(borders_xml(
+            "tcBorders", border_edge("36", self.accent_hex), sides=("left",))))
 
         p = cell.paragraphs[0]
         set_paragraph_spacing(p, before=0, after=0)
@@ -517,53 +657,167 @@ class BrandedDocBuilder:
 
         # Sections
         for section in doc_data.get("sections", []):
-            self.add_section_heading(section["heading"])
-
-            for content in section.get("content", []):
-                ctype = content["type"]
-                if ctype == "paragraph":
-                    self.add_paragraph(
-                        content["text"],
-                        bold=content.get("bold", False),
-                        italic=content.get("italic", False),
-                    )
-                elif ctype == "bullets":
-                    self.add_bullets(content["items"])
-                elif ctype == "labeled":
-                    self.add_labeled_pairs(content["pairs"])
-                elif ctype == "table":
-                    self.add_table(content["headers"], content["rows"])
-                elif ctype == "callout":
-                    self.add_callout(content["text"])
+            self.add_section(section)
 
         # Document footer
         footer_text = doc_data.get("footer", "")
         if footer_text:
             self.add_footer(footer_text)
 
+    def add_section(self, section):
+        self.add_section_heading(section["heading"])
+
+        for content in section.get("content", []):
+            ctype = content["type"]
+            if ctype == "paragraph":
+                self.add_paragraph(
+                    content["text"],
+                    bold=content.get("bold", False),
+                    italic=content.get("italic", False),
+                )
+            elif ctype == "bullets":
+                self.add_bullets(content["items"])
+            elif ctype == "labeled":
+                self.add_labeled_pairs(content["pairs"])
+            elif ctype == "table":
+                self.add_table(content["headers"], content["rows"])
+            elif ctype == "callout":
+                self.add_callout(content["text"])
+
     def save(self, output_path):
-        os.makedirs(os.path.dirname(output_path) if os.path.dirname(output_path) else ".", exist_ok=True)
+        """Save to a path or a binary file object."""
+        if isinstance(output_path, (str, os.PathLike)):
+            os.makedirs(os.path.dirname(output_path) if os.path.dirname(output_path) else ".", exist_ok=True)
         self.doc.save(output_path)
-        print(f"Branded document saved: {output_path}")
         return output_path
 
+    # ----------------------------------------------------------
+    # STREAMING BUILD — sections spooled to disk as they render
+    # ----------------------------------------------------------
+    def build_streaming(self, doc_data, sections, output_path):
+        """Build and save like build_from_data + save, taking sections from an iterator.
+
+        After each section its body XML is serialized to a temporary spool
+        file and dropped from the tree; save() then splices the spool into
+        word/document.xml while copying the rest of the package. Returns the
+        number of sections streamed.
+        """
+        client = self.brand.get("client_name", "")
+        self.add_page_header_footer(client, doc_data.get("title", ""))
+        self.add_title_block(
+            title=doc_data["title"],
+            subtitle=doc_data.get("subtitle", ""),
+            date=doc_data.get("date", ""),
+            meta_pairs=doc_data.get("meta", []),
+        )
+
+        count = 0
+        with tempfile.TemporaryFile() as spool:
+            self._spool_body(spool)
+            for section in sections:
+                self.add_section(section)
+                self._spool_body(spool)
+                count += 1
+
+            footer_text = doc_data.get("footer", "")
+            if footer_text:
+                self.add_footer(footer_text)
+                self._spool_body(spool)
+
+            self._save_spooled(spool, output_path)
+        return count
+
+    def _spool_body(self, spool):
+        """Move every body element except the final sectPr into the spool file."""
+        root = self.doc.element
+        # lxml repeats the root's namespace declarations on every serialized
+        # fragment; the root still declares them, so they can go
+        root_decls = {
+            f'xmlns:{prefix}="{uri}"'.encode("utf-8") for prefix, uri in root.nsmap.items() if prefix
+        }
+        body = root.body
+        for child in list(body):
+            if child.tag == qn("w:sectPr"):
+                continue
+            xml = etree.tostring(child, encoding="utf-8")
+            head_end = xml.index(b">")
+            head = NS_DECL.sub(
+                lambda m: b"" if m.group(1) in root_decls else m.group(0), xml[:head_end]
+            )
+            spool.write(head + xml[head_end:])
+            # Detaching a large subtree makes lxml re-resolve namespaces node
+            # by node; emptying it first keeps removal cheap
+            child.clear()
+            body.remove(child)
+
+    def _save_spooled(self, spool, output_path):
+        """Save the package with the spooled body content spliced in before the sectPr."""
+        os.makedirs(os.path.dirname(output_path) if os.path.dirname(output_path) else ".", exist_ok=True)
+        shell = io.BytesIO()
+        self.doc.save(shell)
+        with zipfile.ZipFile(shell) as src, \
+                zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as dst:
+            for item in src.infolist():
+                if item.filename != "word/document.xml":
+                    dst.writestr(item, src.read(item.filename))
+                    continue
+                document_xml = src.read(item.filename)
+                split = document_xml.rindex(b"<w:sectPr")
+                with dst.open(item.filename, "w") as out:
+                    out.write(document_xml[:split])
+                    spool.seek(0)
+                    for block in iter(lambda: spool.read(1 << 20), b""):
+                        out.write(block)
+                    out.write(document_xml[split:])
+
 
 # ============================================================
 # CLI
 # ============================================================
 
+
 def main():
     parser = argparse.ArgumentParser(description="Generate a branded .docx from JSON data.")
-    parser.add_argument("--input", required=True, help="Path to JSON input file")
+    parser.add_argument("--input", required=True, help="Path to JSON input file (NDJSON with --stream)")
     parser.add_argument("--output", required=True, help="Path for output .docx file")
+    parser.add_argument("--jobs", type=int, default=0,
+                        help="Threads for image prefetch (default: one per CPU)")
+    parser.add_argument("--stream", action="store_true",
+                        help="Read a header object then one section per JSON value, rendering as it reads")
     args = parser.parse_args()
 
+    if args.stream:
+        with open(args.input, "r") as f:
+            values = iter_json_values(f)
+            try:
+                header = next(values, None)
+            except ValueError as e:
+                print(f"Error: {e}", file=sys.stderr)
+                sys.exit(1)
+            if not isinstance(header, dict) or "brand" not in header or "document" not in header:
+                print("Error: stream must start with an object holding 'brand' and 'document'",
+                      file=sys.stderr)
+                sys.exit(1)
+            document = header["document"]
+            builder = BrandedDocBuilder(header["brand"])
+            builder.prefetch_images(iter_image_paths(header), args.jobs or None)
+            sections = document.pop("sections", [])
+            try:
+                count = builder.build_streaming(document, itertools.chain(sections, values), args.output)
+            except ValueError as e:
+                print(f"Error: {e}", file=sys.stderr)
+                sys.exit(1)
+        print(f"Branded document saved: {args.output} ({count} sections streamed)")
+        return
+
     with open(args.input, "r") as f:
         data = json.load(f)
 
     builder = BrandedDocBuilder(data["brand"])
+    builder.prefetch_images(iter_image_paths(data), args.jobs or None)
     builder.build_from_data(data["document"])
     builder.save(args.output)
+    print(f"Branded document saved: {args.output}")
 
 
 if __name__ == "__main__":
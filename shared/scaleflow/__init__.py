@@ -0,0 +1,70 @@
+"""
+ScaleFlow library API
+=====================
+
+In-process access to the skill scripts, for services that would otherwise
+start a new interpreter per call. Each function takes Python data (or file
+paths), returns the same structure the matching script prints with --json,
+and raises instead of exiting: ValueError for bad input, FileNotFoundError
+for missing paths, ImportError for a missing dependency.
+
+Importing the package loads nothing heavy. A script (and with it Pillow,
+python-pptx or python-docx) is imported the first time one of its functions
+is called, then reused for the life of the process.
+
+    import sys
+    sys.path.insert(0, "/path/to/scaleflow-skills/shared")
+    import scaleflow
+
+    qa = scaleflow.validate_assets("specs.json", "exports/", recursive=True)
+    copy = scaleflow.validate_copy([{"platform": "twitter", "text": "Launch day"}])
+    budget = scaleflow.calculate_budget(["3 x hero_image using flux_kontext"], plan="team")
+    payload = scaleflow.aggregate_report(assets=qa, copy=copy, budget=budget, brand=brand)
+    docx_bytes = scaleflow.render_docx(payload)["content"]
+
+The scripts keep working unchanged from the command line; this package only
+imports them from their skill folders.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+# Public name -> submodule defining it
+_EXPORTS: dict[str, str] = {
+    "validate_assets": "assets",
+    "validate_asset": "assets",
+    "match_spec": "assets",
+    "check_images": "images",
+    "check_image": "images",
+    "validate_copy": "copy_lengths",
+    "count_characters": "copy_lengths",
+    "platform_limit": "copy_lengths",
+    "parse_deliverables": "budget",
+    "calculate_budget": "budget",
+    "simulate_budget": "budget",
+    "optimize_models": "budget",
+    "open_ledger": "budget",
+    "ledger_status": "budget",
+    "render_docx": "documents",
+    "render_pptx": "documents",
+    "new_asset_cache": "documents",
+    "prune_image_cache": "documents",
+    "aggregate_report": "report",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    submodule = _EXPORTS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{submodule}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -0,0 +1,59 @@
+"""
+Locates the bundled skill scripts and imports them as modules on demand.
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+import os
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+# Marketplace root: shared/scaleflow/_scripts.py -> ../..
+ROOT = Path(__file__).resolve().parents[2]
+
+# Script module name -> directory holding it, relative to ROOT
+SCRIPT_DIRS: dict[str, str] = {
+    "validate_assets": "scaleflow-production-ops/skills/asset-spec/scripts",
+    "check_image_specs": "scaleflow-production-ops/skills/creative-review/scripts",
+    "calculate_budget": "scaleflow-production-ops/skills/credit-optimizer/scripts",
+    "credit_ledger": "scaleflow-production-ops/skills/credit-optimizer/scripts",
+    "validate_copy_lengths": "scaleflow-creative-suite/skills/copy-engine/scripts",
+    "generate_pptx": "scaleflow-client-delivery/skills/deck-creator/scripts",
+    "aggregate_report": "scaleflow-client-delivery/skills/report-builder/scripts",
+    "generate_branded_docx": "shared",
+}
+
+
+def load(name: str) -> ModuleType:
+    """
+    Import a bundled script by module name, once per process.
+
+    The script's directory is added to ``sys.path`` so it imports under its
+    own name, exactly as when run from its folder: sibling imports
+    (credit_ledger -> calculate_budget) resolve, and functions the script
+    hands to a process pool pickle by reference. Missing third-party
+    dependencies surface here as ImportError.
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    directory = str(ROOT / SCRIPT_DIRS[name])
+    if directory not in sys.path:
+        sys.path.append(directory)
+    return importlib.import_module(name)
+
+
+def is_path(value: Any) -> bool:
+    return isinstance(value, (str, os.PathLike))
+
+
+def json_input(value: Any) -> Any:
+    """Return ``value`` unchanged, or the parsed contents if it is a JSON file path."""
+    if not is_path(value):
+        return value
+    with open(value, "r", encoding="utf-8") as fh:
+        return json.load(fh)
@@ -0,0 +1,92 @@
+"""
+Asset spec validation (asset-spec/scripts/validate_assets.py).
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Any
+
+from scaleflow._scripts import json_input, load
+
+
+def validate_assets(
+    specs: list[dict] | str | os.PathLike,
+    assets_dir: str | os.PathLike,
+    mapping: dict | str | os.PathLike | None = None,
+    *,
+    recursive: bool = False,
+    include: list[str] | None = None,
+    exclude: list[str] | None = None,
+    jobs: int = 1,
+    cache: str | os.PathLike | None = None,
+    cache_max_entries: int | None = None,
+    hash_content: bool = False,
+) -> dict[str, Any]:
+    """
+    Validate every supported file in ``assets_dir`` against ``specs``.
+
+    ``specs`` and ``mapping`` may be given as data or as JSON file paths.
+    Returns the ``validate_assets.py --json`` report with an extra
+    ``unmatched`` list of file names; their UNMATCHED records come last, as
+    in the CLI. ``jobs=0`` uses every CPU. No result cache is used unless
+    ``cache`` names a database file.
+    """
+    module = load("validate_assets")
+    specs = json_input(specs)
+    if not isinstance(specs, list):
+        raise ValueError("Spec JSON must be an array of spec objects.")
+    if mapping is not None:
+        mapping = json_input(mapping)
+    root = Path(assets_dir)
+    if not root.is_dir():
+        raise FileNotFoundError(f"Assets directory not found: {root}")
+    if jobs < 0:
+        raise ValueError("jobs must be 0 or a positive integer.")
+
+    result_cache = None
+    if cache is not None:
+        result_cache = module.ResultCache(
+            Path(cache),
+            max_entries=cache_max_entries or module.DEFAULT_CACHE_MAX_ENTRIES,
+            hash_content=hash_content,
+        )
+    unmatched: list[str] = []
+    try:
+        results = list(module.iter_directory_results(
+            root,
+            specs,
+            mapping,
+            jobs=jobs or os.cpu_count() or 1,
+            cache=result_cache,
+            recursive=recursive,
+            include=include,
+            exclude=exclude,
+            unmatched=unmatched,
+        ))
+    finally:
+        if result_cache is not None:
+            result_cache.close()
+    results.extend(
+        module.unmatched_result(name, module.file_size_bytes(root / name)) for name in unmatched
+    )
+
+    passed = sum(1 for r in results if r["passed"])
+    return {
+        "total": len(results),
+        "passed": passed,
+        "failed": len(results) - passed,
+        "unmatched": unmatched,
+        "results": results,
+    }
+
+
+def validate_asset(path: str | os.PathLike, spec: dict) -> dict[str, Any]:
+    """Check one file against one spec; returns a single result record."""
+    return load("validate_assets").validate_asset(Path(path), spec)
+
+
+def match_spec(filename: str, specs: list[dict], mapping: dict | None = None) -> dict | None:
+    """Return the spec a file name would be validated against, or None."""
+    return load("validate_assets").match_file_to_spec(filename, specs, mapping)
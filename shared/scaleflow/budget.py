@@ -0,0 +1,144 @@
+"""
+Credit budgeting and spend tracking (credit-optimizer/scripts).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from typing import Any, Iterable
+
+from scaleflow._scripts import is_path, load
+
+Deliverable = tuple[int, str, str]
+
+
+def parse_deliverables(
+    source: str | os.PathLike | Iterable[str | dict | Deliverable],
+    plan: str | None = None,
+    credit_table: str | os.PathLike | None = None,
+) -> dict[str, Any]:
+    """
+    Normalise deliverables to ``(count, asset_type, model)`` tuples.
+
+    ``source`` is a deliverables file path or an iterable of lines in any
+    format the file accepts, ``{"count", "asset_type", "model"}`` objects or
+    ready tuples. With ``plan`` set, models the plan cannot price are
+    reported. Returns ``{"deliverables": [...], "problems": [{"line",
+    "message"}]}``.
+    """
+    module = load("calculate_budget")
+    if plan:
+        _check_plan(plan)
+    known_models = module.plan_costs(plan, credit_table) if plan else None
+    problems: list[tuple[int, str]] = []
+    if is_path(source):
+        deliverables = module.parse_deliverables_file(source, problems, known_models)
+    else:
+        # One line per item, so problems are numbered by item
+        lines = []
+        for item in source:
+            if not isinstance(item, (str, dict)):
+                count, asset_type, model = item
+                item = {"count": count, "asset_type": asset_type, "model": model}
+            lines.append(item if isinstance(item, str) else json.dumps(item))
+        deliverables = module.check_deliverables(
+            module.iter_deliverables(lines, problems), problems, known_models
+        )
+        problems.sort()
+    return {
+        "deliverables": deliverables,
+        "problems": [{"line": lineno, "message": message} for lineno, message in problems],
+    }
+
+
+def _check_plan(plan: str) -> None:
+    plans = load("calculate_budget").PLAN_CREDITS
+    if plan not in plans:
+        raise ValueError(f"Unknown plan {plan!r}; expected one of: {', '.join(plans)}.")
+
+
+def _deliverables(source: Any, plan: str, credit_table: Any, strict: bool) -> tuple[list, list]:
+    _check_plan(plan)
+    parsed = parse_deliverables(source, plan, credit_table)
+    if strict and parsed["problems"]:
+        first = parsed["problems"][0]
+        raise ValueError(f"{len(parsed['problems'])} deliverables problem(s), first at "
+                         f"line {first['line']}: {first['message']}")
+    return parsed["deliverables"], parsed["problems"]
+
+
+def calculate_budget(
+    deliverables: Any,
+    plan: str = "starter",
+    credit_table: str | os.PathLike | None = None,
+    strict: bool = False,
+) -> dict[str, Any]:
+    """
+    Estimate credits for a deliverables list (anything parse_deliverables takes).
+
+    Returns the ``calculate_budget.py --json`` report, ``{"plan", "budget"}``,
+    plus any parse ``problems``; with ``strict`` problems raise ValueError.
+    """
+    module = load("calculate_budget")
+    items, problems = _deliverables(deliverables, plan, credit_table, strict)
+    return {
+        "plan": plan,
+        "budget": module.calculate_budget(items, plan, credit_table),
+        "problems": problems,
+    }
+
+
+def simulate_budget(
+    deliverables: Any,
+    plan: str = "starter",
+    trials: int = 100_000,
+    history: dict | None = None,
+    seed: int | None = None,
+    credit_table: str | os.PathLike | None = None,
+) -> dict[str, Any]:
+    """Monte Carlo credit burn over ``trials`` runs (the --simulate result)."""
+    if trials < 1:
+        raise ValueError("trials must be at least 1.")
+    module = load("calculate_budget")
+    items, _ = _deliverables(deliverables, plan, credit_table, False)
+    return module.simulate_budget(items, plan, trials, history, seed, credit_table)
+
+
+def optimize_models(
+    deliverables: Any,
+    candidates: dict[str, Any],
+    plan: str = "starter",
+    objective: str = "cost",
+    min_quality: float = 0,
+    drafts: dict | None = None,
+    cap: float | None = None,
+    credit_table: str | os.PathLike | None = None,
+) -> dict[str, Any]:
+    """Pick a model per line from ``candidates`` (the --candidates assignment)."""
+    module = load("calculate_budget")
+    items, _ = _deliverables(deliverables, plan, credit_table, False)
+    return module.optimize_models(items, plan, candidates, objective, min_quality,
+                                  drafts, cap, credit_table)
+
+
+def open_ledger(
+    path: str | os.PathLike,
+    credit_table: str | os.PathLike | None = None,
+    create: bool = True,
+) -> Any:
+    """
+    Open a credit ledger; use it as a context manager.
+
+    A missing file is created unless ``create`` is False, in which case
+    FileNotFoundError is raised.
+    """
+    return load("credit_ledger").CreditLedger(str(path), credit_table, create)
+
+
+def ledger_status(path: str | os.PathLike) -> dict[str, Any]:
+    """Budget vs spend of an existing ledger (``credit_ledger.py status --json``)."""
+    with open_ledger(path, create=False) as ledger:
+        if not ledger.plan:
+            raise ValueError("Ledger has no plan; run init first")
+        return ledger.status()
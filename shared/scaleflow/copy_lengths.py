@@ -0,0 +1,41 @@
+"""
+Copy length validation (copy-engine/scripts/validate_copy_lengths.py).
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Any, Iterable
+
+from scaleflow._scripts import is_path, load
+
+
+def validate_copy(
+    items: Iterable[dict[str, Any]] | str | os.PathLike,
+    strict: bool = False,
+) -> dict[str, Any]:
+    """
+    Check copy items (``platform``, ``text``, optional ``format``/``label``)
+    against platform limits.
+
+    ``items`` may also be the path of a JSON array or NDJSON file. Returns
+    the ``validate_copy_lengths.py --json`` report. Malformed files raise
+    ValueError.
+    """
+    module = load("validate_copy_lengths")
+    if is_path(items):
+        with open(items, "r", encoding="utf-8") as fh:
+            results = list(module.validate_batch(module.iter_json_items(fh), strict=strict))
+    else:
+        results = module.validate_all(list(items), strict=strict)
+    return module.build_json_report(results)
+
+
+def count_characters(text: str, platform: str) -> int:
+    """Length of ``text`` as ``platform`` counts it."""
+    return load("validate_copy_lengths").measurer_for(platform.strip().lower())(text)
+
+
+def platform_limit(platform: str) -> int | None:
+    """Hard character limit for ``platform``, or None if it is not known."""
+    return load("validate_copy_lengths").PLATFORM_LIMITS.get(platform.strip().lower())
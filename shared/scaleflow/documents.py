@@ -0,0 +1,107 @@
+"""
+Branded document and deck rendering (shared/generate_branded_docx.py and
+deck-creator/scripts/generate_pptx.py).
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import re
+from typing import Any
+
+from scaleflow._scripts import json_input, load
+
+# Brand colors both builders read unconditionally
+BRAND_COLORS = ("primary_color", "secondary_color", "accent_color")
+HEX_COLOR = re.compile(r"#?[0-9A-Fa-f]{6}")
+
+
+def _check_keys(data: Any, keys: tuple[str, ...]) -> dict:
+    if not isinstance(data, dict):
+        raise ValueError("Input must be a JSON object.")
+    for key in keys:
+        if not isinstance(data.get(key), dict):
+            raise ValueError(f"JSON input must contain a '{key}' object.")
+    if "brand" in keys:
+        for key in BRAND_COLORS:
+            value = data["brand"].get(key)
+            if not isinstance(value, str) or not HEX_COLOR.fullmatch(value):
+                raise ValueError(f"brand.{key} must be a hex color such as #1A2B3C.")
+    return data
+
+
+def _save(builder: Any, output: str | os.PathLike | None) -> dict[str, Any]:
+    if output is not None:
+        builder.save(os.fspath(output))
+        return {"output": os.fspath(output), "bytes": os.path.getsize(output)}
+    buf = io.BytesIO()
+    builder.save(buf)
+    content = buf.getvalue()
+    return {"content": content, "bytes": len(content)}
+
+
+def render_docx(
+    data: dict | str | os.PathLike,
+    output: str | os.PathLike | None = None,
+    *,
+    jobs: int | None = None,
+) -> dict[str, Any]:
+    """
+    Build a branded .docx from ``{"brand", "document"}`` data (or its JSON path).
+
+    Writes to ``output`` when given and returns ``{"output", "bytes"}``;
+    otherwise returns the file as ``{"content", "bytes"}``. ``jobs`` sizes
+    the image prefetch pool (default: one thread per CPU).
+    """
+    module = load("generate_branded_docx")
+    data = _check_keys(json_input(data), ("brand", "document"))
+    builder = module.BrandedDocBuilder(data["brand"])
+    builder.prefetch_images(module.iter_image_paths(data), jobs)
+    builder.build_from_data(data["document"])
+    return _save(builder, output)
+
+
+def new_asset_cache(max_bytes: int | None = None) -> Any:
+    """A size-bounded image cache to share between render_pptx calls."""
+    module = load("generate_pptx")
+    return module.AssetCache(module.DEFAULT_ASSET_CACHE_BYTES if max_bytes is None else max_bytes)
+
+
+def prune_image_cache(
+    cache_dir: str | os.PathLike | None = None,
+    max_mb: int | None = None,
+) -> int:
+    """Trim render_pptx's on-disk image cache, least recently used first; returns files removed."""
+    module = load("generate_pptx")
+    return module.prune_image_cache(
+        module.DEFAULT_IMAGE_CACHE_DIR if cache_dir is None else os.fspath(cache_dir),
+        module.DEFAULT_IMAGE_CACHE_MAX_MB if max_mb is None else max_mb,
+    )
+
+
+def render_pptx(
+    data: dict | str | os.PathLike,
+    output: str | os.PathLike | None = None,
+    **options: Any,
+) -> dict[str, Any]:
+    """
+    Build a branded .pptx from ``{"brand", "presentation"}`` data (or its JSON path).
+
+    ``options`` are BrandedDeckBuilder keywords (image_dpi, jpeg_quality,
+    image_cache_dir, image_jobs, brand_template, template_cache_dir,
+    asset_cache). Pass the same ``asset_cache`` on every call to reuse probed
+    and resampled images across decks; use ``new_asset_cache()`` so it stays
+    bounded. Resampled copies also accumulate on disk under
+    ``image_cache_dir``; call ``prune_image_cache()`` now and then to trim
+    it. Returns ``{"output"|"content", "bytes", "slides", "warnings"}`` as
+    render_docx does.
+    """
+    module = load("generate_pptx")
+    data = _check_keys(json_input(data), ("brand", "presentation"))
+    builder = module.BrandedDeckBuilder(data["brand"], **options)
+    builder.build_from_data(data["presentation"])
+    result = _save(builder, output)
+    result["slides"] = len(builder.prs.slides)
+    result["warnings"] = builder.warnings
+    return result
@@ -0,0 +1,68 @@
+"""
+Image technical QA (creative-review/scripts/check_image_specs.py).
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Any, Iterable
+
+from scaleflow._scripts import is_path, load
+
+# Same thresholds as the check_image_specs.py CLI defaults
+DEFAULT_THRESHOLDS: dict[str, Any] = {
+    "min_width": 1080,
+    "min_height": 1080,
+    "max_file_size_mb": 20,
+    "expected_format": None,
+    "min_dpi": 72,
+}
+
+
+def check_images(
+    paths: str | os.PathLike | Iterable[str | os.PathLike],
+    *,
+    recursive: bool = False,
+    include: list[str] | None = None,
+    exclude: list[str] | None = None,
+    deep_verify: bool = False,
+    **thresholds: Any,
+) -> dict[str, Any]:
+    """
+    Run QA on image files and directories.
+
+    ``thresholds`` override DEFAULT_THRESHOLDS. Returns the
+    ``check_image_specs.py --json`` report with an extra ``ignored`` list of
+    explicitly named files that lack an image extension. Raises
+    FileNotFoundError for a path that does not exist.
+    """
+    module = load("check_image_specs")
+    unknown = set(thresholds) - set(DEFAULT_THRESHOLDS)
+    if unknown:
+        raise TypeError(f"Unknown threshold(s): {', '.join(sorted(unknown))}")
+    limits = {**DEFAULT_THRESHOLDS, **thresholds}
+
+    path_list = [str(paths)] if is_path(paths) else [str(p) for p in paths]
+    for p in path_list:
+        if not os.path.exists(p):
+            raise FileNotFoundError(f"Path does not exist: {p}")
+
+    results: list[dict] = []
+    ignored: list[str] = []
+    for img_path in module.iter_image_paths(path_list, recursive=recursive,
+                                            include=include, exclude=exclude):
+        if img_path.suffix.lower() not in module.IMAGE_EXTENSIONS:
+            ignored.append(str(img_path))
+            continue
+        results.append(module.check_image(img_path, deep_verify=deep_verify, **limits))
+
+    report = module.build_json_report(results)
+    report["ignored"] = ignored
+    return report
+
+
+def check_image(path: str | os.PathLike, *, deep_verify: bool = False, **thresholds: Any) -> dict[str, Any]:
+    """Check a single image; returns one result record."""
+    limits = {**DEFAULT_THRESHOLDS, **thresholds}
+    return load("check_image_specs").check_image(Path(path), deep_verify=deep_verify, **limits)
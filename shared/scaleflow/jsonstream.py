@@ -0,0 +1,121 @@
+"""
+Incremental JSON reader shared by the scripts that stream large inputs.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any, Iterator, TextIO
+
+READ_SIZE = 1 << 16  # Characters read per refill
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = re.compile(r"[ \t\r\n]*")
+
+# A parse error this close to the end of the buffer may just be a token cut
+# off mid-way ("fals", "-Infinit", a partial \u escape), so read more first
+_TAIL_SLACK = 8
+
+
+class _Buffer:
+    """Text read from ``fh`` with a parse position; consumed text is dropped on refill."""
+
+    def __init__(self, fh: TextIO, read_size: int) -> None:
+        self.fh = fh
+        self.read_size = read_size
+        self.text = ""
+        self.pos = 0
+        self.offset = 0  # characters dropped before text[0], for error messages
+        self.eof = False
+
+    def grow(self, factor: int = 1) -> bool:
+        """Read until the unparsed text is ``factor`` times longer, or EOF. False at EOF."""
+        parts = [self.text[self.pos:]]
+        have = len(parts[0])
+        target = max(have * factor, have + 1)
+        while have < target:
+            chunk = self.fh.read(self.read_size)
+            if not chunk:
+                self.eof = True
+                break
+            parts.append(chunk)
+            have += len(chunk)
+        self.offset += self.pos
+        self.text = "".join(parts)
+        self.pos = 0
+        return len(parts) > 1
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character ('' at EOF)."""
+        while True:
+            self.pos = _WHITESPACE.match(self.text, self.pos).end()
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self.grow():
+                return ""
+
+    def fail(self, message: str, pos: int | None = None) -> None:
+        """Raise ValueError for ``pos`` in the current text (default: the parse position)."""
+        at = self.offset + (self.pos if pos is None else pos)
+        raise ValueError(f"invalid JSON input at character {at}: {message}")
+
+    def decode(self) -> Any:
+        """Decode the value at the current position, reading more only while it can help.
+
+        An incomplete value is retried after the unparsed text has doubled,
+        so a value of n characters is parsed O(log n) times; an error that
+        more input cannot fix is raised at once.
+        """
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError as exc:
+                truncated = (exc.msg.startswith("Unterminated string")
+                             or exc.pos >= len(self.text) - _TAIL_SLACK)
+                if self.eof or not truncated:
+                    self.fail(exc.msg, exc.pos)
+                self.grow(2)
+                continue
+            # A number at the buffer edge may continue ("12" of "125", "1" of "1e5")
+            if not self.eof and isinstance(value, (int, float)) and len(self.text) - end <= 2:
+                self.grow(2)
+                continue
+            self.pos = end
+            return value
+
+
+def iter_json_values(
+    fh: TextIO,
+    read_size: int = READ_SIZE,
+    array_items: bool = False,
+) -> Iterator[Any]:
+    """
+    Yield each top-level value from NDJSON or concatenated JSON, reading incrementally.
+
+    With ``array_items`` a top-level JSON array is yielded one element at a
+    time instead of as a single list. Memory follows the largest single value
+    plus one read. Malformed input raises ValueError with the character
+    offset of the problem.
+    """
+    buf = _Buffer(fh, read_size)
+    if array_items and buf.peek() == "[":
+        buf.pos += 1
+        if buf.peek() == "]":
+            buf.pos += 1
+        else:
+            while True:
+                yield buf.decode()
+                sep = buf.peek()
+                if sep == "]":
+                    buf.pos += 1
+                    break
+                if sep != ",":
+                    buf.fail("expected ',' or ']' between array items")
+                buf.pos += 1
+                buf.peek()
+        if buf.peek():
+            buf.fail("unexpected data after the top-level array")
+        return
+    while buf.peek():
+        yield buf.decode()
@@ -0,0 +1,67 @@
+"""
+Report aggregation (report-builder/scripts/aggregate_report.py).
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Any, Iterator
+
+from scaleflow._scripts import is_path, json_input, load
+
+Source = Any  # report dict, iterable of records, output file path, or list of paths
+
+
+def _records(source: Source) -> Iterator[dict]:
+    module = load("aggregate_report")
+    if is_path(source):
+        return module.iter_sources([os.fspath(source)])
+    if isinstance(source, dict):
+        return module.expand_records([source])
+    items = list(source)
+    if items and all(is_path(item) for item in items):
+        return module.iter_sources([os.fspath(item) for item in items])
+    return module.expand_records(items)
+
+
+def aggregate_report(
+    *,
+    assets: Source = None,
+    images: Source = None,
+    copy: Source = None,
+    budget: dict | str | os.PathLike | None = None,
+    ledger: dict | str | os.PathLike | None = None,
+    brand: dict | str | os.PathLike | None = None,
+    title: str = "Campaign Report",
+    subtitle: str = "Production QA and credit usage",
+    date: str | None = None,
+    footer: str | None = None,
+) -> dict[str, Any]:
+    """
+    Fold validator, budget and ledger output into a report payload.
+
+    ``assets``, ``images`` and ``copy`` each take what validate_assets,
+    check_images and validate_copy return, their CLI --json/--ndjson output
+    files, or plain iterables of result records. ``budget`` is a
+    calculate_budget report, ``ledger`` a ledger_status result (or their JSON
+    paths). Returns ``{"brand", "document"}`` ready for render_docx, without
+    ``brand`` when none is given.
+    """
+    module = load("aggregate_report")
+    brand = json_input(brand)
+    credits = None
+    if budget is not None or ledger is not None:
+        credits = module.credit_variance(json_input(budget), json_input(ledger))
+    document = module.build_document(
+        module.aggregate_assets(_records(assets)) if assets is not None else None,
+        module.aggregate_images(_records(images)) if images is not None else None,
+        module.aggregate_copy(_records(copy)) if copy is not None else None,
+        credits,
+        title=title,
+        subtitle=subtitle,
+        date=date,
+        client=(brand or {}).get("client_name"),
+        footer=footer,
+    )
+    return {"brand": brand, "document": document} if brand else {"document": document}
+
@@ -0,0 +1,93 @@
+"""
+Directory scanning with include/exclude globs, shared by the asset and image
+checkers.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import os
+import sys
+from pathlib import Path
+from typing import Iterator
+
+
+def _glob_match(path: str, pattern: str) -> bool:
+    """fnmatch, with a leading "**/" also matching at the scan root."""
+    if fnmatch.fnmatch(path, pattern):
+        return True
+    return pattern.startswith("**/") and fnmatch.fnmatch(path, pattern[3:])
+
+
+def path_selected(
+    rel_path: str, name: str, include: list[str] | None, exclude: list[str] | None
+) -> bool:
+    """Apply include/exclude globs to a path relative to the scan root, or its name."""
+    if exclude and any(
+        _glob_match(rel_path, pat) or _glob_match(name, pat) for pat in exclude
+    ):
+        return False
+    if include:
+        return any(_glob_match(rel_path, pat) or _glob_match(name, pat) for pat in include)
+    return True
+
+
+def dir_excluded(rel_path: str, name: str, exclude: list[str] | None) -> bool:
+    """
+    True when an exclude glob covers a whole directory, so it need not be walked.
+
+    A directory is excluded by a glob matching its path or name ("node_modules",
+    ".git") or by one that matches everything below it ("node_modules/**",
+    "build/*", "**/cache/**").
+    """
+    for pat in exclude or ():
+        for suffix in ("/**", "/*"):
+            if pat.endswith(suffix):
+                pat = pat[: -len(suffix)]
+                break
+        if _glob_match(rel_path, pat) or _glob_match(name, pat):
+            return True
+    return False
+
+
+def iter_files(
+    root: Path,
+    extensions: set[str],
+    recursive: bool = False,
+    include: list[str] | None = None,
+    exclude: list[str] | None = None,
+) -> Iterator[Path]:
+    """
+    Lazily yield files under ``root`` whose suffix is in ``extensions``.
+
+    Uses ``os.scandir`` and only holds one directory listing per level in
+    memory. Entries are visited in name order, depth first, so output is
+    deterministic. ``include``/``exclude`` globs are matched against the
+    path relative to ``root`` (forward slashes) and against the bare name;
+    excluded directories are not descended into.
+    """
+
+    def scan(directory: str, rel_dir: str) -> Iterator[Path]:
+        try:
+            with os.scandir(directory) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError as exc:
+            print(f"WARNING: Cannot scan {directory}: {exc}", file=sys.stderr)
+            return
+        for entry in entries:
+            rel_path = f"{rel_dir}{entry.name}"
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive and not dir_excluded(rel_path, entry.name, exclude):
+                        yield from scan(entry.path, f"{rel_path}/")
+                    continue
+                if not entry.is_file():
+                    continue
+            except OSError:
+                continue
+            if os.path.splitext(entry.name)[1].lower() not in extensions:
+                continue
+            if path_selected(rel_path, entry.name, include, exclude):
+                yield Path(entry.path)
+
+    yield from scan(str(root), "")